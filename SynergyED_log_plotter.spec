@@ -19,6 +19,9 @@ a = Analysis(
         'logging',
         # Threading for email operations
         'threading',
+        # Imported lazily after the window is shown
+        'pandas',
+        'matplotlib.backends.backend_qtagg',
     ],
     hookspath=[],
     hooksconfig={},
@@ -28,6 +31,9 @@ a = Analysis(
         'PyQt5.QtCore',
         'PyQt5.QtGui',
         'PyQt5.QtWidgets',
+        # Unused GUI toolkits; leaving them out makes the one-file build smaller and faster to unpack
+        'tkinter',
+        'matplotlib.backends.backend_tkagg',
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
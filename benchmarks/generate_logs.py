@@ -0,0 +1,153 @@
+"""Generate synthetic SynergyED log trees for the benchmarks.
+
+The trees look like the instrument's log directory: one EDAutoLog.dat per
+day in a session folder, with the folder names cycling through the three
+formats LogDataProcessor.parse_folder_name understands, plus a short manual
+*_Jeol_MicroED.dat run every week. The values are random walks around
+realistic operating points, and the output only depends on the arguments, so
+the same tree is produced on every machine.
+
+    python benchmarks/generate_logs.py OUTPUT_DIR --days 30 --interval 10
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+
+COLUMNS = [
+    'time', 'HT [kV]', 'Beam Current [uA]', 'Filament Current [A]',
+    'Penning PeG1', 'Column PiG1', 'Gun PiG2', 'Detector PiG3',
+    'Specimen PiG4', 'RT1 PiG5', 'Bias coarse', 'Bias fine',
+    'Stage X [um]', 'Stage Y [um]', 'Stage Z [um]', 'Stage TX [deg]'
+]
+
+# (operating point, random walk step, lower bound, upper bound) of each value column
+SIGNALS = [
+    (200.0, 0.01, 0.0, 200.5),      # HT [kV]
+    (90.0, 0.05, 0.0, 120.0),       # Beam Current [uA]
+    (2.3, 0.001, 0.0, 3.0),         # Filament Current [A]
+    (5.0, 0.02, 0.0, 500.0),        # Penning PeG1
+    (20.0, 0.05, 0.0, 500.0),       # Column PiG1
+    (15.0, 0.05, 0.0, 500.0),       # Gun PiG2
+    (30.0, 0.1, 0.0, 500.0),        # Detector PiG3
+    (40.0, 0.1, 0.0, 500.0),        # Specimen PiG4
+    (60.0, 0.2, 0.0, 500.0),        # RT1 PiG5
+    (512.0, 0.5, 0.0, 1023.0),      # Bias coarse
+    (128.0, 0.5, 0.0, 255.0),       # Bias fine
+    (0.0, 2.0, -1000.0, 1000.0),    # Stage X [um]
+    (0.0, 2.0, -1000.0, 1000.0),    # Stage Y [um]
+    (100.0, 0.5, -200.0, 400.0),    # Stage Z [um]
+    (0.0, 0.1, -70.0, 70.0),        # Stage TX [deg]
+]
+
+FOLDER_FORMATS = [
+    '%Y-%m-%d_%H-%M-%S_EDAutoLog',      # 2025-07-01_08-23-56_EDAutoLog
+    '%a-%b-%d-%Y_EDAutoLog',            # Mon-Jun-30-2025_EDAutoLog
+    '%a-%b-%d-%H-%M-%S-%Y_EDAutoLog',   # Mon-Jun-23-08-56-11-2025_EDAutoLog
+]
+
+DEFAULT_START = datetime(2025, 1, 1)
+MANIFEST = 'benchmark_tree.json'
+
+
+def make_values(rng, n, state):
+    """Random walk of all value columns for n rows, continuing from state"""
+    steps = np.array([s[1] for s in SIGNALS])
+    low = np.array([s[2] for s in SIGNALS])
+    high = np.array([s[3] for s in SIGNALS])
+    values = state + np.cumsum(rng.normal(0.0, steps, size=(n, len(SIGNALS))), axis=0)
+    # Pull the walk back towards the operating point so it stays plausible over a year
+    values += (np.array([s[0] for s in SIGNALS]) - values) * 0.001
+    return np.clip(values, low, high)
+
+
+def write_log_file(path, start, rows, interval_s, rng, state):
+    """Write one log file and return the value state at its end"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    values = make_values(rng, rows, state)
+    step = timedelta(seconds=interval_s)
+    value_fmt = '\t'.join([' %.3f'] * len(SIGNALS))
+    with open(path, 'w', newline='\n') as f:
+        f.write('[Jeol_MicroED 2]\n')
+        f.write('\t'.join(COLUMNS) + '\t\n')
+        t = start
+        for row in values:
+            f.write(t.strftime('%Y-%m-%d %H:%M:%S.%f') + '\t' + value_fmt % tuple(row) + '\t\n')
+            t += step
+    return values[-1] if rows else state
+
+
+def generate_tree(base_dir, days, interval_s=10, start=DEFAULT_START, seed=0):
+    """Write a log tree covering the given number of days.
+
+    Returns the manifest (also written to base_dir) describing the tree.
+    """
+    rng = np.random.default_rng(seed)
+    state = np.array([s[0] for s in SIGNALS])
+    files = []
+    for day in range(days):
+        # Sessions start a little after midnight, like a software restart would
+        session_start = start + timedelta(days=day, seconds=int(rng.integers(0, 600)))
+        folder = session_start.strftime(FOLDER_FORMATS[day % len(FOLDER_FORMATS)])
+        rows = int((start + timedelta(days=day + 1) - session_start).total_seconds() // interval_s)
+        path = os.path.join(base_dir, folder, 'EDAutoLog.dat')
+        state = write_log_file(path, session_start, rows, interval_s, rng, state)
+        files.append(path)
+
+        if day % 7 == 3:
+            # A short manual run with its own log file
+            run_start = start + timedelta(days=day, hours=14)
+            path = os.path.join(base_dir, 'manual', f"run_{run_start:%Y%m%d}_Jeol_MicroED.dat")
+            write_log_file(path, run_start, int(3600 // interval_s), interval_s, rng, state)
+            files.append(path)
+
+    manifest = {
+        'days': days,
+        'interval_s': interval_s,
+        'start': start.isoformat(),
+        'seed': seed,
+        'files': len(files),
+        'bytes': sum(os.path.getsize(p) for p in files),
+    }
+    with open(os.path.join(base_dir, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def ensure_tree(base_dir, days, interval_s=10, start=DEFAULT_START, seed=0):
+    """Reuse a tree generated earlier with the same settings, or generate it"""
+    try:
+        with open(os.path.join(base_dir, MANIFEST)) as f:
+            manifest = json.load(f)
+        if (manifest['days'], manifest['interval_s'], manifest['start'], manifest['seed']) == (
+                days, interval_s, start.isoformat(), seed):
+            return manifest
+    except (OSError, ValueError, KeyError):
+        pass
+    if os.path.isdir(base_dir) and os.listdir(base_dir):
+        raise ValueError(f"{base_dir} is not empty and was not generated with these settings")
+    return generate_tree(base_dir, days, interval_s, start, seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic SynergyED log tree")
+    parser.add_argument('output_dir', help="Directory to write the tree to (must be empty or missing)")
+    parser.add_argument('--days', type=int, default=1, help="Number of days of logs (default: 1)")
+    parser.add_argument('--interval', type=float, default=10, help="Seconds between samples (default: 10)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args()
+
+    try:
+        manifest = ensure_tree(args.output_dir, args.days, args.interval, seed=args.seed)
+    except ValueError as e:
+        print(f"Error: {str(e)}")
+        return 1
+    print(f"{manifest['files']} files, {manifest['bytes'] / 1e6:.1f} MB in {args.output_dir}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
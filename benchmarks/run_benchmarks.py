@@ -0,0 +1,315 @@
+"""Time the parsing, merging and plotting hot paths on synthetic log trees.
+
+    python benchmarks/run_benchmarks.py                      # day, month and year
+    python benchmarks/run_benchmarks.py --scales day month --repeat 5
+    python benchmarks/run_benchmarks.py --compare old.json new.json
+
+The log trees are generated once (see generate_logs.py) and reused by later
+runs. Results are written as JSON with one entry per scale and benchmark, so
+runs of different versions can be compared with --compare. Each run uses a
+fresh LogDataProcessor, so the in-memory caches start cold; the operating
+system's file cache is warm after the first run, which is why the minimum and
+the median of several runs are reported.
+
+The GUI benchmarks (plot_selected and the live session) render offscreen and
+need PyQt6 and matplotlib; use --no-gui to skip them.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCHMARK_DIR), 'src'))
+
+from generate_logs import DEFAULT_START, ensure_tree  # noqa: E402
+from utils.data_processor import LogDataProcessor  # noqa: E402
+
+# Days of logs per scale
+SCALES = {'day': 1, 'month': 30, 'year': 365}
+PLOT_PARAMS = ['HT [kV]', 'Beam Current [uA]', 'Gun PiG2', 'Stage X [um]']
+LIVE_TICKS = 20
+CATALOG_FILES = ('.synergyed_log_catalog.sqlite', '.synergyed_log_rollups.sqlite')
+
+
+def make_processor(base_dir):
+    processor = LogDataProcessor()
+    processor.base_dir = base_dir
+    return processor
+
+
+def remove_catalog(base_dir):
+    for name in CATALOG_FILES:
+        for suffix in ('', '-wal', '-shm', '-journal'):
+            path = os.path.join(base_dir, name + suffix)
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def time_runs(repeat, run, setup=None):
+    """Call run() repeat times, calling setup() untimed before each run. Returns the run times."""
+    times = []
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        run(*args)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def bench_get_log_files(base_dir, repeat):
+    def cold_setup():
+        remove_catalog(base_dir)
+        return (make_processor(base_dir),)
+
+    cold = time_runs(repeat, lambda p: p.get_log_files(), cold_setup)
+    files = make_processor(base_dir).get_log_files()
+    warm = time_runs(repeat, lambda p: p.get_log_files(), lambda: (make_processor(base_dir),))
+    return [
+        ('get_log_files (no catalog)', cold, {'files': len(files)}),
+        ('get_log_files (catalog)', warm, {'files': len(files)}),
+    ]
+
+
+def bench_read_log_file(files, repeat):
+    path = files[-1]['path']
+    rows = len(make_processor(os.path.dirname(path)).read_log_file(path))
+    times = time_runs(repeat, lambda p: p.read_log_file(path), lambda: (make_processor(os.path.dirname(path)),))
+    return [('read_log_file', times, {'rows': rows, 'bytes': os.path.getsize(path)})]
+
+
+def bench_process_multiple_files(base_dir, files, repeat):
+    paths = [f['path'] for f in files]
+    data = make_processor(base_dir).process_multiple_files(paths)
+    rows = len(next(iter(data.values()))) if data else 0
+    times = time_runs(repeat, lambda p: p.process_multiple_files(paths), lambda: (make_processor(base_dir),))
+    return [('process_multiple_files', times, {'files': len(paths), 'rows': rows})]
+
+
+def bench_time_window(base_dir, files, repeat):
+    """One hour in the middle of the tree, selecting the files the way plot_time_range does"""
+    middle = files[len(files) // 2]['date']
+    start, end = middle + timedelta(hours=12), middle + timedelta(hours=13)
+
+    def run(processor):
+        paths = []
+        all_bounds = processor.get_time_bounds_many(f['path'] for f in files)
+        for f in files:
+            bounds = all_bounds[f['path']]
+            if bounds is not None and bounds[0] <= end and bounds[1] >= start:
+                paths.append(f['path'])
+        return processor.process_multiple_files(paths, start, end)
+
+    data = run(make_processor(base_dir))
+    rows = len(next(iter(data.values()))) if data else 0
+    times = time_runs(repeat, run, lambda: (make_processor(base_dir),))
+    return [('process_multiple_files (1 h)', times, {'rows': rows})]
+
+
+class GuiBench:
+    """Drives an offscreen MainWindow"""
+
+    def __init__(self):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from PyQt6.QtWidgets import QApplication
+        self.app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    def make_window(self, base_dir):
+        from gui.main_window import MainWindow
+        window = MainWindow()
+        window.resize(1400, 800)
+        window.show()
+        while not hasattr(window, 'canvas'):
+            self.app.processEvents()
+        window.data_processor.base_dir = base_dir
+        for param in PLOT_PARAMS:
+            window.param_widgets[param]['param_checkbox'].setChecked(True)
+        return window
+
+    def wait_idle(self, window):
+        while any(window.data_loader.is_busy(c) for c in ('plot', 'live', 'files', 'ingest')):
+            self.app.processEvents()
+            time.sleep(0.001)
+        self.app.processEvents()
+
+    def bench_plot_selected(self, base_dir, files, repeat):
+        window = self.make_window(base_dir)
+        paths = [f['path'] for f in files]
+
+        def setup():
+            window.data_processor.frame_cache.invalidate()
+            return ()
+
+        def run():
+            window.plot_selected(paths)
+            self.wait_idle(window)
+
+        times = time_runs(repeat, run, setup)
+        window.close()
+        return [('plot_selected', times, {'files': len(paths)})]
+
+    def bench_live(self, base_dir, files, interval_s, repeat):
+        """Live plot of the whole tree while rows are appended to the newest file"""
+        window = self.make_window(base_dir)
+        last = files[-1]['path']
+        original_size = os.path.getsize(last)
+        with open(last, 'rb') as f:
+            f.seek(-200, os.SEEK_END)
+            next_time = datetime.strptime(f.read().splitlines()[-1].split(b'\t')[0].decode(), '%Y-%m-%d %H:%M:%S.%f')
+        row_values = '\t'.join([' 100.000'] * 15)
+
+        updates = []
+        original_update = window.update_plot_data
+
+        def counted_update(segments):
+            original_update(segments)
+            updates.append(time.perf_counter())
+
+        window.update_plot_data = counted_update
+        try:
+            start_date = files[0]['date']
+            # The generated logs lie in the past; keep all of them in the live window
+            retention = datetime.now() - start_date + timedelta(days=1)
+            window.get_live_retention = lambda: retention
+            window.quick_start_date.setDate(start_date.date())
+            window.quick_start_time.setTime(start_date.time())
+            start = time.perf_counter()
+            window.live_plot_btn.setChecked(True)
+            window.toggle_live_plot()
+            self.wait_idle(window)
+            initial = time.perf_counter() - start
+
+            ticks = []
+            for _ in range(LIVE_TICKS * repeat):
+                count = len(updates)
+                with open(last, 'a') as f:
+                    next_time += timedelta(seconds=interval_s)
+                    f.write(f"{next_time:%Y-%m-%d %H:%M:%S.%f}\t{row_values}\t\n")
+                start = time.perf_counter()
+                window.poll_ingest()
+                self.wait_idle(window)
+                while len(updates) == count and time.perf_counter() - start < 5:
+                    self.app.processEvents()
+                self.app.processEvents()  # Includes a redraw the update scheduled
+                ticks.append(time.perf_counter() - start)
+        finally:
+            window.live_plot_btn.setChecked(False)
+            window.toggle_live_plot()
+            window.close()
+            with open(last, 'r+b') as f:
+                f.truncate(original_size)
+
+        return [
+            ('live initial load', [initial], {'files': len(files)}),
+            ('live tick', ticks, {'p95_s': sorted(ticks)[int(len(ticks) * 0.95) - 1]}),
+        ]
+
+
+def summarize(scale, name, times, extra):
+    entry = {
+        'scale': scale,
+        'benchmark': name,
+        'runs_s': [round(t, 6) for t in times],
+        'min_s': round(min(times), 6),
+        'median_s': round(statistics.median(times), 6),
+    }
+    entry.update(extra)
+    print(f"  {name:<30} min {entry['min_s']:8.3f} s   median {entry['median_s']:8.3f} s")
+    return entry
+
+
+def environment():
+    def git_commit():
+        try:
+            return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARK_DIR,
+                                  capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    versions = {}
+    for module in ('numpy', 'pandas', 'matplotlib', 'PyQt6.QtCore'):
+        try:
+            mod = __import__(module, fromlist=['_'])
+            versions[module] = getattr(mod, '__version__', None) or getattr(mod, 'PYQT_VERSION_STR', None)
+        except ImportError:
+            versions[module] = None
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'packages': versions,
+    }
+
+
+def compare(old_path, new_path):
+    """Print the median times of two result files side by side"""
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+    old_medians = {(r['scale'], r['benchmark']): r['median_s'] for r in old['results']}
+    print(f"{'scale':<6} {'benchmark':<30} {'old s':>9} {'new s':>9} {'new/old':>8}")
+    for r in new['results']:
+        before = old_medians.get((r['scale'], r['benchmark']))
+        ratio = f"{r['median_s'] / before:8.2f}" if before else f"{'-':>8}"
+        before = f"{before:9.3f}" if before is not None else f"{'-':>9}"
+        print(f"{r['scale']:<6} {r['benchmark']:<30} {before} {r['median_s']:9.3f} {ratio}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SynergyED log plotter's hot paths")
+    parser.add_argument('--scales', nargs='+', choices=list(SCALES), default=list(SCALES))
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per benchmark (default: 3)")
+    parser.add_argument('--interval', type=float, default=10,
+                        help="Seconds between samples in the generated logs (default: 10)")
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'synergyed_benchmark_data'),
+                        help="Where the generated log trees are kept between runs")
+    parser.add_argument('--output', default='benchmark_results.json', help="JSON file for the results")
+    parser.add_argument('--no-gui', action='store_true', help="Skip the plot_selected and live benchmarks")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help="Compare two result files and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    gui = None if args.no_gui else GuiBench()
+    results = []
+    for scale in args.scales:
+        base_dir = os.path.join(args.data_dir, f"{scale}_{args.interval:g}s")
+        print(f"{scale}: preparing logs in {base_dir}")
+        manifest = ensure_tree(base_dir, SCALES[scale], args.interval, DEFAULT_START)
+        print(f"{scale}: {manifest['files']} files, {manifest['bytes'] / 1e6:.1f} MB")
+
+        files = make_processor(base_dir).get_log_files()
+        measured = []
+        measured += bench_get_log_files(base_dir, args.repeat)
+        measured += bench_read_log_file(files, args.repeat)
+        measured += bench_process_multiple_files(base_dir, files, args.repeat)
+        measured += bench_time_window(base_dir, files, args.repeat)
+        if gui:
+            measured += gui.bench_plot_selected(base_dir, files, args.repeat)
+            # Leave the manual runs out, so the newest file is the one being written
+            session_files = [f for f in files if os.path.basename(f['path']) == 'EDAutoLog.dat']
+            measured += gui.bench_live(base_dir, session_files, args.interval, args.repeat)
+        for name, times, extra in measured:
+            results.append(summarize(scale, name, times, dict(extra, tree_bytes=manifest['bytes'])))
+
+    output = {'environment': environment(), 'settings': {'repeat': args.repeat, 'interval_s': args.interval},
+              'results': results}
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent=2)
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Pre-build binary sidecar files for all log files below a directory.
+
+Meant to be run unattended (e.g. overnight as a scheduled task) so that the
+plotter can load history without parsing the text files:
+
+    python src/build_sidecars.py C:\\Xcalibur\\log\\SynergyED_DiagnosticData
+"""
+import argparse
+import os
+import sys
+import time
+from utils.data_processor import LogDataProcessor
+from utils.file_catalog import FileCatalog
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build .npz sidecars for SynergyED log files")
+    parser.add_argument('base_dir', nargs='?', default=None,
+                        help="Log directory to scan (default: the plotter's default directory)")
+    parser.add_argument('--force', action='store_true',
+                        help="Rebuild sidecars even if they are up to date")
+    parser.add_argument('--rollups', action='store_true',
+                        help="Also update the aggregated history used for long time ranges")
+    args = parser.parse_args()
+
+    processor = LogDataProcessor()
+    base_dir = args.base_dir or processor.base_dir
+    if not os.path.isdir(base_dir):
+        print(f"Error: {base_dir} is not a directory")
+        return 1
+
+    built = skipped = 0
+    start = time.perf_counter()
+    for root, _, files in os.walk(base_dir):
+        for filename in sorted(files):
+            if not FileCatalog.is_log_file(filename):
+                continue
+            file_path = os.path.join(root, filename)
+            if processor.build_sidecar(file_path, force=args.force):
+                built += 1
+                print(f"Built sidecar for {file_path}")
+            else:
+                skipped += 1
+
+    if args.rollups:
+        processor.base_dir = base_dir
+        paths = [f['path'] for f in processor.get_log_files()]
+        processor.update_rollups(paths)
+        processor.get_rollup_store().remove_missing(paths)
+        print(f"Updated aggregated history for {len(paths)} files")
+
+    elapsed = time.perf_counter() - start
+    print(f"Done: {built} sidecars built, {skipped} files skipped in {elapsed:.1f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+import threading
+import traceback
+from collections import OrderedDict
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+
+class LoadCancelled(Exception):
+    """Raised inside a load job when its request has been cancelled"""
+
+
+class LoadRequest:
+    """A unit of work submitted to the DataLoader"""
+
+    def __init__(self, request_id, channel, job, on_done, on_error):
+        self.request_id = request_id
+        self.channel = channel
+        self.job = job
+        self.on_done = on_done
+        self.on_error = on_error
+        self.cancelled = threading.Event()
+
+
+class _LoaderThread(QThread):
+    """Worker thread that runs the DataLoader's request loop"""
+
+    def __init__(self, loader):
+        super().__init__()
+        self.loader = loader
+
+    def run(self):
+        self.loader._run()
+
+
+class DataLoader(QObject):
+    """Runs data loading jobs on a background thread so the GUI never blocks.
+
+    Requests are grouped in channels (e.g. 'plot', 'live', 'ingest'). Each channel
+    holds at most one pending request, so a burst of live ticks collapses into
+    a single load. Submitting with replace_running=True also cancels the
+    request of that channel that is currently running, which is what a user
+    picking a new range wants.
+
+    Jobs are callables taking a progress function. The job calls
+    progress(done, total) as it goes; the call raises LoadCancelled once the
+    request has been cancelled. Results and errors are delivered to the
+    request's callbacks on the GUI thread.
+    """
+
+    progress = pyqtSignal(str, int, int)  # channel, done, total
+    _finished = pyqtSignal(object, object, object)  # request, result, error message
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._condition = threading.Condition()
+        self._pending = OrderedDict()  # channel -> LoadRequest
+        self._running = None
+        self._next_id = 0
+        self._stopping = False
+
+        self._finished.connect(self._dispatch)
+        self._thread = _LoaderThread(self)
+        self._thread.start()
+
+    def submit(self, channel, job, on_done, on_error=None, replace_running=True):
+        """Queue a job, replacing any request of the same channel that is still pending"""
+        with self._condition:
+            self._next_id += 1
+            request = LoadRequest(self._next_id, channel, job, on_done, on_error)
+            stale = self._pending.pop(channel, None)
+            if stale is not None:
+                stale.cancelled.set()
+            self._pending[channel] = request
+            if replace_running and self._running is not None and self._running.channel == channel:
+                self._running.cancelled.set()
+            self._condition.notify()
+        return request.request_id
+
+    def cancel(self, channel):
+        """Cancel the pending and running requests of a channel"""
+        with self._condition:
+            stale = self._pending.pop(channel, None)
+            if stale is not None:
+                stale.cancelled.set()
+            if self._running is not None and self._running.channel == channel:
+                self._running.cancelled.set()
+
+    def is_busy(self, channel):
+        """Check whether a channel has a request pending or running"""
+        with self._condition:
+            running = self._running is not None and self._running.channel == channel
+            return running or channel in self._pending
+
+    def shutdown(self):
+        """Cancel everything and stop the worker thread"""
+        with self._condition:
+            self._stopping = True
+            for request in self._pending.values():
+                request.cancelled.set()
+            self._pending.clear()
+            if self._running is not None:
+                self._running.cancelled.set()
+            self._condition.notify()
+        self._thread.wait()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                _, request = self._pending.popitem(last=False)
+                self._running = request
+
+            result = error = None
+            try:
+                result = request.job(self._make_progress(request))
+            except LoadCancelled:
+                request.cancelled.set()
+            except Exception as e:
+                traceback.print_exc()
+                error = str(e)
+
+            with self._condition:
+                self._running = None
+            if not request.cancelled.is_set():
+                self._finished.emit(request, result, error)
+
+    def _make_progress(self, request):
+        def report(done, total):
+            if request.cancelled.is_set():
+                raise LoadCancelled()
+            self.progress.emit(request.channel, done, total)
+        return report
+
+    def _dispatch(self, request, result, error):
+        # Runs on the GUI thread; drop results of requests cancelled in the meantime
+        if request.cancelled.is_set():
+            return
+        if error is not None:
+            if request.on_error:
+                request.on_error(error)
+            else:
+                print(f"Error loading data ({request.channel}): {error}")
+        else:
+            request.on_done(result)
@@ -22,6 +22,20 @@ class EmailTestThread(QThread):
         self.result_ready.emit(success, message)
 
 
+class EmailAlertThread(QThread):
+    """Thread for sending a test alert without blocking UI"""
+    result_ready = pyqtSignal(bool)
+    
+    def __init__(self, notifier, subject, message):
+        super().__init__()
+        self.notifier = notifier
+        self.subject = subject
+        self.message = message
+        
+    def run(self):
+        self.result_ready.emit(self.notifier.send_alert(self.subject, self.message))
+
+
 class EmailConfigDialog(QDialog):
     """Dialog for configuring email notifications"""
     
@@ -58,6 +72,11 @@ class EmailConfigDialog(QDialog):
         smtp_layout.addRow("SMTP Server:", self.smtp_server_edit)
         smtp_layout.addRow("Port:", self.smtp_port_spin)
         
+        # Only plain local (test) servers should be used without encryption
+        self.use_tls_checkbox = QCheckBox("Use STARTTLS")
+        self.use_tls_checkbox.setChecked(True)
+        smtp_layout.addRow("", self.use_tls_checkbox)
+        
         # Sender credentials
         self.sender_email_edit = QLineEdit()
         self.sender_password_edit = QLineEdit()
@@ -201,7 +220,8 @@ class EmailConfigDialog(QDialog):
             self.smtp_server_edit.text(),
             self.smtp_port_spin.value(),
             self.sender_email_edit.text(),
-            self.sender_password_edit.text()
+            self.sender_password_edit.text(),
+            self.use_tls_checkbox.isChecked()
         )
         
         # Update UI to show testing
@@ -276,11 +296,19 @@ class EmailConfigDialog(QDialog):
             
         self.email_notifier.set_recipient(self.recipient_email_edit.text())
         
-        success = self.email_notifier.send_alert(
+        # Send in a separate thread so a slow server does not freeze the dialog
+        self.test_alert_btn.setEnabled(False)
+        self.alert_thread = EmailAlertThread(
+            self.email_notifier,
             "Test Alert",
             "This is a test alert from SynergyED Log Plotter to verify email notifications are working correctly."
         )
+        self.alert_thread.result_ready.connect(self.on_test_alert_result)
+        self.alert_thread.start()
         
+    def on_test_alert_result(self, success):
+        """Handle test alert result"""
+        self.test_alert_btn.setEnabled(True)
         if success:
             QMessageBox.information(self, "Success", "Test alert sent successfully!")
         else:
@@ -301,7 +329,8 @@ class EmailConfigDialog(QDialog):
             self.smtp_server_edit.text(),
             self.smtp_port_spin.value(),
             self.sender_email_edit.text(),
-            self.sender_password_edit.text()
+            self.sender_password_edit.text(),
+            self.use_tls_checkbox.isChecked()
         )
         
         self.email_notifier.set_recipient(self.recipient_email_edit.text())
@@ -323,6 +352,7 @@ class EmailConfigDialog(QDialog):
             self.smtp_port_spin.setValue(notifier.smtp_port)
             self.sender_email_edit.setText(notifier.sender_email)
             self.sender_password_edit.setText(notifier.sender_password)
+            self.use_tls_checkbox.setChecked(notifier.use_tls)
             self.recipient_email_edit.setText(notifier.recipient_email)
             
             # Try to match provider
@@ -0,0 +1,131 @@
+import os
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+
+class LogChangeWatcher(QObject):
+    """Signals when new log data appears, so live mode does not have to poll.
+
+    The base directory (new folders), the folder of the active log file (new
+    files) and the active log file itself (new bytes) are watched with
+    QFileSystemWatcher. Bursts of notifications are throttled into at most one
+    'changed' signal per THROTTLE_MS, and a signal is only sent if the folder
+    contents or the size or modification time of the active file changed.
+
+    A slow stat poll runs as well, since file system notifications are not
+    delivered for every kind of drive (e.g. network shares). If a path cannot
+    be watched at all, the poll runs at FALLBACK_POLL_MS instead.
+    """
+
+    changed = pyqtSignal()
+
+    THROTTLE_MS = 1000
+    SAFETY_POLL_MS = 30000
+    FALLBACK_POLL_MS = 2000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.base_dir = None
+        self.active_file = None
+        self._snapshot = None
+        self._unwatchable = []
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_notification)
+        self._watcher.fileChanged.connect(self._on_notification)
+
+        self._throttle_timer = QTimer(self)
+        self._throttle_timer.setSingleShot(True)
+        self._throttle_timer.setInterval(self.THROTTLE_MS)
+        self._throttle_timer.timeout.connect(self._check)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.timeout.connect(self._check)
+
+    def start(self, base_dir, active_file=None):
+        """Start (or move) watching a log directory and its currently written file"""
+        self.base_dir = base_dir
+        self.active_file = active_file
+        self._update_paths()
+        self._snapshot = self._take_snapshot()
+
+    def set_active_file(self, active_file):
+        """Switch the watched log file, e.g. after a new log folder was started"""
+        if self.base_dir is None:
+            return  # Not watching; a poll that was pending when the watcher stopped
+        if active_file != self.active_file or self._needs_rewatch():
+            self.active_file = active_file
+            self._update_paths()
+
+    def stop(self):
+        self._throttle_timer.stop()
+        self._poll_timer.stop()
+        paths = self._watcher.files() + self._watcher.directories()
+        if paths:
+            self._watcher.removePaths(paths)
+        self.base_dir = self.active_file = self._snapshot = None
+        self._unwatchable = []
+
+    def _watched_paths(self):
+        paths = [self.base_dir]
+        if self.active_file:
+            folder = os.path.dirname(self.active_file)
+            if os.path.normpath(folder) != os.path.normpath(self.base_dir):
+                paths.append(folder)
+            paths.append(self.active_file)
+        return [path for path in paths if os.path.exists(path)]
+
+    def _needs_rewatch(self):
+        # Watched files drop out of the watcher when they are replaced or deleted
+        watched = set(self._watcher.files() + self._watcher.directories())
+        return any(path not in watched for path in self._watched_paths())
+
+    def _update_paths(self):
+        current = self._watcher.files() + self._watcher.directories()
+        if current:
+            self._watcher.removePaths(current)
+
+        paths = self._watched_paths()
+        failed = self._watcher.addPaths(paths) if paths else [self.base_dir]
+        if failed:
+            if failed != self._unwatchable:
+                print(f"Warning: cannot watch {', '.join(failed)} for changes, polling instead")
+            self._poll_timer.start(self.FALLBACK_POLL_MS)
+        else:
+            self._poll_timer.start(self.SAFETY_POLL_MS)
+        self._unwatchable = failed
+
+    def _on_notification(self, _path):
+        # Throttle rather than debounce, so continuous writing still gives regular updates
+        if not self._throttle_timer.isActive():
+            self._throttle_timer.start()
+
+    def _take_snapshot(self):
+        # Directory listings rather than directory times, since the plotter's own
+        # cache files (catalog, sidecars) are written into the watched folders
+        folders = [self.base_dir]
+        if self.active_file:
+            folders.append(os.path.dirname(self.active_file))
+        snapshot = [self._list_entries(folder) for folder in folders]
+        if self.active_file:
+            try:
+                stat = os.stat(self.active_file)
+                snapshot.append((stat.st_mtime, stat.st_size))
+            except OSError:
+                snapshot.append(None)
+        return snapshot
+
+    @staticmethod
+    def _list_entries(folder):
+        try:
+            return frozenset(name for name in os.listdir(folder)
+                             if not name.startswith('.') and not name.endswith(('.npz', '.tmp')))
+        except OSError:
+            return None
+
+    def _check(self):
+        if self.base_dir is None:
+            return
+        snapshot = self._take_snapshot()
+        if snapshot != self._snapshot:
+            self._snapshot = snapshot
+            self.changed.emit()
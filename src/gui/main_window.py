@@ -3,25 +3,71 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout,
                              QListWidget, QSplitter, QDateEdit, QTimeEdit,
                              QComboBox, QCheckBox, QGroupBox, QLineEdit,
                              QFileDialog, QMessageBox, QFrame, QScrollArea,
-                             QSizePolicy)
+                             QSizePolicy, QTableWidget, QTableWidgetItem, QHeaderView,
+                             QSpinBox)
 from .collapsible_box import QCollapsibleBox
-from .email_config_dialog import EmailConfigDialog
+from .data_loader import DataLoader
+from .log_watcher import LogChangeWatcher
 import os
-from datetime import datetime
-from PyQt6.QtCore import Qt, QDate, QTime, QTimer
-import matplotlib
-matplotlib.use('QtAgg')  # Use Qt backend for matplotlib
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.ticker import MaxNLocator
-from matplotlib.lines import Line2D
+import threading
+import time
+import numpy as np
+from datetime import datetime, timedelta
+from PyQt6.QtCore import Qt, QDate, QTime, QTimer, pyqtSignal
+from utils.compact_data import CompactLogData
 from utils.data_processor import LogDataProcessor
+from utils.downsample import minmax_decimate_indices
+from utils.ingest_service import LogIngestService
+from utils.live_buffer import LiveRingBuffer
+from utils.trigger_engine import TriggerEvaluator
 from utils.email_notifier import EmailNotifier, TriggerCondition
+from utils.email_outbox import EmailOutbox
+from utils.alert_store import AlertStore
+from utils.perf import perf
+
+# matplotlib takes longer to import than the rest of the window needs to appear,
+# so it is loaded by load_matplotlib() once the window is shown
+matplotlib = Figure = FigureCanvas = NavigationToolbar = mdates = MaxNLocator = Line2D = None
+
+
+def load_matplotlib():
+    """Import the matplotlib modules used for plotting"""
+    global matplotlib, Figure, FigureCanvas, NavigationToolbar, mdates, MaxNLocator, Line2D
+    if matplotlib is not None:
+        return
+    import matplotlib as mpl
+    mpl.use('QtAgg')  # Use Qt backend for matplotlib
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+    from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
+    import matplotlib.dates as mdates
+    from matplotlib.ticker import MaxNLocator
+    from matplotlib.lines import Line2D
+    matplotlib = mpl
+
+    class FigureCanvas(FigureCanvasQTAgg):
+        """Qt canvas whose full redraws are timed by the performance recorder"""
+
+        def draw(self):
+            with perf.span('canvas.draw'):
+                super().draw()
 
 class MainWindow(QMainWindow):
+    # Time ranges at least this long are plotted from the pre-aggregated history
+    ROLLUP_MIN_SPAN = timedelta(days=3)
+    
+    # Most samples the live plot keeps, whatever the retention window (about 5.8 days at 1 s)
+    LIVE_BUFFER_ROWS = 500_000
+    
+    # Delivery results of queued alert emails, sent from the outbox thread
+    email_result = pyqtSignal(bool, str)
+    
+    # Emitted once the modules deferred until after the window was shown are loaded
+    startup_finished = pyqtSignal()
+    
+    # Rotating log of performance timings, written when enabled in the Performance box
+    PERF_LOG_PATH = os.path.join(os.path.expanduser('~'), '.synergyed_log_plotter', 'performance.log')
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("SynergyED Log Plotter")
@@ -35,12 +81,33 @@ class MainWindow(QMainWindow):
         # Initialize the data processor and storage
         self.data_processor = LogDataProcessor()
         self.available_files = []
-        self.current_data = None
         self.param_widgets = {}
         
+        # Background loader so parsing never blocks the GUI thread
+        self.data_loader = DataLoader(self)
+        self.data_loader.progress.connect(self.on_load_progress)
+        
+        # New log rows are read once and shared by live plotting and trigger checks
+        self.ingest_service = LogIngestService(self.data_processor)
+        self.ingest_service.subscribe(self.on_live_data)
+        self.ingest_service.subscribe(self.on_trigger_data)
+        
         # Initialize email notification system
         self.email_notifier = EmailNotifier()
-        self.trigger_conditions = []
+        
+        # Triggers, their state and undelivered alerts are kept on disk across restarts
+        self.alert_store = AlertStore()
+        self.trigger_conditions = self.alert_store.load_triggers()
+        
+        # Alert emails are sent from a background queue so a slow server never blocks the GUI
+        self.email_outbox = EmailOutbox(self.email_notifier, on_result=self.email_result.emit,
+                                        store=self.alert_store)
+        self.email_result.connect(self.on_email_result)
+        self.trigger_evaluator = TriggerEvaluator()
+        # Set if monitoring was still running when the application last stopped
+        self.resume_sample_time = self.alert_store.load_last_sample_time()
+        # Sample time from which the next ingest poll first reads all files, after resuming
+        self.catch_up_since = None
         
         # Initialize trigger monitoring (separate from live plotting)
         self.trigger_monitoring_enabled = False
@@ -52,18 +119,43 @@ class MainWindow(QMainWindow):
         self.live_plot_start_date = None
         self.live_plot_start_time = None
         
-        # Timer for live plotting
-        self.live_plot_timer = QTimer(self)
-        self.live_plot_timer.timeout.connect(self.update_live_plot)
+        # Live plotting and trigger monitoring are driven by changes to the log files
+        self.log_watcher = LogChangeWatcher(self)
+        self.log_watcher.changed.connect(self.poll_ingest)
         self.live_plot_enabled = False
+        self.live_plot_files = []  # Files of the live window, oldest first
+        self.live_plot_columns = None  # Parameters the live data was loaded with, None for all
+        # The live plot's samples from the retention window, in a memory-mapped ring buffer
+        self.live_buffer = None
+        self.live_buffer_generation = 0
         
         # Initialize view limit storage
         self.stored_xlim = None
         self.stored_ylims = {}
         
+        # Full-resolution data behind each plotted artist, re-decimated when the view changes
+        self.decimated_series = []
+        self.plot_view = (None, None)
+        self.redecimate_timer = QTimer(self)
+        self.redecimate_timer.setSingleShot(True)
+        self.redecimate_timer.setInterval(150)
+        self.redecimate_timer.timeout.connect(self.update_decimation)
+        
+        # Live updates reuse the plotted artists as long as the plot layout stays the same
+        self.plot_signature = None
+        self.autoscaled_axes = {}  # axis -> parameter whose data range sets its y-limits
+        self.followed_xlim = None
+        self.blit_ready = False  # Whether the canvas buffer holds the current plot
+        
+        # Steps of the startup done after the window is shown, as (phase, time.perf_counter())
+        self.startup_phases = []
+        self.startup_done = False
+        
         # Create panels
         self.create_left_panel()
         self.create_right_panel()
+        if self.trigger_conditions:
+            self.update_email_status()
         
         # Split the panels
         splitter = QSplitter(Qt.Orientation.Horizontal)
@@ -88,6 +180,13 @@ class MainWindow(QMainWindow):
         change_dir_btn.clicked.connect(self.change_directory)
         dir_layout.addWidget(change_dir_btn)
         
+        # Optional binary sidecars that make repeated loads much faster
+        self.use_sidecars_checkbox = QCheckBox("Cache parsed files (.npz sidecars)")
+        self.use_sidecars_checkbox.setToolTip("Store a binary copy next to each parsed log file for faster loading")
+        self.use_sidecars_checkbox.setChecked(self.data_processor.use_sidecars)
+        self.use_sidecars_checkbox.toggled.connect(self.toggle_sidecars)
+        dir_layout.addWidget(self.use_sidecars_checkbox)
+        
         dir_group.setContentLayout(dir_layout)
         layout.addWidget(dir_group)
         
@@ -209,6 +308,12 @@ class MainWindow(QMainWindow):
         self.quick_start_date = quick_start_date
         self.quick_start_time = quick_start_time
         
+        # Changing the range makes a range load that is still running pointless
+        for date_widget in (quick_start_date, quick_end_date):
+            date_widget.dateChanged.connect(lambda _: self.data_loader.cancel('plot'))
+        for time_widget in (quick_start_time, quick_end_time):
+            time_widget.timeChanged.connect(lambda _: self.data_loader.cancel('plot'))
+        
         # Set the content layout for the group
         quick_plot_group.setContentLayout(quick_plot_layout)
         
@@ -426,6 +531,54 @@ class MainWindow(QMainWindow):
         notifications_group.setContentLayout(notifications_layout)
         layout.addWidget(notifications_group)
         
+        # Timings of the slow operations, to find out where the time goes
+        perf_group = QCollapsibleBox("Performance")
+        perf_layout = QVBoxLayout()
+        
+        self.perf_enabled_checkbox = QCheckBox("Record timings")
+        self.perf_enabled_checkbox.toggled.connect(self.toggle_perf_recording)
+        perf_layout.addWidget(self.perf_enabled_checkbox)
+        
+        self.perf_log_checkbox = QCheckBox("Write timings to performance.log")
+        self.perf_log_checkbox.setToolTip(self.PERF_LOG_PATH)
+        self.perf_log_checkbox.toggled.connect(self.toggle_perf_log)
+        perf_layout.addWidget(self.perf_log_checkbox)
+        
+        self.perf_table = QTableWidget(0, 5)
+        self.perf_table.setHorizontalHeaderLabels(["Operation", "Calls", "Mean ms", "Max ms", "Last ms"])
+        self.perf_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.perf_table.verticalHeader().setVisible(False)
+        self.perf_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.perf_table.setMaximumHeight(180)
+        perf_layout.addWidget(self.perf_table)
+        
+        self.perf_counters_label = QLabel()
+        self.perf_counters_label.setWordWrap(True)
+        perf_layout.addWidget(self.perf_counters_label)
+        
+        perf_reset_btn = QPushButton("Reset")
+        perf_reset_btn.clicked.connect(self.reset_perf_stats)
+        perf_layout.addWidget(perf_reset_btn)
+        
+        perf_group.setContentLayout(perf_layout)
+        perf_group.toggleButton.setChecked(False)  # Collapsed until needed
+        layout.addWidget(perf_group)
+        
+        self.perf_timer = QTimer(self)
+        self.perf_timer.setInterval(1000)
+        self.perf_timer.timeout.connect(self.update_perf_display)
+        
+        # How much live data is kept; older data of a live session stays in the history
+        retention_layout = QHBoxLayout()
+        retention_layout.addWidget(QLabel("Keep live data for:"))
+        self.live_retention_hours = QSpinBox()
+        self.live_retention_hours.setRange(1, 24 * 31)
+        self.live_retention_hours.setValue(24)
+        self.live_retention_hours.setSuffix(" h")
+        self.live_retention_hours.valueChanged.connect(self.on_live_retention_changed)
+        retention_layout.addWidget(self.live_retention_hours)
+        layout.addLayout(retention_layout)
+        
         # Add Live Plot toggle button
         self.live_plot_btn = QPushButton("Enable Live Plot")
         self.live_plot_btn.setCheckable(True)
@@ -438,24 +591,64 @@ class MainWindow(QMainWindow):
         
     def create_right_panel(self):
         self.right_panel = QWidget()
-        layout = QVBoxLayout(self.right_panel)
+        self.right_layout = QVBoxLayout(self.right_panel)
         
-        # Create matplotlib figure
+        # The plot canvas is created by finish_startup once the window is shown
+        self.canvas_placeholder = QLabel("Loading plot...")
+        self.canvas_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.canvas_placeholder.setStyleSheet("color: gray;")
+        self.right_layout.addWidget(self.canvas_placeholder, 1)
+        
+        # Placeholder for future additions to the right panel
+        self.right_layout.addStretch()
+        
+    def create_plot_canvas(self):
+        """Create the matplotlib figure, canvas and toolbar in the right panel"""
+        load_matplotlib()
         self.figure = Figure(figsize=(10, 6))
         self.canvas = FigureCanvas(self.figure)
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
         self.toolbar = NavigationToolbar(self.canvas, self)
         
-        layout.addWidget(self.toolbar)
-        layout.addWidget(self.canvas)
+        self.canvas_placeholder.setParent(None)
+        self.right_layout.insertWidget(0, self.toolbar)
+        self.right_layout.insertWidget(1, self.canvas)
         
-        # Placeholder for future additions to the right panel
-        layout.addStretch()
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.startup_done:
+            self.startup_done = True
+            # Let the window paint first, then load the plotting modules
+            QTimer.singleShot(0, self.finish_startup)
+            
+    def finish_startup(self):
+        """Load what the window does not need to appear: matplotlib now, pandas in the background"""
+        self.repaint()  # Make sure the window is drawn before the GUI thread is busy importing
+        self.startup_phases.append(("first paint", time.perf_counter()))
+        self.create_plot_canvas()
+        self.startup_phases.append(("plot canvas (matplotlib)", time.perf_counter()))
+        threading.Thread(target=self.preload_modules, name='PreloadModules', daemon=True).start()
+        
+    def preload_modules(self):
+        """Import pandas ahead of the first file load"""
+        import pandas  # noqa: F401
+        self.startup_phases.append(("pandas (background)", time.perf_counter()))
+        self.startup_finished.emit()
         
     def refresh_file_list(self):
         start_date = self.start_date.date().toPyDate()
         end_date = self.end_date.date().toPyDate()
         
-        self.available_files = self.data_processor.get_log_files(start_date, end_date)
+        self.data_loader.submit(
+            'files',
+            lambda progress: self.data_processor.get_log_files(start_date, end_date),
+            self.on_file_list_loaded,
+            self.on_load_error
+        )
+        
+    def on_file_list_loaded(self, available_files):
+        """Show the files found by refresh_file_list"""
+        self.available_files = available_files
         
         self.file_list.clear()
         for file_info in self.available_files:
@@ -481,8 +674,6 @@ class MainWindow(QMainWindow):
         Args:
             files_to_plot: Optional list of file paths to plot. If None, uses selected files from GUI.
         """
-        # Reset current data to ensure fresh plotting
-        self.current_data = None
         if files_to_plot is None:
             selected_indices = self.file_list.selectedIndexes()
             if not selected_indices:
@@ -492,31 +683,142 @@ class MainWindow(QMainWindow):
         if not files_to_plot:
             return
             
-        # Process the data
-        # self.current_data = self.data_processor.process_multiple_files(files_to_plot)
+        # Load the data in the background and plot once it is ready
+        self.plot_requested_at = time.perf_counter()
+        self.data_loader.submit('plot', self.make_files_job(files_to_plot, columns=self.get_load_columns()),
+                                self.on_plot_loaded, self.on_load_error)
+        
+    def get_load_columns(self):
+        """Parameters to parse from the log files: the plotted ones and those watched by triggers"""
+        columns = set(self.get_plot_params())
+        if not columns:
+            # Nothing is ticked yet, and the first parameter gets selected once the data is loaded
+            return None
+        if self.trigger_monitoring_enabled:
+            columns.update(trigger.parameter_name for trigger in self.trigger_conditions)
+        return columns
+        
+    def make_files_job(self, files_to_plot, columns=None):
+        """Create a loader job that reads the given files for plotting, one segment per file"""
+        def job(progress):
+            segments = [
+                df for df in self.data_processor.read_log_files(files_to_plot, progress, columns=columns)
+                if df is not None
+            ]
+            return {'files': files_to_plot, 'segments': segments, 'columns': columns}
+        return job
+        
+    def make_time_range_job(self, start_datetime, end_datetime, follow_latest=False, columns=None):
+        """Create a loader job that finds and combines all files with data in a time range"""
+        def job(progress):
+            # Get all files in the date range
+            available_files = self.data_processor.get_log_files(
+                start_datetime.date(),
+                end_datetime.date()
+            )
+            
+            # Only the newest file is still being written, so read it incrementally
+            if follow_latest and available_files:
+                self.data_processor.follow_file(available_files[-1]['path'])
+            
+            # Filter files that contain data within the requested time range; only
+            # their first and last lines are read here, the data is parsed once below
+            files_to_plot = []
+            all_bounds = self.data_processor.get_time_bounds_many(f['path'] for f in available_files)
+            for file_info in available_files:
+                bounds = all_bounds[file_info['path']]
+                if bounds is not None:
+                    file_start, file_end = bounds
+                    # Check if file's time range overlaps with requested range
+                    if (file_start <= end_datetime and file_end >= start_datetime):
+                        files_to_plot.append(file_info['path'])
+            
+            result = {'available_files': available_files, 'files': files_to_plot, 'segments': []}
+            if files_to_plot:
+                result.update(self.make_files_job(files_to_plot, columns)(progress))
+            return result
+        return job
+        
+    def make_live_job(self, session_start, start_datetime, end_datetime, columns=None):
+        """Create a loader job for the live window that also aggregates the session's older files"""
+        load = self.make_time_range_job(start_datetime, end_datetime, follow_latest=True, columns=columns)
+        
+        def job(progress):
+            result = load(progress)
+            result['window_start'] = start_datetime
+            if start_datetime > session_start:
+                # Files that fell out of the window are kept in the rollup store rather than in
+                # memory, so a history plot of the whole session does not have to parse them again
+                aged_files = [
+                    f['path'] for f in self.data_processor.get_log_files(session_start.date(), start_datetime.date())
+                    if f['path'] not in result['files']
+                ]
+                self.data_processor.update_rollups(aged_files)
+            return result
+        return job
+        
+    def make_history_job(self, start_datetime, end_datetime, pixels):
+        """Create a loader job that reads aggregated min/mean/max history for a long time range"""
+        def job(progress):
+            import pandas as pd
+            rollups = self.data_processor.query_rollups(
+                self.data_processor.NUMERIC_COLUMNS, start_datetime, end_datetime, pixels, progress
+            )
+            available_files = self.data_processor.get_log_files(start_datetime.date(), end_datetime.date())
+            if not rollups:
+                return {'available_files': available_files, 'files': [], 'segments': []}
+            
+            # The bucket means are plotted as lines, the min/max as envelopes around them
+            means = pd.DataFrame({param: frame['mean'] for param, frame in rollups.items()})
+            return {
+                'available_files': available_files,
+                'files': [f['path'] for f in available_files],
+                'segments': [means],
+                'envelopes': rollups
+            }
+        return job
         
-        # Process the data
-        self.current_data = self.data_processor.process_multiple_files(files_to_plot)
-        if self.current_data is None:
-            return
+    def on_load_progress(self, channel, done, total):
+        """Show loading progress of user-visible loads in the status bar"""
+        if channel == 'plot' and total > 1:
+            self.statusBar().showMessage(f"Loading files: {done}/{total}")
             
+    def on_load_error(self, message):
+        self.statusBar().showMessage(f"Error loading data: {message}")
+        
+    def on_plot_loaded(self, result):
+        """Plot the data loaded for plot_selected"""
+        self.statusBar().clearMessage()
+        if not result['segments']:
+            return
+        self.render_plot(result['segments'])
+        # From the request to the drawn plot, including the background load
+        perf.record('plot_selected', time.perf_counter() - self.plot_requested_at)
+        
+    def render_plot(self, segments, envelopes=None):
+        """
+        Draw the selected parameters
+        
+        Args:
+            segments: List of DataFrames to plot, one per file, each drawn as a separate line.
+            envelopes: Optional dict mapping parameters to DataFrames with 'min' and 'max'
+                columns, drawn as shaded bands (used for aggregated history).
+        """
         # Get selected parameters
-        selected_params = [param for param, widgets in self.param_widgets.items() if widgets['param_checkbox'].isChecked()]
+        selected_params = self.get_plot_params()
         if not selected_params:
             return
             
-        # Group PiG parameters and other parameters
-        pig_params = [param for param in selected_params if 'PiG' in param]
-        other_params = [param for param in selected_params if 'PiG' not in param]
-        
-        # Reorder parameters to ensure PiG params are handled together
-        selected_params = other_params + pig_params
-            
         # Get the selected plot type
         plot_type = self.plot_type.currentText()
         
         # Clear the current figure
         self.figure.clear()
+        self.decimated_series = []
+        self.autoscaled_axes = {}
+        
+        # Decimate for the full time span first; zooming re-decimates the visible part
+        self.plot_view = self.get_segments_view(segments)
         
         # Create a single plot for all parameters with extra space on right for multiple axes
         ax = self.figure.add_subplot(111)        # Calculate margins based on number of additional y-axes
@@ -534,7 +836,7 @@ class MainWindow(QMainWindow):
         )
         
         # Get default color cycle from matplotlib
-        prop_cycle = plt.rcParams['axes.prop_cycle']
+        prop_cycle = matplotlib.rcParams['axes.prop_cycle']
         colors = prop_cycle.by_key()['color']
         
         # Initial figure size
@@ -555,26 +857,23 @@ class MainWindow(QMainWindow):
         
         # Plot first parameter on main axis
         color = colors[0]
-        # Create a list to store all DataFrames for this parameter
-        all_dfs = []
-        for j, file_path in enumerate(files_to_plot):
-            df = self.data_processor.read_log_file(file_path)
-            if df is not None:
-                all_dfs.append(df)
-                
-                # Create line plot without label - we'll add a single label later
-                if plot_type in ["Line Plot", "Both"]:
-                    main_ax.plot(df.index, df[main_param], '-', color=color)
-                if plot_type in ["Scatter Plot", "Both"]:
-                    main_ax.scatter(df.index, df[main_param], color=color, alpha=0.5)
-                # Store data range
-                if main_param not in param_data:
-                    param_data[main_param] = {'min': float('inf'), 'max': float('-inf')}
-                param_data[main_param]['min'] = min(param_data[main_param]['min'], df[main_param].min())
-                param_data[main_param]['max'] = max(param_data[main_param]['max'], df[main_param].max())
+        for df in segments:
+            # Create line plot without label - we'll add a single label later
+            self.plot_segment(main_ax, df, main_param, plot_type, color)
+            # Store data range
+            if main_param not in param_data:
+                param_data[main_param] = {'min': float('inf'), 'max': float('-inf')}
+            param_data[main_param]['min'] = min(param_data[main_param]['min'], df[main_param].min())
+            param_data[main_param]['max'] = max(param_data[main_param]['max'], df[main_param].max())
+        
+        if envelopes and main_param in envelopes:
+            envelope = envelopes[main_param]
+            self.plot_envelope(main_ax, envelope, color)
+            param_data[main_param]['min'] = min(param_data[main_param]['min'], envelope['min'].min())
+            param_data[main_param]['max'] = max(param_data[main_param]['max'], envelope['max'].max())
         
         # Add a single line to the legend for this parameter
-        if all_dfs and self.show_legend.isChecked():
+        if segments and self.show_legend.isChecked():
             # Add one dummy line with the correct label and color
             if plot_type in ["Line Plot", "Both"]:
                 main_ax.plot([], [], '-', color=color, label=main_param)
@@ -587,20 +886,7 @@ class MainWindow(QMainWindow):
         main_ax.tick_params(axis='y', labelcolor=color)
         
         # Set y-axis limits based on user input or auto-scale
-        if main_param in self.param_widgets:
-            if not self.param_widgets[main_param]['auto_scale'].isChecked():
-                try:
-                    min_val = self.param_widgets[main_param]['min_value'].text()
-                    max_val = self.param_widgets[main_param]['max_value'].text()
-                    if min_val and max_val:  # Both values provided
-                        main_ax.set_ylim(float(min_val), float(max_val))
-                except (ValueError, TypeError):
-                    # If conversion fails, fall back to auto-scaling
-                    y_pad = (param_data[main_param]['max'] - param_data[main_param]['min']) * 0.1
-                    main_ax.set_ylim(param_data[main_param]['min'] - y_pad, param_data[main_param]['max'] + y_pad)
-            else:  # Auto-scale with padding
-                y_pad = (param_data[main_param]['max'] - param_data[main_param]['min']) * 0.1
-                main_ax.set_ylim(param_data[main_param]['min'] - y_pad, param_data[main_param]['max'] + y_pad)
+        self.apply_param_ylim(main_ax, main_param, param_data[main_param])
         
         # Create additional axes for other parameters
         num_additional_axes = 0  # Counter for non-PiG additional axes
@@ -616,6 +902,7 @@ class MainWindow(QMainWindow):
                         pig_axis.spines['right'].set_position(('outward', offset))
                     pig_axis.set_ylabel("PiG [uA]", color=colors[i % len(colors)])
                     pig_axis.set_ylim(0, 270)
+                    self.autoscaled_axes.pop(pig_axis, None)
                 new_ax = pig_axis if pig_axis is not None else main_ax
             else:
                 # Create new axis for non-PiG parameter
@@ -630,19 +917,20 @@ class MainWindow(QMainWindow):
             color = colors[i % len(colors)]
             
             # Plot the parameter on the new axis
-            for j, file_path in enumerate(files_to_plot):
-                df = self.data_processor.read_log_file(file_path)
-                if df is not None:
-                    # Plot without label - we'll add a single label later
-                    if plot_type in ["Line Plot", "Both"]:
-                        new_ax.plot(df.index, df[param], '-', color=color)
-                    if plot_type in ["Scatter Plot", "Both"]:
-                        new_ax.scatter(df.index, df[param], color=color, alpha=0.5)
-                    # Store data range
-                    if param not in param_data:
-                        param_data[param] = {'min': float('inf'), 'max': float('-inf')}
-                    param_data[param]['min'] = min(param_data[param]['min'], df[param].min())
-                    param_data[param]['max'] = max(param_data[param]['max'], df[param].max())
+            for df in segments:
+                # Plot without label - we'll add a single label later
+                self.plot_segment(new_ax, df, param, plot_type, color)
+                # Store data range
+                if param not in param_data:
+                    param_data[param] = {'min': float('inf'), 'max': float('-inf')}
+                param_data[param]['min'] = min(param_data[param]['min'], df[param].min())
+                param_data[param]['max'] = max(param_data[param]['max'], df[param].max())
+            
+            if envelopes and param in envelopes:
+                envelope = envelopes[param]
+                self.plot_envelope(new_ax, envelope, color)
+                param_data[param]['min'] = min(param_data[param]['min'], envelope['min'].min())
+                param_data[param]['max'] = max(param_data[param]['max'], envelope['max'].max())
             
             # Add a single line to the legend for this parameter
             if self.show_legend.isChecked():
@@ -662,20 +950,7 @@ class MainWindow(QMainWindow):
             new_ax.spines['right'].set_color(color)
             
             # Set y-axis limits based on user input or auto-scale
-            if param in self.param_widgets:
-                if not self.param_widgets[param]['auto_scale'].isChecked():
-                    try:
-                        min_val = self.param_widgets[param]['min_value'].text()
-                        max_val = self.param_widgets[param]['max_value'].text()
-                        if min_val and max_val:  # Both values provided
-                            new_ax.set_ylim(float(min_val), float(max_val))
-                    except (ValueError, TypeError):
-                        # If conversion fails, fall back to auto-scaling
-                        y_pad = (param_data[param]['max'] - param_data[param]['min']) * 0.1
-                        new_ax.set_ylim(param_data[param]['min'] - y_pad, param_data[param]['max'] + y_pad)
-                else:  # Auto-scale with padding
-                    y_pad = (param_data[param]['max'] - param_data[param]['min']) * 0.1
-                    new_ax.set_ylim(param_data[param]['min'] - y_pad, param_data[param]['max'] + y_pad)
+            self.apply_param_ylim(new_ax, param, param_data[param])
             
             # Set number of ticks based on axis height
             new_ax.yaxis.set_major_locator(MaxNLocator(6))  # Use imported MaxNLocator
@@ -685,6 +960,7 @@ class MainWindow(QMainWindow):
                 # Clear any existing labels that might have been set
                 pig_axis.set_ylabel("PiG-# [uA]", color=colors[selected_params.index(next(p for p in selected_params if 'PiG' in p))])
                 pig_axis.set_ylim(0, 270)
+                self.autoscaled_axes.pop(pig_axis, None)
             
             # Set common x-axis label and format
             ax.set_xlabel("Time")
@@ -693,7 +969,11 @@ class MainWindow(QMainWindow):
         # ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d\n%H:%M:%S')) # in case we need it more explicit
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d\n%H:%M'))  # Shorter format
         ax.xaxis.set_major_locator(mdates.AutoDateLocator())        # Rotate labels for better readability
-        plt.setp(ax.xaxis.get_majorticklabels(), ha='center')
+        for label in ax.xaxis.get_majorticklabels():
+            label.set_horizontalalignment('center')
+        
+        # Re-decimate when the user zooms or pans with the toolbar
+        ax.callbacks.connect('xlim_changed', lambda _: self.redecimate_timer.start())
         
         # Set grid for all axes
         for a in axes:
@@ -768,6 +1048,203 @@ class MainWindow(QMainWindow):
             # Clear the figure and try to recover
             self.figure.clear()
             self.canvas.draw()
+            
+        # Remember the layout so that live updates can reuse the artists
+        if self.figure.axes and not envelopes:
+            self.plot_signature = self.get_plot_signature(len(segments))
+            self.followed_xlim = self.figure.axes[0].get_xlim()
+        else:
+            self.plot_signature = None
+            
+    def get_plot_params(self):
+        """Get the selected parameters in plotting order, with the PiG parameters last"""
+        selected_params = [param for param, widgets in self.param_widgets.items() if widgets['param_checkbox'].isChecked()]
+        
+        # Group PiG parameters and other parameters
+        pig_params = [param for param in selected_params if 'PiG' in param]
+        other_params = [param for param in selected_params if 'PiG' not in param]
+        
+        # Reorder parameters to ensure PiG params are handled together
+        return other_params + pig_params
+        
+    def get_plot_signature(self, segment_count):
+        """Everything that determines the layout of the plot, apart from the data itself"""
+        scales = tuple(
+            (param, widgets['auto_scale'].isChecked(), widgets['min_value'].text(), widgets['max_value'].text())
+            for param, widgets in self.param_widgets.items() if widgets['param_checkbox'].isChecked()
+        )
+        return (scales, self.plot_type.currentText(), self.show_legend.isChecked(),
+                self.show_grid.isChecked(), segment_count, self.canvas.width())
+        
+    def apply_param_ylim(self, ax, param, data_range):
+        """Set the y-limits of a parameter's axis from user input, or auto-scale with padding"""
+        if param not in self.param_widgets:
+            return
+        widgets = self.param_widgets[param]
+        
+        if not widgets['auto_scale'].isChecked():
+            try:
+                min_val = widgets['min_value'].text()
+                max_val = widgets['max_value'].text()
+                if min_val and max_val:  # Both values provided
+                    ax.set_ylim(float(min_val), float(max_val))
+                self.autoscaled_axes.pop(ax, None)
+                return
+            except (ValueError, TypeError):
+                pass  # If conversion fails, fall back to auto-scaling
+                
+        y_pad = (data_range['max'] - data_range['min']) * 0.1
+        ax.set_ylim(data_range['min'] - y_pad, data_range['max'] + y_pad)
+        self.autoscaled_axes[ax] = param
+        
+    def update_plot_data(self, segments):
+        """
+        Replace the plotted data in place, rebuilding the plot only if its layout changed
+        
+        Live updates only append rows, so the axes, legend and formatting of the
+        previous plot are kept and only the data of its artists is swapped. When
+        neither the view nor the y-limits change, only the appended part of each
+        line is drawn on top of the existing canvas and blitted to the screen.
+        """
+        if self.live_plot_columns is not None and not set(self.get_plot_params()) <= self.live_plot_columns:
+            # A parameter was ticked after the live data was loaded without it
+            self.update_live_plot()
+            return
+        if self.plot_signature is None or self.plot_signature != self.get_plot_signature(len(segments)):
+            self.render_plot(segments)
+            return
+            
+        ax = self.figure.axes[0]
+        artists_per_segment = 2 if self.plot_type.currentText() == "Both" else 1
+        previous = iter(self.decimated_series)
+        series = []
+        param_data = {}
+        
+        for param in self.get_plot_params():
+            param_data[param] = {'min': float('inf'), 'max': float('-inf')}
+            for df in segments:
+                x = df.index.values
+                y = self.get_plot_values(df, param)
+                param_data[param]['min'] = min(param_data[param]['min'], df[param].min())
+                param_data[param]['max'] = max(param_data[param]['max'], df[param].max())
+                for _ in range(artists_per_segment):
+                    artist, old_x, old_x_num, _ = next(previous)
+                    n_old = len(old_x)
+                    if len(x) == n_old and n_old and x[0] == old_x[0] and x[-1] == old_x[-1]:
+                        change = 'same'
+                    elif len(x) > n_old and n_old and x[0] == old_x[0] and x[n_old - 1] == old_x[-1]:
+                        change = 'appended'
+                    else:
+                        change = 'replaced'
+                    x_num = old_x_num if change == 'same' else mdates.date2num(x)
+                    series.append((artist, x, x_num, y, change))
+                    
+        # Follow new data unless the user has zoomed or panned away
+        view = ax.get_xlim()
+        new_xlim = None
+        data_start, data_end = self.get_segments_view(segments)
+        if view == self.followed_xlim and data_start is not None and (data_end > view[1] or data_start < view[0]):
+            margin = ax.margins()[0] * (data_end - data_start)
+            new_xlim = (data_start - margin, data_end + margin)
+            view = new_xlim
+            
+        view_changed = view != self.plot_view
+        ylims = [axis.get_ylim() for axis in self.figure.axes]
+        for axis, param in list(self.autoscaled_axes.items()):
+            self.apply_param_ylim(axis, param, param_data[param])
+        blit = (self.blit_ready and not view_changed and
+                ylims == [axis.get_ylim() for axis in self.figure.axes] and
+                all(change != 'replaced' for *_, change in series))
+        
+        n_buckets = self.get_decimation_buckets()
+        self.decimated_series = []
+        for artist, x, x_num, y, change in series:
+            self.decimated_series.append((artist, x, x_num, y))
+            if change == 'same' and not view_changed:
+                continue
+            keep = minmax_decimate_indices(x_num, y, n_buckets, *view)
+            if blit:
+                # Draw only the new part, starting at the previously last drawn point
+                drawn = mdates.date2num(artist.get_xdata()) if isinstance(artist, Line2D) else artist.get_offsets()[:, 0]
+                tail = keep[x_num[keep] >= drawn[-1]] if len(drawn) else keep
+                self.set_artist_data(artist, x, x_num, y, tail)
+                artist.axes.draw_artist(artist)
+            self.set_artist_data(artist, x, x_num, y, keep)
+            
+        # Set the decimated view first so the limit change does not trigger re-decimation
+        self.plot_view = view
+        if new_xlim is not None:
+            ax.set_xlim(new_xlim)
+            self.followed_xlim = ax.get_xlim()
+            
+        if blit:
+            self.canvas.blit(ax.bbox)
+        else:
+            self.canvas.draw_idle()
+            
+    def set_artist_data(self, artist, x, x_num, y, keep):
+        """Show the samples at the given indices in a line or scatter artist"""
+        if isinstance(artist, Line2D):
+            artist.set_data(x[keep], y[keep])
+        else:
+            artist.set_offsets(np.column_stack([x_num[keep], y[keep]]))
+            
+    def on_canvas_draw(self, event):
+        """Track whether the canvas buffer can be drawn on incrementally"""
+        # Figures saved at another resolution are drawn with a separate renderer
+        self.blit_ready = event.renderer is getattr(self.canvas, 'renderer', None)
+        
+    def get_decimation_buckets(self):
+        """Number of decimation buckets: one per horizontal pixel of the canvas"""
+        return max(self.canvas.width(), 100)
+        
+    def get_segments_view(self, segments):
+        """Get the (start, end) of all segments as matplotlib date numbers"""
+        bounds = [(df.index[0], df.index[-1]) for df in segments if not df.empty]
+        if not bounds:
+            return (None, None)
+        return (mdates.date2num(min(b[0] for b in bounds)), mdates.date2num(max(b[1] for b in bounds)))
+        
+    @staticmethod
+    def get_plot_values(df, param):
+        """The values of a parameter to draw; live buffer views are drawn as stored, without a float64 copy"""
+        if isinstance(df, CompactLogData):
+            return df.column_values(param)
+        return df[param].to_numpy(dtype=float)
+        
+    def plot_segment(self, ax, df, param, plot_type, color):
+        """Plot one file's worth of a parameter, decimated to the width of the canvas"""
+        x = df.index.values
+        x_num = mdates.date2num(x)
+        y = self.get_plot_values(df, param)
+        keep = minmax_decimate_indices(x_num, y, self.get_decimation_buckets(), *self.plot_view)
+        
+        if plot_type in ["Line Plot", "Both"]:
+            line, = ax.plot(x[keep], y[keep], '-', color=color)
+            self.decimated_series.append((line, x, x_num, y))
+        if plot_type in ["Scatter Plot", "Both"]:
+            points = ax.scatter(x[keep], y[keep], color=color, alpha=0.5)
+            self.decimated_series.append((points, x, x_num, y))
+            
+    def plot_envelope(self, ax, envelope, color):
+        """Shade the min/max band of aggregated history data so spikes stay visible"""
+        ax.fill_between(envelope.index, envelope['min'], envelope['max'],
+                        color=color, alpha=0.25, linewidth=0)
+        
+    def update_decimation(self):
+        """Re-decimate all plotted data for the currently visible time range"""
+        if not self.decimated_series or not self.figure.axes:
+            return
+        x_min, x_max = self.figure.axes[0].get_xlim()
+        if (x_min, x_max) == self.plot_view:
+            return
+        self.plot_view = (x_min, x_max)
+        
+        n_buckets = self.get_decimation_buckets()
+        for artist, x, x_num, y in self.decimated_series:
+            keep = minmax_decimate_indices(x_num, y, n_buckets, x_min, x_max)
+            self.set_artist_data(artist, x, x_num, y, keep)
+        self.canvas.draw_idle()
     
     # Commented out for future reference
     # def show_statistics(self, param_data):
@@ -789,6 +1266,14 @@ class MainWindow(QMainWindow):
             self.data_processor.base_dir = new_dir
             self.dir_label.setText(new_dir)
             self.refresh_file_list()  # Refresh the file list with the new directory
+            if self.log_watcher.base_dir is not None:
+                self.log_watcher.start(new_dir)
+            if self.live_plot_enabled:
+                self.update_live_plot()
+    
+    def toggle_sidecars(self, checked):
+        """Enable or disable the binary sidecar cache"""
+        self.data_processor.use_sidecars = checked
     
     def toggle_live_plot(self):
         if self.live_plot_btn.isChecked():
@@ -797,11 +1282,55 @@ class MainWindow(QMainWindow):
             self.live_plot_start_time = self.quick_start_time.time()
             self.live_plot_btn.setText("Disable Live Plot")
             self.live_plot_enabled = True
-            self.live_plot_timer.start(2000)  # Update every 2 seconds
+            self.plot_signature = None  # Start from a freshly built plot
+            # Update once now, then whenever new log data appears
+            self.update_log_watcher()
+            self.update_live_plot()
         else:
             self.live_plot_btn.setText("Enable Live Plot")
             self.live_plot_enabled = False
-            self.live_plot_timer.stop()
+            self.data_loader.cancel('live')
+            self.update_log_watcher()
+            self.close_live_buffer()
+            
+    def update_log_watcher(self):
+        """Watch the log files while live plotting or trigger monitoring needs new data"""
+        if self.live_plot_enabled or self.trigger_monitoring_enabled:
+            if self.log_watcher.base_dir != self.data_processor.base_dir:
+                self.log_watcher.start(self.data_processor.base_dir)
+        else:
+            self.log_watcher.stop()
+            # The ingest polls of either one continue from the tail reader's state
+            self.data_processor.unfollow_all()
+            
+    def poll_ingest(self):
+        """Read newly written log rows in the background and hand them to all consumers"""
+        since = self.catch_up_since
+        
+        def job(progress):
+            # A poll that replaces a pending one carries the catch-up along
+            caught_up = self.ingest_service.read_since(since) if since is not None else []
+            return caught_up, self.ingest_service.poll()
+            
+        self.data_loader.submit(
+            'ingest',
+            job,
+            self.on_ingest_polled,
+            lambda message: print(f"Error reading new log data: {message}"),
+            replace_running=False
+        )
+        
+    def on_ingest_polled(self, result):
+        caught_up, updates = result
+        if caught_up and self.catch_up_since is not None:
+            # Rows written while the application was not running, from every file they went to
+            self.catch_up_since = None
+            for rows in caught_up:
+                self.check_email_triggers(rows)
+        if updates:
+            # The newest polled file is the one being written, also when no live plot is shown
+            self.log_watcher.set_active_file(updates[-1].file_path)
+        self.ingest_service.publish(updates)
 
     def plot_time_range(self, start_date_widget, start_time_widget, end_date_widget, end_time_widget):
         """Plot data directly from a time range without manual file selection"""
@@ -815,22 +1344,24 @@ class MainWindow(QMainWindow):
             end_time_widget.time().toPyTime()
         )
         
-        # Get all files in the date range
-        self.available_files = self.data_processor.get_log_files(
-            start_datetime.date(),
-            end_datetime.date()
+        # Long ranges only need per-bucket min/mean/max, not raw samples
+        if end_datetime - start_datetime >= self.ROLLUP_MIN_SPAN:
+            job = self.make_history_job(start_datetime, end_datetime, self.get_decimation_buckets())
+        else:
+            job = self.make_time_range_job(start_datetime, end_datetime, columns=self.get_load_columns())
+        
+        self.data_loader.submit(
+            'plot',
+            job,
+            lambda result: self.on_time_range_loaded(result, start_datetime, end_datetime),
+            self.on_load_error
         )
         
-        # Filter files that contain data within the requested time range
-        files_to_plot = []
-        for file_info in self.available_files:
-            df = self.data_processor.read_log_file(file_info['path'])
-            if df is not None and not df.empty:
-                file_start = df.index[0]
-                file_end = df.index[-1]
-                # Check if file's time range overlaps with requested range
-                if (file_start <= end_datetime and file_end >= start_datetime):
-                    files_to_plot.append(file_info['path'])
+    def on_time_range_loaded(self, result, start_datetime, end_datetime):
+        """Plot the data loaded for plot_time_range"""
+        self.statusBar().clearMessage()
+        self.available_files = result['available_files']
+        files_to_plot = result['files']
         
         if not files_to_plot:
             QMessageBox.warning(
@@ -840,13 +1371,7 @@ class MainWindow(QMainWindow):
             )
             return
         
-        # Process the data with datetime filtering
-        self.current_data = self.data_processor.process_multiple_files(
-            files_to_plot, 
-            start_datetime=start_datetime, 
-            end_datetime=end_datetime
-        )
-        if self.current_data is None:
+        if not result['segments']:
             return
             
         # Get selected parameters
@@ -857,9 +1382,6 @@ class MainWindow(QMainWindow):
             self.param_widgets[first_param]['param_checkbox'].setChecked(True)
             selected_params = [first_param]
         
-        # Store the original files list selection
-        original_selection = [idx.row() for idx in self.file_list.selectedIndexes()]
-        
         # Update file list to show what's being plotted
         self.file_list.clear()
         for file_info in [f for f in self.available_files if f['path'] in files_to_plot]:
@@ -869,7 +1391,7 @@ class MainWindow(QMainWindow):
             self.file_list.addItem(display_text)
         
         # Plot the data
-        self.plot_selected(files_to_plot)
+        self.render_plot(result['segments'], result.get('envelopes'))
 
     def update_live_plot(self):
         """Update the plot in live mode using the time range approach"""
@@ -887,46 +1409,63 @@ class MainWindow(QMainWindow):
                 if ax.get_ylabel():  # Only store if the axis has a label
                     ylims[ax.get_ylabel()] = ax.get_ylim()
         
-        # Use stored start time and current time as the range
-        start_datetime = datetime.combine(
+        # Use stored start time and current time as the range, but keep only the
+        # retention window in memory
+        session_start = datetime.combine(
             self.live_plot_start_date.toPyDate(),
             self.live_plot_start_time.toPyTime()
         )
         end_datetime = datetime.now()
-        
-        # Get all files in the date range
-        self.available_files = self.data_processor.get_log_files(
-            start_datetime.date(),
-            end_datetime.date()
-        )
+        start_datetime = max(session_start, end_datetime - self.get_live_retention())
         
         # Store the limits to use after plotting
         self.stored_xlim = xlim
         self.stored_ylims = ylims
         
-        # Filter files that contain data within the requested time range
-        files_to_plot = []
-        for file_info in self.available_files:
-            df = self.data_processor.read_log_file(file_info['path'])
-            if df is not None and not df.empty:
-                file_start = df.index[0]
-                file_end = df.index[-1]
-                # Check if file's time range overlaps with requested range
-                if (file_start <= end_datetime and file_end >= start_datetime):
-                    files_to_plot.append(file_info['path'])
+        # A tick that arrives while the previous one is still loading replaces
+        # any queued tick instead of piling up behind it. Live reloads have their
+        # own channel, so they neither replace nor get replaced by a user's plot.
+        self.data_loader.submit(
+            'live',
+            self.make_live_job(session_start, start_datetime, end_datetime, self.get_load_columns()),
+            self.on_live_plot_loaded,
+            self.on_load_error,
+            replace_running=False
+        )
         
+    def on_live_plot_loaded(self, result):
+        """Plot the data loaded for a live plot update"""
+        if not self.live_plot_enabled:
+            # Live plotting was switched off while this update was loading
+            self.update_log_watcher()
+            return
+            
+        self.statusBar().clearMessage()
+        self.available_files = result['available_files']
+        if self.available_files:
+            # Watch the file that is currently being written for new rows
+            self.log_watcher.set_active_file(self.available_files[-1]['path'])
+        files_to_plot = result['files']
         if not files_to_plot:
             return  # Don't show warning in live mode, just skip update
             
-        # Process the data with datetime filtering
-        self.current_data = self.data_processor.process_multiple_files(
-            files_to_plot,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime
-        )
-        
-        if self.current_data is None:
+        if not result['segments']:
             return
+        
+        self.live_plot_columns = result.get('columns')
+        # New rows of the last file are added to the plot without a full reload
+        if len(result['segments']) == len(files_to_plot):
+            self.live_plot_files = list(files_to_plot)
+            self.fill_live_buffer(files_to_plot, result['segments'], result['window_start'])
+            if len(self.live_buffer):
+                # Rows published while this update was loading went to the buffer it replaced
+                latest = files_to_plot[-1]
+                self.live_buffer.append_newer(self.data_processor.tail_reader.frame(latest), latest)
+            segments = self.get_live_segments()
+        else:
+            self.live_plot_files = []
+            self.close_live_buffer()
+            segments = result['segments']
             
         # Update file list to show what's being plotted
         self.file_list.clear()
@@ -940,25 +1479,87 @@ class MainWindow(QMainWindow):
             first_param = next(iter(self.param_widgets))
             self.param_widgets[first_param]['param_checkbox'].setChecked(True)
             
-        # Plot the data using the time range
-        self.plot_selected(files_to_plot)
+        # Only the data changes between live ticks, so the artists are updated in place
+        self.update_plot_data(segments)
+        
+    def fill_live_buffer(self, files, segments, start_datetime):
+        """Bring the live buffer up to date with the rows of the live window"""
+        columns = list(segments[0].columns)
+        retention = self.get_live_retention()
+        buffer = self.live_buffer
+        if buffer is None or buffer.columns != columns or buffer.retention != retention:
+            self.close_live_buffer()
+            buffer = self.live_buffer = LiveRingBuffer(columns, self.LIVE_BUFFER_ROWS, retention)
+
+        kept = buffer.file_paths
+        if kept and set(kept) <= set(files) and files[files.index(kept[0]):files.index(kept[-1]) + 1] == kept:
+            # The buffered files are still in the window: only newer rows are added, so the
+            # data behind the drawn artists stays in place
+            last = files.index(kept[-1])
+            for file_path, df in zip(files[last:], segments[last:]):
+                buffer.append_newer(self.data_processor.slice_time_window(df, start_datetime), file_path)
+            return
+        buffer.reset()
+        for file_path, df in zip(files, segments):
+            buffer.append(self.data_processor.slice_time_window(df, start_datetime), file_path)
+            
+    def get_live_segments(self):
+        """The live buffer's rows, one segment per file, for plotting"""
+        if self.live_buffer.generation != self.live_buffer_generation:
+            # The buffer moved its rows, so the data behind the drawn artists has been overwritten
+            self.live_buffer_generation = self.live_buffer.generation
+            self.plot_signature = None
+        return self.live_buffer.segments()
+        
+    def close_live_buffer(self):
+        if self.live_buffer is not None:
+            self.live_buffer.close()
+            self.live_buffer = None
+            
+    def get_live_retention(self):
+        return timedelta(hours=self.live_retention_hours.value())
+        
+    def on_live_retention_changed(self, hours):
+        """Reload the live window with the new retention"""
+        if self.live_plot_enabled:
+            self.update_live_plot()
         
-        # Check email triggers after plotting (when current_data is updated)
-        self.check_email_triggers(self.current_data)
+    def on_live_data(self, update):
+        """Add newly read rows to the live plot"""
+        if not self.live_plot_enabled:
+            return
+        if not self.live_plot_files or update.file_path != self.live_plot_files[-1]:
+            # A new log file was started (or nothing is plotted yet): reload the whole range
+            self.update_live_plot()
+            return
+        if not update.has_new_rows or self.live_buffer is None:
+            return
+            
+        # Rows older than the retention window drop out of the buffer as new ones are added
+        self.live_buffer.append_newer(update.new_rows, update.file_path)
+        self.update_plot_data(self.get_live_segments())
         
     def configure_email_notifications(self):
         """Open email configuration dialog"""
+        from .email_config_dialog import EmailConfigDialog
         dialog = EmailConfigDialog(self)
         
         # Set current configuration if available
         if self.email_notifier.is_configured:
             dialog.set_email_notifier(self.email_notifier)
+        if self.trigger_conditions:
             dialog.set_trigger_conditions(self.trigger_conditions)
             
         if dialog.exec() == EmailConfigDialog.DialogCode.Accepted:
             # Get the configured notifier and triggers
             self.email_notifier = dialog.get_email_notifier()
+            self.email_outbox.notifier = self.email_notifier
+            previous = [trigger.definition() for trigger in self.trigger_conditions]
             self.trigger_conditions = dialog.get_trigger_conditions()
+            if [trigger.definition() for trigger in self.trigger_conditions] != previous:
+                # The last run's sample time belongs to the old triggers; don't resume or catch up from it
+                self.resume_sample_time = self.catch_up_since = None
+            self.save_trigger_state()
             
             # Update status labels
             self.update_email_status()
@@ -984,74 +1585,81 @@ class MainWindow(QMainWindow):
         self.update_trigger_display()
             
     def check_email_triggers(self, current_data):
-        """Check if any email triggers should be fired"""
+        """Check if any email triggers should be fired by the samples added since the last check"""
         try:
             if not self.email_notifier.is_configured or not self.trigger_conditions or current_data is None:
                 return
                 
-            current_time = datetime.now()
-            
             # Handle both dictionary format (from process_multiple_files) and DataFrame format
             if isinstance(current_data, dict):
                 # Convert dictionary format to DataFrame for easier handling
                 import pandas as pd
                 if not current_data:
                     return
-                df = pd.DataFrame(current_data)
-                if df.empty:
-                    return
-                latest_data = df.iloc[-1]
-            else:
-                # DataFrame format
-                if current_data.empty:
-                    return
-                latest_data = current_data.iloc[-1]
-            
-            # Check each trigger condition
-            for trigger in self.trigger_conditions:
+                current_data = pd.DataFrame(current_data)
+            if current_data.empty:
+                return
+                
+            # Conditions are evaluated on every new sample; the email cooldown stays on wall clock time
+            current_time = datetime.now()
+            for event in self.trigger_evaluator.evaluate(self.trigger_conditions, current_data):
+                trigger = event.trigger
+                current_value = event.value
                 try:
-                    if trigger.parameter_name in latest_data:
-                        current_value = latest_data[trigger.parameter_name]
+                    # Check if we can send an email (respecting cooldown)
+                    if trigger.can_send_email(current_time):
+                        # Send alert email
+                        subject = f"{trigger.parameter_name} Alert"
+                        message = (f"Alert triggered: {trigger.get_description()}\n\n"
+                                   f"Current value: {current_value}\n"
+                                   f"Sample time: {event.time.strftime('%Y-%m-%d %H:%M:%S')}")
                         
-                        # Check if trigger condition is met
-                        if trigger.check_condition(current_value, current_time):
-                            # Check if we can send an email (respecting cooldown)
-                            if trigger.can_send_email(current_time):
-                                # Send alert email
-                                subject = f"{trigger.parameter_name} Alert"
-                                message = f"Alert triggered: {trigger.get_description()}\n\nCurrent value: {current_value}"
-                                
-                                success = self.email_notifier.send_alert(
-                                    subject, 
-                                    message, 
-                                    trigger.parameter_name, 
-                                    current_value, 
-                                    trigger.threshold_value
-                                )
-                                
-                                if success:
-                                    trigger.mark_email_sent(current_time)
-                                    notification_msg = f"Alert sent: {trigger.parameter_name} = {current_value:.2f}"
-                                    self.add_notification(notification_msg)
-                                    print(f"Alert sent for {trigger.parameter_name}: {current_value} (email sent)")
-                                else:
-                                    self.add_notification(f"Failed to send alert for {trigger.parameter_name}")
-                                    print(f"Failed to send alert for {trigger.parameter_name}")
-                            else:
-                                # Trigger met but email cooldown active
-                                time_remaining = trigger.email_cooldown_minutes - ((current_time - trigger.last_email_sent).total_seconds() / 60)
-                                print(f"Trigger active for {trigger.parameter_name}: {current_value}, but email cooldown active ({time_remaining:.1f} min remaining)")
+                        # Alerts of the same check are queued together and sent as one email
+                        success = self.email_outbox.queue_alert(
+                            subject, 
+                            message, 
+                            trigger.parameter_name, 
+                            current_value, 
+                            trigger.threshold_value
+                        )
+                        
+                        if success:
+                            trigger.mark_email_sent(current_time)
+                            notification_msg = f"Alert queued: {trigger.parameter_name} = {current_value:.2f}"
+                            self.add_notification(notification_msg)
+                            print(f"Alert queued for {trigger.parameter_name}: {current_value}")
+                        else:
+                            self.add_notification(f"Failed to send alert for {trigger.parameter_name}")
+                            print(f"Failed to send alert for {trigger.parameter_name}")
                     else:
-                        print(f"Warning: Parameter '{trigger.parameter_name}' not found in current data. Available parameters: {list(latest_data.index)}")
+                        # Trigger met but email cooldown active
+                        time_remaining = trigger.email_cooldown_minutes - ((current_time - trigger.last_email_sent).total_seconds() / 60)
+                        print(f"Trigger active for {trigger.parameter_name}: {current_value}, but email cooldown active ({time_remaining:.1f} min remaining)")
                         
                 except Exception as e:
                     print(f"Error checking trigger for {trigger.parameter_name}: {str(e)}")
                     continue
+            self.save_trigger_state()
                         
         except Exception as e:
             print(f"Error in check_email_triggers: {str(e)}")
             # Don't let email trigger errors crash the entire application
             
+    def save_trigger_state(self):
+        """Store the triggers and their state so a restart continues where monitoring stopped"""
+        try:
+            last_sample_time = self.trigger_evaluator.last_sample_time if self.trigger_monitoring_enabled else None
+            self.alert_store.save_triggers(self.trigger_conditions, last_sample_time)
+        except Exception as e:
+            print(f"Error saving trigger state: {str(e)}")
+            
+    def on_email_result(self, success, subject):
+        """Report the delivery result of a queued alert email"""
+        if success:
+            self.add_notification(f"Alert email sent: {subject}")
+        else:
+            self.add_notification(f"Failed to send alert email: {subject}")
+            
     def start_trigger_monitoring(self):
         """Start independent trigger monitoring"""
         if not self.email_notifier.is_configured or not self.trigger_conditions:
@@ -1060,14 +1668,24 @@ class MainWindow(QMainWindow):
             
         self.trigger_monitoring_enabled = True
         
-        # Reset all trigger states
-        for trigger in self.trigger_conditions:
-            trigger.monitoring_start_time = None
-            trigger.trigger_start_time = None
-            trigger.is_active = False
+        self.trigger_evaluator.reset()
+        if self.resume_sample_time is not None:
+            # Monitoring was interrupted: keep the running timers and check the samples written since
+            self.trigger_evaluator.last_sample_time = self.catch_up_since = self.resume_sample_time
+            self.resume_sample_time = None
+            self.add_notification("Resuming trigger monitoring from the last run")
+        else:
+            # Reset all trigger states
+            for trigger in self.trigger_conditions:
+                trigger.monitoring_start_time = None
+                trigger.trigger_start_time = None
+                trigger.is_active = False
             
-        # Start the trigger monitoring timer (check every 30 seconds)
+        # New data is checked as it arrives; the timer polls as a fallback and
+        # keeps the status display current (every 30 seconds)
+        self.update_log_watcher()
         self.trigger_timer.start(30000)
+        self.poll_ingest()
         
         # Update UI
         self.start_monitoring_btn.setEnabled(False)
@@ -1082,7 +1700,10 @@ class MainWindow(QMainWindow):
     def stop_trigger_monitoring(self):
         """Stop trigger monitoring"""
         self.trigger_monitoring_enabled = False
+        self.catch_up_since = None
         self.trigger_timer.stop()
+        self.update_log_watcher()
+        self.save_trigger_state()
         
         # Update UI
         self.start_monitoring_btn.setEnabled(True)
@@ -1096,39 +1717,21 @@ class MainWindow(QMainWindow):
         
     def check_triggers(self):
         """Check triggers independently of live plotting"""
-        try:
-            if not self.trigger_monitoring_enabled or not self.trigger_conditions:
-                return
-                
-            # Get the latest data from the most recent files
-            current_time = datetime.now()
-            
-            # Get files from the last hour to ensure we have recent data
-            start_time = current_time.replace(minute=0, second=0, microsecond=0)
-            files = self.data_processor.get_log_files(start_time.date(), current_time.date())
-            
-            if not files:
-                print("No recent files found for trigger monitoring")
-                return
-                
-            # Get the most recent file
-            recent_files = [f['path'] for f in files[-3:]]  # Check last 3 files for more data
-            
-            # Process data
-            data = self.data_processor.process_multiple_files(recent_files)
-            if data is None or (isinstance(data, dict) and not data):
-                print("No data available for trigger monitoring")
-                return
-                
-            # Check triggers with this data
-            self.check_email_triggers(data)
+        if not self.trigger_monitoring_enabled or not self.trigger_conditions:
+            return
+        self.poll_ingest()
+        
+    def on_trigger_data(self, update):
+        """Check triggers against the samples added since the last poll"""
+        if not (self.live_plot_enabled or self.trigger_monitoring_enabled) or not update.has_new_rows:
+            return
             
-            # Update trigger display
+        # Only the rows that were not evaluated yet are checked
+        self.check_email_triggers(update.new_rows)
+        
+        if self.trigger_monitoring_enabled:
             self.update_trigger_display()
             
-        except Exception as e:
-            print(f"Error in trigger monitoring: {str(e)}")
-            
     def update_trigger_display(self):
         """Update the trigger display in the UI"""
         # Clear existing widgets
@@ -1239,3 +1842,41 @@ class MainWindow(QMainWindow):
         # Limit to 10 recent notifications
         while self.notifications_list.count() > 10:
             self.notifications_list.takeItem(self.notifications_list.count() - 1)
+
+    def toggle_perf_recording(self, checked):
+        """Switch the timing instrumentation on or off"""
+        perf.enabled = checked
+        if checked:
+            self.perf_timer.start()
+        else:
+            self.perf_timer.stop()
+        self.update_perf_display()
+        
+    def toggle_perf_log(self, checked):
+        perf.set_log_file(self.PERF_LOG_PATH if checked else None)
+        
+    def reset_perf_stats(self):
+        perf.reset()
+        self.update_perf_display()
+        
+    def update_perf_display(self):
+        """Show the recorded timings and counters in the Performance box"""
+        stats, counters = perf.snapshot()
+        self.perf_table.setRowCount(len(stats))
+        for row, (name, count, total, mean, maximum, last) in enumerate(stats):
+            cells = [name, str(count), f"{mean * 1000:.1f}", f"{maximum * 1000:.1f}", f"{last * 1000:.1f}"]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.perf_table.setItem(row, column, item)
+        self.perf_counters_label.setText(", ".join(f"{name}: {value}" for name, value in counters))
+        
+    def closeEvent(self, event):
+        """Stop timers and the background loader when the window closes"""
+        self.log_watcher.stop()
+        self.trigger_timer.stop()
+        self.data_loader.shutdown()
+        self.email_outbox.shutdown()
+        self.alert_store.close()
+        super().closeEvent(event)
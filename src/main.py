@@ -1,11 +1,66 @@
+import os
 import sys
-from PyQt6.QtWidgets import QApplication
-from gui.main_window import MainWindow
+import time
+
+START_TIME = time.perf_counter()
+
+
+class StartupProfile:
+    """Records how long each phase of the startup took (--profile-startup)"""
+
+    def __init__(self):
+        self.phases = []  # (phase, time.perf_counter() at its end)
+
+    def mark(self, phase):
+        self.phases.append((phase, time.perf_counter()))
+
+    def report(self):
+        lines = ["Startup profile (phase duration / time since start, seconds):"]
+        previous = START_TIME
+        for phase, end in sorted(self.phases, key=lambda p: p[1]):
+            lines.append(f"  {phase:<28} {end - previous:6.3f} {end - START_TIME:7.3f}")
+            previous = end
+        text = "\n".join(lines)
+
+        if sys.stderr is not None:
+            print(text, file=sys.stderr)
+        else:
+            # Windowed builds have no console; write the profile next to the other settings
+            path = os.path.join(os.path.expanduser('~'), '.synergyed_log_plotter', 'startup_profile.txt')
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text + "\n")
+
 
 def main():
+    profile = None
+    if '--profile-startup' in sys.argv:
+        sys.argv.remove('--profile-startup')
+        profile = StartupProfile()
+
+    from PyQt6.QtWidgets import QApplication
     app = QApplication(sys.argv)
+    if profile:
+        profile.mark("Qt")
+
+    from gui.main_window import MainWindow
+    if profile:
+        profile.mark("import main window")
+
     window = MainWindow()
+    if profile:
+        profile.mark("create window")
+
     window.show()
+    if profile:
+        profile.mark("show window")
+
+        def finished():
+            profile.phases.extend(window.startup_phases)
+            profile.report()
+            app.quit()
+
+        window.startup_finished.connect(finished)
     sys.exit(app.exec())
 
 if __name__ == '__main__':
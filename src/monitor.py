@@ -0,0 +1,226 @@
+"""Monitor the SynergyED log files and send alert emails without the GUI.
+
+Runs the same trigger checks as "Start Monitoring" in the plotter, but
+without Qt or matplotlib, so it can run as a service or scheduled task on the
+instrument PC:
+
+    python src/monitor.py monitor.json
+
+The config file is JSON:
+
+    {
+        "log_dir": "C:\\\\Xcalibur\\\\log\\\\SynergyED_DiagnosticData",
+        "poll_interval_seconds": 10,
+        "email": {
+            "smtp_server": "smtp.gmail.com",
+            "smtp_port": 587,
+            "use_tls": true,
+            "sender_email": "sender@example.com",
+            "sender_password": "app password",
+            "recipient_email": "recipient@example.com"
+        },
+        "triggers": [
+            {"parameter_name": "RT1 PiG5", "condition_type": "greater_than", "threshold_value": 100},
+            {"parameter_name": "HT [kV]", "condition_type": "less_than", "threshold_value": 180,
+             "duration_minutes": 60, "email_cooldown_minutes": 120}
+        ]
+    }
+
+If "sender_password" is left out, it is read from the SYNERGYED_SMTP_PASSWORD
+environment variable. Trigger state and undelivered alerts are kept in an
+alert store, so a restarted monitor continues where it stopped.
+"""
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+from datetime import datetime
+from utils.alert_store import AlertStore
+from utils.data_processor import LogDataProcessor
+from utils.email_notifier import EmailNotifier, TriggerCondition
+from utils.email_outbox import EmailOutbox
+from utils.ingest_service import LogIngestService
+from utils.trigger_engine import TriggerEvaluator
+
+# Separate from the GUI's store, so the two do not overwrite each other's triggers
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(AlertStore.DEFAULT_PATH), 'monitor.sqlite')
+DEFAULT_POLL_INTERVAL_S = 10
+PASSWORD_ENV = 'SYNERGYED_SMTP_PASSWORD'
+
+CONDITION_TYPES = ('greater_than', 'less_than', 'equals')
+MONITORING_TYPES = (TriggerCondition.CONTINUOUS_DURATION, TriggerCondition.TIME_BOUNDED,
+                    TriggerCondition.DELAYED_ACTIVATION)
+
+
+def load_config(path):
+    """Read and check a monitor config file. Raises ValueError for invalid configs."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Could not read config file {path}: {str(e)}")
+
+    email = config.get('email')
+    if not isinstance(email, dict):
+        raise ValueError("Config needs an 'email' section")
+    for key in ('smtp_server', 'sender_email', 'recipient_email'):
+        if not email.get(key):
+            raise ValueError(f"Config 'email' section needs '{key}'")
+
+    triggers = config.get('triggers')
+    if not triggers:
+        raise ValueError("Config needs at least one entry in 'triggers'")
+    for entry in triggers:
+        if entry.get('parameter_name') not in LogDataProcessor.NUMERIC_COLUMNS:
+            raise ValueError(f"Unknown parameter {entry.get('parameter_name')!r}. "
+                             f"Available parameters: {LogDataProcessor.NUMERIC_COLUMNS}")
+        if entry.get('condition_type') not in CONDITION_TYPES:
+            raise ValueError(f"condition_type must be one of {CONDITION_TYPES}")
+        if entry.get('monitoring_type', TriggerCondition.CONTINUOUS_DURATION) not in MONITORING_TYPES:
+            raise ValueError(f"monitoring_type must be one of {MONITORING_TYPES}")
+        if not isinstance(entry.get('threshold_value'), (int, float)):
+            raise ValueError(f"Trigger for {entry['parameter_name']} needs a numeric 'threshold_value'")
+    return config
+
+
+def make_notifier(email):
+    notifier = EmailNotifier()
+    password = email.get('sender_password', os.environ.get(PASSWORD_ENV, ''))
+    notifier.configure_smtp(email['smtp_server'], int(email.get('smtp_port', 587)),
+                            email['sender_email'], password, use_tls=email.get('use_tls', True))
+    notifier.set_recipient(email['recipient_email'])
+    return notifier
+
+
+def make_trigger(entry):
+    trigger = TriggerCondition(
+        entry['parameter_name'],
+        entry['condition_type'],
+        float(entry['threshold_value']),
+        float(entry.get('duration_minutes', 0)),
+        entry.get('monitoring_type')
+    )
+    if 'email_cooldown_minutes' in entry:
+        trigger.email_cooldown_minutes = float(entry['email_cooldown_minutes'])
+    return trigger
+
+
+class TriggerMonitor:
+    """Polls the newest log file and queues an alert email for every trigger that fires"""
+
+    def __init__(self, processor, triggers, outbox, store):
+        self.ingest_service = LogIngestService(processor)
+        self.trigger_evaluator = TriggerEvaluator()
+        self.triggers = triggers
+        self.outbox = outbox
+        self.store = store
+        self.logger = logging.getLogger(__name__)
+        self._resume_from = None  # Sample time to catch up from after a restart
+
+    def restore_state(self):
+        """Continue the timers and cooldowns of the last run, unless the triggers were changed since"""
+        stored = self.store.load_triggers()
+        if [t.definition() for t in stored] != [t.definition() for t in self.triggers]:
+            if stored:
+                self.logger.info("Triggers changed since the last run, starting with fresh trigger state")
+            return False
+
+        self.triggers = stored
+        self.trigger_evaluator.last_sample_time = self._resume_from = self.store.load_last_sample_time()
+        self.logger.info(f"Resuming trigger monitoring from {self.trigger_evaluator.last_sample_time}")
+        return True
+
+    def check(self):
+        """Evaluate the triggers over the samples written since the last check"""
+        blocks = []
+        if self._resume_from is not None:
+            # The rows written while the monitor was not running, in all files they went to
+            blocks = self.ingest_service.read_since(self._resume_from)
+            self._resume_from = None
+        blocks += [update.new_rows for update in self.ingest_service.poll() if update.has_new_rows]
+        if not blocks:
+            return
+
+        now = datetime.now()
+        events = [event for rows in blocks for event in self.trigger_evaluator.evaluate(self.triggers, rows)]
+        for event in events:
+            trigger = event.trigger
+            if not trigger.can_send_email(now):
+                self.logger.info(f"Trigger active for {trigger.parameter_name}: {event.value}, "
+                                 f"but email cooldown active")
+                continue
+            message = (f"Alert triggered: {trigger.get_description()}\n\n"
+                       f"Current value: {event.value}\n"
+                       f"Sample time: {event.time.strftime('%Y-%m-%d %H:%M:%S')}")
+            if self.outbox.queue_alert(f"{trigger.parameter_name} Alert", message, trigger.parameter_name,
+                                       event.value, trigger.threshold_value):
+                trigger.mark_email_sent(now)
+                self.logger.warning(f"Alert queued for {trigger.parameter_name}: {event.value}")
+
+        self.store.save_triggers(self.triggers, self.trigger_evaluator.last_sample_time)
+
+    def run(self, interval_s, stop_event):
+        """Check every interval_s seconds until stop_event is set"""
+        self.logger.info(f"Monitoring {len(self.triggers)} triggers in {self.ingest_service.processor.base_dir}")
+        while True:
+            try:
+                self.check()
+            except Exception as e:
+                # Keep monitoring through unreadable files and similar problems
+                self.logger.error(f"Error checking triggers: {str(e)}")
+            if stop_event.wait(interval_s):
+                return
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monitor SynergyED log files and send alert emails")
+    parser.add_argument('config', help="JSON file with the log directory, email settings and triggers")
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH,
+                        help=f"File for trigger state and undelivered alerts (default: {DEFAULT_STORE_PATH})")
+    parser.add_argument('--once', action='store_true',
+                        help="Check once and exit (e.g. when run from a scheduled task)")
+    parser.add_argument('--log-file', default=None, help="Write the log to this file instead of the console")
+    args = parser.parse_args()
+
+    logging.basicConfig(filename=args.log_file, level=logging.INFO,
+                        format='%(asctime)s %(levelname)s %(message)s')
+    try:
+        config = load_config(args.config)
+    except ValueError as e:
+        print(f"Error: {str(e)}")
+        return 1
+
+    # Only the newest file is read, so neither a file cache nor old tail states are needed
+    processor = LogDataProcessor(cache_budget_mb=0, load_workers=1)
+    processor.tail_reader.max_files = 1
+    processor.base_dir = config.get('log_dir') or processor.base_dir
+    if not os.path.isdir(processor.base_dir):
+        print(f"Error: {processor.base_dir} is not a directory")
+        return 1
+
+    store = AlertStore(args.store)
+    outbox = EmailOutbox(make_notifier(config['email']), store=store)
+    monitor = TriggerMonitor(processor, [make_trigger(entry) for entry in config['triggers']], outbox, store)
+    monitor.restore_state()
+
+    stop_event = threading.Event()
+    if args.once:
+        stop_event.set()
+    else:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: stop_event.set())
+
+    try:
+        monitor.run(float(config.get('poll_interval_seconds', DEFAULT_POLL_INTERVAL_S)), stop_event)
+    finally:
+        # Alerts that cannot be delivered now stay in the store for the next run
+        outbox.shutdown()
+        store.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
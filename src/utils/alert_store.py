@@ -0,0 +1,174 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from .email_notifier import TriggerCondition
+
+
+class AlertStore:
+    """Durable storage for trigger conditions, their state and undelivered alert emails.
+
+    Trigger definitions are stored together with their timers and cooldown
+    (trigger_start_time, monitoring_start_time, is_active, last_triggered,
+    last_email_sent) and the time of the last evaluated sample, so a
+    restarted monitor neither forgets a running duration nor re-sends an
+    alert that is still in its cooldown, and it resumes with the samples
+    written while it was down. Alerts are
+    written to the outbox table when they are queued and removed once they
+    are delivered, so alerts that were pending or failed when the program
+    stopped can be sent after a restart.
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.synergyed_log_plotter', 'alerts.sqlite')
+    SCHEMA_VERSION = 1
+    # Alerts older than this are not re-sent after a restart
+    REPLAY_MAX_AGE = timedelta(hours=24)
+
+    TIME_FIELDS = ('trigger_start_time', 'monitoring_start_time', 'last_triggered', 'last_email_sent')
+
+    def __init__(self, store_path=None):
+        self.store_path = store_path or self.DEFAULT_PATH
+        self._lock = threading.Lock()
+        self._saved_triggers = None
+        self._conn = self._connect()
+
+    def _connect(self):
+        """Open the alert database, falling back to memory if it cannot be created"""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.store_path)), exist_ok=True)
+            conn = sqlite3.connect(self.store_path, check_same_thread=False)
+            self._create_schema(conn)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: could not open alert store {self.store_path}: {str(e)}")
+            self.store_path = ':memory:'
+            conn = sqlite3.connect(self.store_path, check_same_thread=False)
+            self._create_schema(conn)
+        return conn
+
+    def _create_schema(self, conn):
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS triggers (
+                position INTEGER PRIMARY KEY,
+                parameter_name TEXT NOT NULL,
+                condition_type TEXT NOT NULL,
+                threshold_value REAL NOT NULL,
+                duration_minutes REAL NOT NULL,
+                monitoring_type TEXT NOT NULL,
+                email_cooldown_minutes REAL NOT NULL,
+                is_active INTEGER NOT NULL,
+                trigger_start_time TEXT,
+                monitoring_start_time TEXT,
+                last_triggered TEXT,
+                last_email_sent TEXT
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                subject TEXT NOT NULL,
+                details TEXT NOT NULL,
+                queued_at TEXT NOT NULL,
+                failed INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        conn.execute("CREATE TABLE IF NOT EXISTS monitor_state (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_text(value):
+        return value.isoformat() if value is not None else None
+
+    @staticmethod
+    def _from_text(text):
+        return datetime.fromisoformat(text) if text else None
+
+    def save_triggers(self, triggers, last_sample_time=None):
+        """Store the trigger conditions and their current state, replacing the stored ones.
+
+        last_sample_time is the newest sample the triggers were evaluated on,
+        or None when monitoring is not running.
+        """
+        rows = [
+            (i, t.parameter_name, t.condition_type, t.threshold_value, t.duration_minutes,
+             t.monitoring_type, t.email_cooldown_minutes, int(t.is_active),
+             *(self._to_text(getattr(t, field)) for field in self.TIME_FIELDS))
+            for i, t in enumerate(triggers)
+        ]
+        sample_time = self._to_text(last_sample_time)
+        with self._lock:
+            if (rows, sample_time) == self._saved_triggers:
+                return  # Called after every check; most checks change nothing
+            self._conn.execute("DELETE FROM triggers")
+            self._conn.executemany("INSERT INTO triggers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.execute("INSERT OR REPLACE INTO monitor_state VALUES ('last_sample_time', ?)", (sample_time,))
+            self._conn.commit()
+            self._saved_triggers = (rows, sample_time)
+
+    def load_triggers(self):
+        """Restore the stored trigger conditions with their state"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT parameter_name, condition_type, threshold_value, duration_minutes, monitoring_type, "
+                "email_cooldown_minutes, is_active, trigger_start_time, monitoring_start_time, "
+                "last_triggered, last_email_sent FROM triggers ORDER BY position"
+            ).fetchall()
+
+        triggers = []
+        for row in rows:
+            trigger = TriggerCondition(*row[:5])
+            trigger.email_cooldown_minutes = row[5]
+            trigger.is_active = bool(row[6])
+            for field, text in zip(self.TIME_FIELDS, row[7:]):
+                setattr(trigger, field, self._from_text(text))
+            triggers.append(trigger)
+        return triggers
+
+    def load_last_sample_time(self):
+        """The newest sample evaluated before the last run stopped, or None if monitoring was stopped"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM monitor_state WHERE key = 'last_sample_time'").fetchone()
+        return self._from_text(row[0]) if row else None
+
+    def add_alert(self, subject, details):
+        """Record a queued alert. Returns its id."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO outbox (subject, details, queued_at) VALUES (?, ?, ?)",
+                (subject, details, self._to_text(datetime.now()))
+            )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def remove_alerts(self, alert_ids):
+        """Forget delivered (or deliberately dropped) alerts"""
+        with self._lock:
+            self._conn.executemany("DELETE FROM outbox WHERE id = ?", [(i,) for i in alert_ids])
+            self._conn.commit()
+
+    def mark_failed(self, alert_ids):
+        """Keep alerts whose delivery was given up on, to be retried after a restart"""
+        with self._lock:
+            self._conn.executemany("UPDATE outbox SET failed = 1 WHERE id = ?", [(i,) for i in alert_ids])
+            self._conn.commit()
+
+    def pending_alerts(self):
+        """Get the undelivered alerts that are recent enough to be sent again.
+
+        Older alerts are removed, so a long outage does not end in a flood of
+        outdated emails.
+        """
+        cutoff = self._to_text(datetime.now() - self.REPLAY_MAX_AGE)
+        with self._lock:
+            stale = self._conn.execute("SELECT COUNT(*) FROM outbox WHERE queued_at < ?", (cutoff,)).fetchone()[0]
+            if stale:
+                print(f"Warning: discarding {stale} undelivered alerts older than {self.REPLAY_MAX_AGE}")
+                self._conn.execute("DELETE FROM outbox WHERE queued_at < ?", (cutoff,))
+                self._conn.commit()
+            rows = self._conn.execute("SELECT id, subject, details FROM outbox ORDER BY id").fetchall()
+        return [{'id': row[0], 'subject': row[1], 'details': row[2]} for row in rows]
@@ -0,0 +1,92 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+# Decimal places tried, in order, for recovering the parsed values from float32; the logs use 3
+_DECIMALS = (3, 0, 1, 2, 4, 5, 6)
+
+
+def recovering_decimals(stored, parsed, decimals=None):
+    """Decimals that turn float32 values back into the parsed ones, or None if there are none.
+
+    Once a column has decimals, later blocks of it have to use the same.
+    """
+    widened = stored.astype(np.float64)
+    for candidate in ((decimals,) if decimals is not None else _DECIMALS):
+        if np.array_equal(np.round(widened, candidate), parsed, equal_nan=True):
+            return candidate
+    return None
+
+
+class CompactLogData(Mapping):
+    """Combined log data stored as one time array and one 2-D value block.
+
+    The times are int64 nanoseconds since the epoch, shared by all columns.
+    The values are one row per column in a (columns x samples) block. The
+    block is float32 when every column can be recovered exactly from it by
+    rounding to the number of decimals the log was written with (recorded
+    per column in `decimals`), and float64 otherwise.
+
+    Like a time-indexed DataFrame, data[param] gives a time-indexed Series,
+    here a view on the block rather than a copy.
+    exact_values() gives the values as parsed, e.g. for trigger thresholds.
+    """
+
+    def __init__(self, times, columns, values, decimals=None):
+        self.times = times
+        self.columns = list(columns)
+        self.values = values
+        self.decimals = decimals  # Per column, for float32 blocks; None for float64 blocks
+        self._positions = {col: i for i, col in enumerate(self.columns)}
+        self._index = None
+
+    @property
+    def index(self):
+        """DatetimeIndex over the shared time array (no copy)"""
+        import pandas as pd
+        if self._index is None:
+            self._index = pd.DatetimeIndex(self.times.view('datetime64[ns]'), name='time')
+        return self._index
+
+    @property
+    def empty(self):
+        return len(self.times) == 0 or not self.columns
+
+    @property
+    def nbytes(self):
+        return self.times.nbytes + self.values.nbytes
+
+    def column_values(self, col):
+        """The values of one column as a contiguous view on the block"""
+        return self.values[self._positions[col]]
+
+    def exact_values(self, col):
+        """The values of one column as parsed, as float64 (a copy for float32 blocks)"""
+        values = self.column_values(col)
+        if self.decimals is None:
+            return values
+        decimals = self.decimals[self._positions[col]]
+        if decimals is None:
+            return values.astype(np.float64)  # The column had no values in any file
+        return np.round(values.astype(np.float64), decimals)
+
+    def slice_rows(self, start=None, stop=None):
+        """Get a view on a range of samples"""
+        return CompactLogData(self.times[start:stop], self.columns, self.values[:, start:stop], self.decimals)
+
+    def to_frame(self):
+        """Copy the data, as parsed, into a time-indexed DataFrame"""
+        import pandas as pd
+        return pd.DataFrame({col: self.exact_values(col) for col in self.columns}, index=self.index)
+
+    def __getitem__(self, col):
+        import pandas as pd
+        if col not in self._positions:
+            raise KeyError(col)
+        return pd.Series(self.column_values(col), index=self.index, name=col, copy=False)
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __len__(self):
+        return len(self.columns)
@@ -1,7 +1,21 @@
+import io
 import os
-import pandas as pd
 from datetime import datetime
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+import numpy as np
+from .file_catalog import FileCatalog
+from .frame_cache import FrameCache
+from .offset_index import TimeOffsetIndex
+from .rollup_store import RollupStore
+from .sidecar import SidecarStore
+from .tail_reader import LogTailReader
+from .timestamps import TimestampParser, to_epoch_ns
+from .perf import perf
+
+# pandas is imported by the methods that need it rather than here, so that
+# the GUI and the headless monitor can start without waiting for it
 
 class LogDataProcessor:
     COLUMNS = [
@@ -18,10 +32,35 @@ class LogDataProcessor:
         'Stage X [um]', 'Stage Y [um]', 'Stage Z [um]', 'Stage TX [deg]'
     ]
 
-    def __init__(self):
+    # Memory budget for parsed files kept in the frame cache
+    DEFAULT_CACHE_BUDGET_MB = 512
+    # Number of files parsed concurrently by process_multiple_files
+    DEFAULT_LOAD_WORKERS = min(8, os.cpu_count() or 1)
+    # Bytes read from the end of a file at first when looking for its last line
+    TAIL_PROBE_BYTES = 4096
+    # Uncached files at least this large are only read around the requested time window
+    WINDOW_READ_MIN_BYTES = 8 * 1024 * 1024
+
+    def __init__(self, cache_budget_mb=DEFAULT_CACHE_BUDGET_MB, use_sidecars=False,
+                 load_workers=DEFAULT_LOAD_WORKERS):
         self.base_dir = r"C:\Xcalibur\log\SynergyED_DiagnosticData"
         if not os.path.exists(self.base_dir):
             self.base_dir = os.getcwd()
+        self._catalog = None
+        self._rollup_store = None
+        self.frame_cache = FrameCache(cache_budget_mb * 1024 * 1024)
+        self.tail_reader = LogTailReader(self)
+        # Optional binary sidecar files that skip text parsing on later loads
+        self.use_sidecars = use_sidecars
+        self.sidecar_store = SidecarStore()
+        # Worker pool for parallel file loading; 1 worker means serial loading
+        self.load_workers = load_workers
+        self._executor = None
+        self._executor_workers = 0
+        # Remembers the timestamp layout of each log file format variant
+        self.timestamp_parser = TimestampParser()
+        # path -> ((mtime, size), TimeOffsetIndex or None) for windowed reads of large files
+        self._offset_indexes = {}
 
     def parse_folder_name(self, folder_name):
         """Parse datetime from folder name in any supported format."""
@@ -51,57 +90,399 @@ class LogDataProcessor:
                 return None
         return None
 
-    def read_log_file(self, file_path):
-        """Read and parse an EDAutoLog.dat file"""
+    def set_cache_budget(self, cache_budget_mb):
+        """Change the memory budget of the parsed file cache"""
+        self.frame_cache.set_max_bytes(cache_budget_mb * 1024 * 1024)
+
+    def follow_file(self, file_path):
+        """Read a growing file incrementally from now on (used for the active log during live plotting)"""
+        self.tail_reader.follow(file_path)
+
+    def unfollow_all(self):
+        """Stop incremental reading of all followed files"""
+        self.tail_reader.clear()
+
+    def read_log_file(self, file_path, columns=None):
+        """Read and parse an EDAutoLog.dat file.
+
+        Parsed files are cached on (path, mtime, size), so repeated reads of an
+        unchanged file are free. Followed files only have their newly appended
+        rows parsed. The returned DataFrame is shared with the cache and must
+        not be modified in place.
+
+        Args:
+            columns: Optional parameter names to read; the other columns are
+                skipped while parsing. None reads all columns.
+        """
+        with perf.span('read_log_file'):
+            if self.tail_reader.is_following(file_path):
+                if self.tail_reader.read(file_path) is None:
+                    return None
+                return self.select_columns(self.tail_reader.frame(file_path), columns)
+
+            try:
+                stat = os.stat(file_path)
+            except OSError as e:
+                print(f"Error reading file {file_path}: {str(e)}")
+                return None
+
+            df = self.frame_cache.get(file_path, stat.st_mtime, stat.st_size, columns)
+            if df is None:
+                parse_columns = columns
+                cached_columns = self.frame_cache.cached_columns(file_path, stat.st_mtime, stat.st_size)
+                if columns is not None and cached_columns is not None:
+                    # Parse the columns cached so far as well, so the new frame serves both
+                    parse_columns = list(cached_columns) + [c for c in columns if c not in cached_columns]
+                df = self._load_log_file(file_path, stat, parse_columns)
+                if df is not None:
+                    self.frame_cache.put(file_path, stat.st_mtime, stat.st_size, df, parse_columns)
+            else:
+                perf.add('read_log_file cache hits')
+            return self.select_columns(df, columns) if df is not None else None
+
+    def select_columns(self, df, columns):
+        """Get the given columns of a frame that has them (None: all columns), in the frame's order"""
+        if columns is None:
+            return df
+        wanted = set(columns)
+        keep = [col for col in df.columns if col in wanted]
+        return df if len(keep) == len(df.columns) else df[keep]
+
+    def read_log_window(self, file_path, start_datetime=None, end_datetime=None, columns=None):
+        """Read the rows of a log file within a time window (both ends included).
+
+        Large files that are not cached are only read around the window, with
+        the help of their sparse time->offset index, so a narrow window inside
+        a huge file parses just the rows near it. Other files are read with
+        read_log_file and sliced.
+        """
+        if start_datetime is None and end_datetime is None:
+            return self.read_log_file(file_path, columns)
+
+        with perf.span('read_log_window'):
+            df = self._read_window_rows(file_path, start_datetime, end_datetime, columns)
+            if df is None:
+                df = self.read_log_file(file_path, columns)
+            if df is None:
+                return None
+            return self.slice_time_window(df, start_datetime, end_datetime)
+
+    def _read_window_rows(self, file_path, start_datetime, end_datetime, columns):
+        """Parse the part of a large file around a time window, or return None if the file should be read whole"""
+        if self.tail_reader.is_following(file_path):
+            return None
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        if stat.st_size < self.WINDOW_READ_MIN_BYTES:
+            return None
+        if self.frame_cache.contains(file_path, stat.st_mtime, stat.st_size, columns):
+            return None
+        if self.use_sidecars and self.sidecar_store.is_fresh(file_path, stat):
+            return None
+
+        bounds = self.get_time_bounds(file_path)
+        if bounds is None or ((start_datetime is None or start_datetime <= bounds[0])
+                              and (end_datetime is None or end_datetime >= bounds[1])):
+            # The window covers the whole file, which is then better read and cached in full
+            return None
+        if (start_datetime is not None and start_datetime > bounds[1]) or \
+                (end_datetime is not None and end_datetime < bounds[0]):
+            # No rows in the window; the full read keeps the column types of an empty result consistent
+            return None
+        index = self.get_offset_index(file_path, stat)
+        if index is None:
+            return None
+
+        try:
+            start, end = index.byte_range(start_datetime, end_datetime)
+            with open(file_path, 'rb') as f:
+                f.seek(start)
+                data = f.read(end - start)
+            data = data[:data.rfind(b'\n') + 1]
+            with perf.span('parse CSV'):
+                df = self.parse_rows(data, index.columns, columns)
+        except Exception as e:
+            print(f"Error reading file {file_path}: {str(e)}")
+            return None
+        perf.add('rows parsed', len(df))
+        perf.add('windowed reads')
+        # The index only samples the file; rows out of order between samples need a full read
+        return df if df.index.is_monotonic_increasing else None
+
+    def get_offset_index(self, file_path, stat=None):
+        """Get the sparse time->offset index of a log file, or None if it has no sorted data"""
+        try:
+            stat = stat or os.stat(file_path)
+        except OSError:
+            return None
+        cached = self._offset_indexes.get(file_path)
+        if cached is not None and cached[0] == (stat.st_mtime, stat.st_size):
+            return cached[1]
+
+        try:
+            index = TimeOffsetIndex.build(file_path, stat.st_size, self.parse_header_line, self._parse_line_time)
+        except Exception as e:
+            print(f"Error indexing file {file_path}: {str(e)}")
+            index = None
+        self._offset_indexes[file_path] = ((stat.st_mtime, stat.st_size), index)
+        return index
+
+    def slice_time_window(self, df, start_datetime=None, end_datetime=None):
+        """Get the rows of a time-indexed frame within [start_datetime, end_datetime].
+
+        Sorted frames are cut with a binary search on their int64 times, which
+        avoids building full-length masks; unsorted frames are masked.
+        """
+        if df.index.is_monotonic_increasing:
+            times = to_epoch_ns(df.index)
+            lo = 0 if start_datetime is None else np.searchsorted(times, to_epoch_ns(start_datetime), side='left')
+            hi = len(times) if end_datetime is None else np.searchsorted(times, to_epoch_ns(end_datetime), side='right')
+            return df.iloc[lo:hi]
+
+        if start_datetime is not None:
+            df = df[df.index >= start_datetime]
+        if end_datetime is not None:
+            df = df[df.index <= end_datetime]
+        return df
+
+    def _load_log_file(self, file_path, stat, columns=None):
+        """Load a log file from its sidecar if enabled and fresh, otherwise parse the text"""
+        if self.use_sidecars:
+            df = self.sidecar_store.read(file_path, stat, columns)
+            if df is not None:
+                return df
+
+        df = self._parse_log_file(file_path, columns)
+        # A sidecar has to hold every column, so only full parses are stored
+        if df is not None and self.use_sidecars and columns is None:
+            self.sidecar_store.write(file_path, df, stat)
+        return df
+
+    def build_sidecar(self, file_path, force=False):
+        """Parse a log file and write its sidecar. Returns True if a sidecar was written."""
+        if not force and self.sidecar_store.is_fresh(file_path):
+            return False
+        df = self._parse_log_file(file_path)
+        if df is None:
+            return False
+        return self.sidecar_store.write(file_path, df)
+
+    def _parse_log_file(self, file_path, columns=None):
+        """Parse an EDAutoLog.dat file from disk, optionally only some of its columns"""
+        import pandas as pd
         try:
             # Read the file and get header lines
             with open(file_path, 'r') as f:
                 # Skip the first line with [Jeol_MicroED 2]
                 f.readline()
                 # Read the header line with column names
-                header_line = f.readline().strip()
+                header_line = f.readline()
 
-            # Get column names from header line, removing empty strings
-            columns = [col.strip() for col in header_line.split('\t') if col.strip()]
+            header_columns = self.parse_header_line(header_line)
 
             # Read the data using the extracted column names
-            df = pd.read_csv(file_path, sep='\t', skiprows=2, names=columns, index_col=False)
-
-            # Convert timestamp column to datetime
-            df['time'] = pd.to_datetime(df['time'])
-            df.set_index('time', inplace=True)
-
-            # Convert numeric columns and handle any whitespace
-            for col in self.NUMERIC_COLUMNS:
-                if col in df.columns:
-                    # Remove any leading/trailing whitespace if column is string type
-                    if df[col].dtype == 'object':
-                        df[col] = df[col].str.strip()
-                    # Convert to numeric, handling any conversion errors
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-
+            with perf.span('parse CSV'):
+                df = pd.read_csv(file_path, sep='\t', skiprows=2, names=header_columns, index_col=False,
+                                 usecols=self._usecols(header_columns, columns))
+                df = self._convert_columns(df)
+            perf.add('rows parsed', len(df))
             return df
 
         except Exception as e:
             print(f"Error reading file {file_path}: {str(e)}")
             return None
 
+    def parse_header_line(self, header_line):
+        """Get column names from the header line, removing empty strings"""
+        return [col.strip() for col in header_line.strip().split('\t') if col.strip()]
+
+    def parse_rows(self, data, columns, usecols=None):
+        """Parse raw tab-separated data rows (bytes) into a DataFrame indexed by time.
+
+        Args:
+            columns: Names of all columns in the rows, from the header line.
+            usecols: Optional parameter names to keep; None keeps all columns.
+        """
+        import pandas as pd
+        usecols = self._usecols(columns, usecols)
+        if not data.strip():
+            df = pd.DataFrame({col: pd.Series(dtype='object') for col in usecols or columns})
+        else:
+            df = pd.read_csv(io.BytesIO(data), sep='\t', names=columns, index_col=False, usecols=usecols)
+        return self._convert_columns(df)
+
+    def _usecols(self, header_columns, columns):
+        """The time column plus the wanted columns that the file has, for read_csv(usecols=...)"""
+        if columns is None:
+            return None
+        wanted = set(columns)
+        return [col for col in header_columns if col == 'time' or col in wanted]
+
+    def _convert_columns(self, df):
+        """Convert the raw columns of a freshly read log DataFrame to their proper types"""
+        import pandas as pd
+        # Convert timestamp column to datetime; the index holds int64 nanoseconds, see to_epoch_ns
+        times = self.timestamp_parser.parse(df.pop('time'))
+        df.index = pd.DatetimeIndex(times.view('datetime64[ns]'), name='time')
+
+        # Convert numeric columns and handle any whitespace
+        for col in self.NUMERIC_COLUMNS:
+            if col in df.columns:
+                # Remove any leading/trailing whitespace if column is string type
+                if df[col].dtype == 'object':
+                    df[col] = df[col].str.strip()
+                # Convert to numeric, handling any conversion errors
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+
+        return df
+
     def extract_file_date_range(self, file_path):
         """Extract the date range from file contents"""
+        bounds = self.get_time_bounds(file_path)
+        if bounds is None:
+            return None
+        return {
+            'start': bounds[0],
+            'end': bounds[1],
+            'representative': bounds[0]  # Use first timestamp as representative
+        }
+
+    def get_time_bounds(self, file_path):
+        """Get the first and last timestamp of a log file without parsing it.
+
+        Only the first data line and the end of the file are read, so checking
+        which files overlap a time window costs the same for small and huge
+        files. Results are kept in the file catalog with the file's mtime and
+        size, so they are only read again once the file changed.
+
+        Returns:
+            (first, last) datetimes, or None if the file has no readable data.
+        """
+        return self.get_time_bounds_many([file_path])[file_path]
+
+    def get_time_bounds_many(self, file_paths):
+        """Get the time bounds of several log files with one catalog lookup.
+
+        Returns:
+            Dict mapping each path to (first, last) datetimes, or None.
+        """
+        result = {}
+        files = []
+        for file_path in file_paths:
+            try:
+                stat = os.stat(file_path)
+            except OSError as e:
+                print(f"Error reading file {file_path}: {str(e)}")
+                result[file_path] = None
+                continue
+            files.append((file_path, stat.st_mtime, stat.st_size))
+        if files:
+            result.update(self.get_catalog().time_bounds(files, self._probe_time_bounds))
+        return result
+
+    def _probe_time_bounds(self, file_path, size):
+        """Read the timestamps of the first data line and of the last complete line"""
         try:
-            df = self.read_log_file(file_path)
-            if df is not None and not df.empty:
-                return {
-                    'start': df.index[0],
-                    'end': df.index[-1],
-                    'representative': df.index[0]  # Use first timestamp as representative
-                }
+            with open(file_path, 'rb') as f:
+                # Skip the [Jeol_MicroED 2] line and the column header line
+                f.readline()
+                f.readline()
+                data_start = f.tell()
+                first_line = next((line for line in f if line.strip()), None)
+                if first_line is None:
+                    return None
+
+                # Read backwards from the end until a complete line turns up; a
+                # line without its newline may still be being written
+                last_line = None
+                block = self.TAIL_PROBE_BYTES
+                while last_line is None:
+                    start = max(data_start, size - block)
+                    f.seek(start)
+                    lines = f.read(size - start).split(b'\n')[:-1]
+                    if start > data_start:
+                        lines = lines[1:]  # Probably starts in the middle of a line
+                    last_line = next((line for line in reversed(lines) if line.strip()), None)
+                    if start == data_start:
+                        break
+                    block *= 4
+
+            last_line = last_line or first_line
+            return (self._parse_line_time(first_line), self._parse_line_time(last_line))
+
         except Exception as e:
-            print(f"Error extracting dates from {file_path}: {str(e)}")
-        return None
+            print(f"Error scanning file {file_path}: {str(e)}")
+            return None
+
+    def _parse_line_time(self, line):
+        """Parse the timestamp at the start of a raw data line"""
+        text = line.split(b'\t', 1)[0].decode().strip()
+        try:
+            # Covers the usual layout without loading pandas
+            return datetime.fromisoformat(text)
+        except ValueError:
+            import pandas as pd
+            return pd.to_datetime(text).to_pydatetime()
+
+    def get_catalog(self):
+        """Get the file catalog for the current base directory"""
+        if self._catalog is None or self._catalog.base_dir != self.base_dir:
+            if self._catalog is not None:
+                self._catalog.close()
+            self._catalog = FileCatalog(self.base_dir)
+        return self._catalog
+
+    def get_rollup_store(self):
+        """Get the rollup store for the current base directory"""
+        if self._rollup_store is None or self._rollup_store.base_dir != self.base_dir:
+            if self._rollup_store is not None:
+                self._rollup_store.close()
+            self._rollup_store = RollupStore(self.base_dir)
+        return self._rollup_store
+
+    def update_rollups(self, file_paths, progress=None):
+        """Aggregate the given files into the rollup store if they are new or changed"""
+        store = self.get_rollup_store()
+        file_paths = list(file_paths)
+        for done, file_path in enumerate(file_paths, 1):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            if not store.is_current(file_path, stat.st_mtime, stat.st_size):
+                # Bypass the frame cache so a history build does not evict recently plotted files
+                df = self.frame_cache.get(file_path, stat.st_mtime, stat.st_size)
+                if df is None:
+                    df = self._load_log_file(file_path, stat)
+                if df is not None:
+                    store.add_file(file_path, stat.st_mtime, stat.st_size, df)
+            if progress:
+                progress(done, len(file_paths))
+
+    def query_rollups(self, params, start_datetime, end_datetime, pixels, progress=None):
+        """Get pre-aggregated min/mean/max data for a long time range.
+
+        The coarsest rollup tier that still gives about one bucket per pixel is
+        used. Files in the range that have not been aggregated yet (or changed
+        since) are aggregated first.
+
+        Returns:
+            Dict mapping each parameter to a DataFrame with 'min', 'mean' and 'max' columns.
+        """
+        files = self.get_log_files(start_datetime.date(), end_datetime.date())
+        self.update_rollups([f['path'] for f in files], progress)
+        self.get_rollup_store().remove_missing(entry['path'] for entry in self.get_catalog().query())
+        tier = RollupStore.choose_tier(start_datetime, end_datetime, pixels)
+        return self.get_rollup_store().query(params, start_datetime, end_datetime, tier)
 
     def get_log_files(self, start_date=None, end_date=None):
         """Get all log files within the specified date range"""
+        with perf.span('get_log_files'):
+            return self._get_log_files(start_date, end_date)
+
+    def _get_log_files(self, start_date, end_date):
         log_files = []
         
         try:
@@ -109,91 +490,147 @@ class LogDataProcessor:
                 print(f"Warning: Base directory {self.base_dir} not found.")
                 return log_files
             
-            # Recursively look for log files in any folder structure
-            for root, _, files in os.walk(self.base_dir):
-                for filename in files:
-                    file_path = None
-                    file_date = None
-                    
-                    # Check for any potential log file
-                    if filename == 'EDAutoLog.dat' or filename.endswith('_Jeol_MicroED.dat'):
-                        file_path = os.path.join(root, filename)
-                        
-                        # Try to get date from folder name first
-                        folder_name = os.path.basename(os.path.dirname(file_path))
-                        file_date = self.parse_folder_name(folder_name)
-                        
-                        # If folder name parsing fails, extract dates from file contents
-                        if not file_date:
-                            date_info = self.extract_file_date_range(file_path)
-                            if date_info:
-                                file_date = date_info['representative']
-                    
-                    # If we found a valid file and could get its date
-                    if file_path and file_date:
-                        # Apply date range filters
-                        if start_date and file_date.date() < start_date:
-                            continue
-                        if end_date and file_date.date() > end_date:
-                            continue
-                        
-                        log_files.append({
-                            'path': file_path,
-                            'date': file_date,
-                            'folder_name': os.path.relpath(os.path.dirname(file_path), self.base_dir)
-                        })
+            # Only new or changed files are looked at again, everything else
+            # is answered from the persistent catalog
+            catalog = self.get_catalog()
+            catalog.refresh(self.parse_folder_name, self._probe_time_bounds)
+            
+            for entry in catalog.query(start_date, end_date):
+                log_files.append({
+                    'path': entry['path'],
+                    'date': entry['date'],
+                    'folder_name': entry['folder']
+                })
         
         except Exception as e:
             print(f"Error scanning log directory: {str(e)}")
         
-        # Sort files by date
-        sorted_files = sorted(log_files, key=lambda x: x['date'])
+        perf.add('log files listed', len(log_files))
         
         # Update the display names to be more informative
-        for file_info in sorted_files:
+        for file_info in log_files:
             date_str = file_info['date'].strftime('%Y-%m-%d %H:%M:%S')
             rel_path = file_info['folder_name']
             file_info['folder_name'] = f"{date_str} - {rel_path}"
         
-        return sorted_files
+        return log_files
+
+    def read_log_files(self, file_paths, progress=None, start_datetime=None, end_datetime=None, columns=None):
+        """Read several log files, in parallel if enabled.
 
-    def process_multiple_files(self, file_paths, start_datetime=None, end_datetime=None):
-        """Process multiple log files and combine their data, optionally filtering by datetime range"""
-        combined_data = {}
+        Returns the parsed DataFrames (or None for unreadable files) in the
+        same order as file_paths, exactly as reading them one by one would.
+
+        Args:
+            progress: Optional callable(done, total) invoked after each file. If it
+                raises, loading stops and the exception is passed on.
+            start_datetime, end_datetime: Optional time window to restrict the
+                frames to (see read_log_window).
+            columns: Optional parameter names to read (see read_log_file).
+        """
+        file_paths = list(file_paths)
+        read = partial(self.read_log_window, start_datetime=start_datetime, end_datetime=end_datetime,
+                       columns=columns)
+        total = len(file_paths)
+        workers = min(self.load_workers or 1, total)
+        if workers <= 1:
+            frames = []
+            for file_path in file_paths:
+                frames.append(read(file_path))
+                if progress:
+                    progress(len(frames), total)
+            return frames
         
-        for file_path in file_paths:
-            df = self.read_log_file(file_path)
+        # Threads share the frame cache and pandas releases the GIL while parsing
+        futures = {self._get_executor().submit(read, path): i for i, path in enumerate(file_paths)}
+        frames = [None] * total
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                frames[futures[future]] = future.result()
+                if progress:
+                    progress(done, total)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return frames
+
+    def _get_executor(self):
+        """Get the worker pool, recreating it if the worker count was changed"""
+        if self._executor is None or self._executor_workers != self.load_workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(max_workers=self.load_workers,
+                                                thread_name_prefix='log-loader')
+            self._executor_workers = self.load_workers
+        return self._executor
+
+    def process_multiple_files(self, file_paths, start_datetime=None, end_datetime=None, progress=None,
+                               columns=None):
+        """Process multiple log files and combine their data, optionally filtering by datetime range.
+
+        With columns given, only those parameters are parsed and returned.
+        """
+        with perf.span('process_multiple_files'):
+            return self._process_multiple_files(file_paths, start_datetime, end_datetime, progress, columns)
+
+    def _process_multiple_files(self, file_paths, start_datetime, end_datetime, progress, columns):
+        frames = []
+        
+        # Frames are restricted to the datetime range while reading, if one is specified
+        for df in self.read_log_files(file_paths, progress, start_datetime, end_datetime, columns):
             if df is None:
                 continue
                 
-            # Apply datetime filtering if specified
-            if start_datetime is not None or end_datetime is not None:
-                if start_datetime is not None:
-                    df = df[df.index >= start_datetime]
-                if end_datetime is not None:
-                    df = df[df.index <= end_datetime]
-                
-                # Skip file if no data remains after filtering
-                if df.empty:
-                    continue
+            # Skip file if no data remains after filtering
+            if (start_datetime is not None or end_datetime is not None) and df.empty:
+                continue
                 
-            # Initialize combined data on first file
-            if not combined_data:
-                for col in df.columns:
-                    combined_data[col] = df[col]
-            else:
-                # Add data from subsequent files
-                for col in df.columns:
-                    if col in combined_data:
-                        combined_data[col] = pd.concat([combined_data[col], df[col]])
+            frames.append(df)
         
-        # If we have combined data, sort by index (datetime) to ensure proper chronological order
-        if combined_data:
-            # Create a DataFrame from the combined data and sort by index
-            result_df = pd.DataFrame(combined_data)
-            result_df = result_df.sort_index()
-            
-            # Convert back to the expected dictionary format with Series
-            combined_data = {col: result_df[col] for col in result_df.columns}
+        result_df = self.merge_frames(frames)
+        if result_df is None:
+            return None
         
-        return combined_data if combined_data else None
+        # Convert to the expected dictionary format with Series
+        return {col: result_df[col] for col in result_df.columns}
+
+    def merge_frames(self, frames):
+        """Combine per-file frames into a single chronologically sorted frame.
+
+        The columns of the first frame are used for the result. Log files
+        normally cover consecutive, non-overlapping time spans, in which case a
+        single concatenation already is in order and no sort is needed.
+        Otherwise the concatenated runs are merged with a stable sort.
+        """
+        import pandas as pd
+        if not frames:
+            return None
+        
+        columns = frames[0].columns
+        non_empty = [
+            df if df.columns.equals(columns) else df.reindex(columns=columns)
+            for df in frames if not df.empty
+        ]
+        if not non_empty:
+            return frames[0]
+        with perf.span('merge frames'):
+            if len(non_empty) == 1:
+                result_df = non_empty[0]
+            else:
+                result_df = pd.concat(non_empty)
+            
+            if not self._is_chronological(non_empty):
+                result_df = result_df.sort_index(kind='stable')
+        return result_df
+
+    def _is_chronological(self, frames):
+        """Check that every frame is sorted and starts no earlier than the previous one ends"""
+        previous_end = None
+        for df in frames:
+            if not df.index.is_monotonic_increasing:
+                return False
+            if previous_end is not None and df.index[0] < previous_end:
+                return False
+            previous_end = df.index[-1]
+        return True
@@ -0,0 +1,57 @@
+import numpy as np
+
+
+def minmax_decimate_indices(x, y, n_buckets, x_min=None, x_max=None):
+    """Select the samples needed to draw a series at a given horizontal resolution.
+
+    This is M4 decimation: the view [x_min, x_max] is split into n_buckets
+    equal-width buckets (typically one per pixel column) and for every bucket
+    the first, last, minimum and maximum sample is kept. The drawn line is
+    then visually identical to the full-resolution one, so short spikes stay
+    visible. One sample on either side of the view is kept so lines run to
+    the edges.
+
+    Args:
+        x: Sorted numeric sample positions (e.g. matplotlib date numbers).
+        y: Sample values, same length as x. NaN values are never chosen as min/max.
+        n_buckets: Number of buckets across the view.
+        x_min, x_max: View range; defaults to the range of x.
+
+    Returns:
+        Sorted integer array of the indices to keep.
+    """
+    n = len(x)
+    if n == 0:
+        return np.arange(0)
+    if n > 1 and np.any(x[1:] < x[:-1]):
+        # Bucketing relies on sorted positions; unsorted data is drawn as is
+        return np.arange(n)
+
+    x_min = x[0] if x_min is None else x_min
+    x_max = x[-1] if x_max is None else x_max
+
+    # Restrict to the view plus one neighbouring sample on each side
+    lo = max(int(np.searchsorted(x, x_min, side='left')) - 1, 0)
+    hi = min(int(np.searchsorted(x, x_max, side='right')) + 1, n)
+    if hi - lo <= 4 * n_buckets or x_max <= x_min:
+        return np.arange(lo, hi)
+
+    xs = np.asarray(x[lo:hi], dtype=np.float64)
+    ys = np.asarray(y[lo:hi])  # float32 data is bucketed as is
+
+    buckets = ((xs - x_min) * (n_buckets / (x_max - x_min))).astype(np.int64)
+    np.clip(buckets, -1, n_buckets, out=buckets)  # -1/n_buckets hold the edge neighbours
+
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+    ends = np.concatenate((starts[1:], [len(xs)])) - 1
+    counts = ends - starts + 1
+
+    keep = [starts, ends]
+    for reduce in (np.fmin, np.fmax):
+        extreme = np.repeat(reduce.reduceat(ys, starts), counts)
+        candidates = np.flatnonzero(ys == extreme)
+        # First matching sample of each bucket
+        _, first = np.unique(buckets[candidates], return_index=True)
+        keep.append(candidates[first])
+
+    return np.unique(np.concatenate(keep)) + lo
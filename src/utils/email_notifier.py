@@ -1,12 +1,15 @@
-import smtplib
-import ssl
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 import logging
+import threading
+
+from .perf import perf
 
 class EmailNotifier:
-    """Handles email notifications for SynergyED Log Plotter alerts"""
+    """Handles email notifications for SynergyED Log Plotter alerts
+
+    smtplib, ssl and the email package are only imported once an email is
+    actually built or sent, so they do not slow down program startup.
+    """
     
     def __init__(self):
         self.smtp_server = ""
@@ -14,80 +17,135 @@ class EmailNotifier:
         self.sender_email = ""
         self.sender_password = ""
         self.recipient_email = ""
+        self.use_tls = True
         self.is_configured = False
         
+        # The SMTP session is kept open between alerts and shared by all senders
+        self._server = None
+        self._server_lock = threading.Lock()
+        
         # Set up logging
         self.logger = logging.getLogger(__name__)
         
-    def configure_smtp(self, smtp_server, smtp_port, sender_email, sender_password):
+    def configure_smtp(self, smtp_server, smtp_port, sender_email, sender_password, use_tls=True):
         """Configure SMTP settings for sending emails"""
+        self.close_connection()
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.sender_email = sender_email
         self.sender_password = sender_password
+        self.use_tls = use_tls
         self.is_configured = True
         
     def set_recipient(self, recipient_email):
         """Set the recipient email address"""
         self.recipient_email = recipient_email
         
+    def _connect(self):
+        """Open an SMTP session; STARTTLS and login are skipped for plain local servers"""
+        import smtplib
+        import ssl
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
+        try:
+            if self.use_tls:
+                server.starttls(context=ssl.create_default_context())
+            if self.sender_password:
+                server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+        
+    def close_connection(self):
+        """Close the kept-open SMTP session, if any"""
+        with self._server_lock:
+            if self._server is not None:
+                try:
+                    self._server.quit()
+                except Exception:
+                    self._server.close()
+                self._server = None
+        
     def test_connection(self):
         """Test the email configuration by attempting to connect"""
         if not self.is_configured:
             return False, "Email not configured"
             
         try:
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls(context=context)
-                server.login(self.sender_email, self.sender_password)
-                return True, "Connection successful"
+            server = self._connect()
+            server.quit()
+            return True, "Connection successful"
         except Exception as e:
             return False, f"Connection failed: {str(e)}"
             
-    def send_alert(self, subject, message, parameter_name=None, value=None, threshold=None):
-        """Send an alert email"""
-        if not self.is_configured or not self.recipient_email:
-            self.logger.error("Email not properly configured")
-            return False
-            
-        try:
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = self.sender_email
-            msg['To'] = self.recipient_email
-            msg['Subject'] = f"SynergyED Alert: {subject}"
-            
-            # Create email body
-            body = f"""
-SynergyED Log Plotter Alert
-
-Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
+    def format_alert(self, message, parameter_name=None, value=None, threshold=None):
+        """Format the details of a single alert for an email body"""
+        details = f"""
 Alert Details:
 {message}
 """
-            
-            if parameter_name and value is not None and threshold is not None:
-                body += f"""
+        if parameter_name and value is not None and threshold is not None:
+            details += f"""
 Parameter: {parameter_name}
 Current Value: {value}
 Threshold: {threshold}
 """
-            
-            body += """
+        return details
+        
+    def build_message(self, subject, details):
+        """Create an alert email from one or more formatted alerts"""
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        msg = MIMEMultipart()
+        msg['From'] = self.sender_email
+        msg['To'] = self.recipient_email
+        msg['Subject'] = f"SynergyED Alert: {subject}"
+        
+        # Create email body
+        body = f"""
+SynergyED Log Plotter Alert
+
+Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+"""
+        body += "\n".join(details)
+        body += """
 This is an automated message from SynergyED Log Plotter.
 """
+        
+        msg.attach(MIMEText(body, 'plain'))
+        return msg
+        
+    def send_message(self, msg):
+        """Send an email over the kept-open SMTP session, reconnecting if the server dropped it.
+
+        Raises the SMTP or socket error if sending fails.
+        """
+        import smtplib
+        with perf.span('send_alert (SMTP)'), self._server_lock:
+            reused = self._server is not None
+            if not reused:
+                self._server = self._connect()
+            try:
+                self._server.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError):
+                self._server.close()
+                self._server = None
+                if not reused:
+                    raise
+                # Idle sessions are often closed by the server; retry once on a fresh one
+                self._server = self._connect()
+                self._server.send_message(msg)
+            perf.add('emails sent')
             
-            msg.attach(MIMEText(body, 'plain'))
+    def send_alert(self, subject, message, parameter_name=None, value=None, threshold=None):
+        """Send an alert email"""
+        if not self.is_configured or not self.recipient_email:
+            self.logger.error("Email not properly configured")
+            return False
             
-            # Send email
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls(context=context)
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
-                
+        try:
+            msg = self.build_message(subject, [self.format_alert(message, parameter_name, value, threshold)])
+            self.send_message(msg)
             self.logger.info(f"Alert email sent successfully to {self.recipient_email}")
             return True
             
@@ -117,6 +175,11 @@ class TriggerCondition:
         self.last_email_sent = None  # Track when last email was sent
         self.email_cooldown_minutes = 30  # 30-minute cooldown between emails
         
+    def definition(self):
+        """The settings that make up the trigger, without its monitoring state"""
+        return (self.parameter_name, self.condition_type, self.threshold_value,
+                self.duration_minutes, self.monitoring_type, self.email_cooldown_minutes)
+        
     def check_condition(self, current_value, current_time):
         """Check if the trigger condition is met"""
         if current_value is None:
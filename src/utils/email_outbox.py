@@ -0,0 +1,166 @@
+import logging
+import threading
+from collections import deque
+
+
+class EmailOutbox:
+    """Delivers alert emails from a background thread.
+
+    Queuing an alert never blocks the caller. The worker waits BATCH_WINDOW_S
+    after the first alert so that alerts raised together (e.g. several
+    triggers firing in the same check) go out as one email, sends over the
+    notifier's kept-open SMTP session and retries failed deliveries with
+    increasing delays. The outbox holds at most max_size alerts; when it is
+    full the oldest alert is dropped.
+
+    With an AlertStore, queued alerts are also written to disk until they are
+    delivered, and alerts left over from a previous run are queued again on
+    start. Alerts wait while the notifier is not configured.
+    """
+
+    MAX_SIZE = 100
+    BATCH_WINDOW_S = 1.0
+    # Delays before each retry; a batch is dropped after the last one fails
+    RETRY_DELAYS_S = (5, 15, 60, 300)
+    # Close the SMTP session after this long without alerts
+    IDLE_CLOSE_S = 120
+
+    def __init__(self, notifier, max_size=MAX_SIZE, on_result=None, store=None):
+        """
+        Args:
+            notifier: EmailNotifier with the SMTP settings and recipient.
+            max_size: Maximum number of alerts waiting for delivery.
+            on_result: Optional callable(success, subject), called from the worker
+                thread after each delivered or dropped email.
+            store: Optional AlertStore that keeps undelivered alerts across restarts.
+        """
+        self._notifier = notifier
+        self.max_size = max_size
+        self.on_result = on_result
+        self.store = store
+        self.logger = logging.getLogger(__name__)
+
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._stopping = False
+        if store is not None:
+            replayed = store.pending_alerts()
+            if replayed:
+                self.logger.info(f"Re-queuing {len(replayed)} undelivered alerts from the last run")
+            self._queue.extend(replayed[-max_size:])
+        self._thread = threading.Thread(target=self._run, name='EmailOutbox', daemon=True)
+        self._thread.start()
+
+    @property
+    def notifier(self):
+        return self._notifier
+
+    @notifier.setter
+    def notifier(self, notifier):
+        with self._condition:
+            previous = self._notifier
+            if previous is not notifier:
+                # Do not leave the old SMTP session open; waits for a send in progress to finish
+                previous.close_connection()
+            self._notifier = notifier
+            # Alerts that waited for a configured notifier can be sent now
+            self._condition.notify()
+
+    def _can_send(self):
+        return self._notifier.is_configured and bool(self._notifier.recipient_email)
+
+    def queue_alert(self, subject, message, parameter_name=None, value=None, threshold=None):
+        """Queue an alert email for delivery. Returns False if email is not configured."""
+        if not self._can_send():
+            self.logger.error("Email not properly configured")
+            return False
+
+        alert = {
+            'subject': subject,
+            'details': self.notifier.format_alert(message, parameter_name, value, threshold),
+        }
+        if self.store is not None:
+            alert['id'] = self.store.add_alert(alert['subject'], alert['details'])
+
+        with self._condition:
+            if len(self._queue) >= self.max_size:
+                dropped = self._queue.popleft()
+                self.logger.warning(f"Email outbox full, dropping alert: {dropped['subject']}")
+                self._forget([dropped])
+            self._queue.append(alert)
+            self._condition.notify()
+        return True
+
+    def pending(self):
+        """Number of alerts waiting for delivery"""
+        with self._condition:
+            return len(self._queue)
+
+    def shutdown(self, timeout=5.0):
+        """Stop the worker, making one last attempt to deliver queued alerts"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join(timeout)
+        self.notifier.close_connection()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                ready = self._queue and self._can_send()
+                if not ready and not self._stopping:
+                    self._condition.wait(self.IDLE_CLOSE_S)
+                    ready = self._queue and self._can_send()
+                if not ready:
+                    if self._stopping:
+                        return  # Alerts that could not be sent stay in the store
+                    batch = None
+                else:
+                    # Give alerts raised together a moment to arrive, then send them as one email
+                    self._condition.wait_for(lambda: self._stopping, self.BATCH_WINDOW_S)
+                    batch = list(self._queue)
+                    self._queue.clear()
+
+            if batch is None:
+                # Nothing to send for a while; do not hold on to the server's connection
+                self.notifier.close_connection()
+            else:
+                self._deliver(batch)
+
+    def _deliver(self, batch):
+        if len(batch) == 1:
+            subject = batch[0]['subject']
+        else:
+            subject = f"{len(batch)} alerts ({', '.join(alert['subject'] for alert in batch)})"
+        msg = self.notifier.build_message(subject, [alert['details'] for alert in batch])
+
+        for delay in (0,) + self.RETRY_DELAYS_S:
+            if delay:
+                with self._condition:
+                    if self._condition.wait_for(lambda: self._stopping, delay):
+                        break
+            try:
+                self.notifier.send_message(msg)
+                self.logger.info(f"Alert email sent successfully to {self.notifier.recipient_email}")
+                self._forget(batch)
+                self._report(True, subject)
+                return
+            except Exception as e:
+                self.logger.warning(f"Failed to send email: {str(e)}")
+                self.notifier.close_connection()
+
+        self.logger.error(f"Giving up on alert email: {subject}")
+        if self.store is not None:
+            self.store.mark_failed([alert['id'] for alert in batch if 'id' in alert])
+        self._report(False, subject)
+
+    def _forget(self, alerts):
+        if self.store is not None:
+            self.store.remove_alerts([alert['id'] for alert in alerts if 'id' in alert])
+
+    def _report(self, success, subject):
+        if self.on_result is not None:
+            try:
+                self.on_result(success, subject)
+            except Exception as e:
+                self.logger.error(f"Error reporting email result: {str(e)}")
@@ -0,0 +1,265 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+class FileCatalog:
+    """Persistent index of the log files found below a log directory.
+
+    The catalog is a small SQLite database stored next to the log folders. It
+    remembers path, mtime, size, date and first/last timestamp per file, so
+    a rescan only has to look at files that are new or changed since the
+    last scan, and time windows can be matched to files without opening them.
+    """
+
+    CATALOG_NAME = '.synergyed_log_catalog.sqlite'
+    SCHEMA_VERSION = 2
+    # Directory mtimes this recent are not trusted, as some file systems only keep whole seconds
+    DIR_MTIME_SLACK = 2.0
+
+    def __init__(self, base_dir, catalog_path=None):
+        self.base_dir = base_dir
+        self.catalog_path = catalog_path or os.path.join(base_dir, self.CATALOG_NAME)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        # Directory -> (mtime, log file paths, subdirectories) as of the last refresh
+        self._dirs = {}
+
+    def _connect(self):
+        """Open the catalog database, falling back to memory if the directory is read-only"""
+        try:
+            conn = sqlite3.connect(self.catalog_path, check_same_thread=False)
+            self._create_schema(conn)
+        except sqlite3.Error as e:
+            print(f"Warning: could not open file catalog {self.catalog_path}: {str(e)}")
+            self.catalog_path = ':memory:'
+            conn = sqlite3.connect(self.catalog_path, check_same_thread=False)
+            self._create_schema(conn)
+        return conn
+
+    def _create_schema(self, conn):
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            # The catalog is only a cache, so an outdated layout is simply rebuilt
+            conn.execute("DROP TABLE IF EXISTS files")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                folder TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                file_date TEXT,
+                first_time TEXT,
+                last_time TEXT,
+                bounds_checked INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS files_file_date ON files (file_date)")
+        conn.execute("CREATE INDEX IF NOT EXISTS files_first_time ON files (first_time)")
+        conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        conn.commit()
+
+    @staticmethod
+    def is_log_file(filename):
+        """Check whether a file name looks like a SynergyED log file"""
+        return filename == 'EDAutoLog.dat' or filename.endswith('_Jeol_MicroED.dat')
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def refresh(self, folder_date_parser, bounds_probe):
+        """Bring the catalog in line with the directory tree.
+
+        Only directories whose mtime changed since the previous refresh (a file
+        was added, removed or renamed in them) have their files stat'ed again,
+        so refreshing an unchanged tree costs one stat per directory. Files
+        growing in place are not noticed here; time_bounds() checks those.
+        Files that could not be placed in time yet (e.g. a manual run's file
+        in an undated folder that only had its header) are stat'ed on every
+        refresh, so they are probed again once they have data.
+
+        Args:
+            folder_date_parser: Callable returning a datetime for a folder name, or None.
+            bounds_probe: Callable(file_path, size) returning the (first, last)
+                timestamps of a file, or None if it has no readable data.
+        """
+        with self._lock:
+            known = {}
+            undated = set()
+            for path, mtime, size, file_date in self._conn.execute("SELECT path, mtime, size, file_date FROM files"):
+                known[path] = (mtime, size)
+                if file_date is None:
+                    undated.add(path)
+
+        found = {}
+        dirs = {}
+        now = time.time()
+        pending = [self.base_dir]
+        while pending:
+            root = pending.pop()
+            try:
+                dir_mtime = os.stat(root).st_mtime
+            except OSError:
+                continue
+            previous = self._dirs.get(root)
+            if previous is not None and previous[0] == dir_mtime and all(p in known for p in previous[1]):
+                # Nothing was added or removed here, so neither the listing nor the files need a look
+                dirs[root] = previous
+                for path in previous[1]:
+                    found[path] = known[path]
+                    if path in undated:
+                        try:
+                            stat = os.stat(path)
+                            found[path] = (stat.st_mtime, stat.st_size)
+                        except OSError:
+                            pass
+                pending.extend(previous[2])
+                continue
+
+            dir_files = []
+            subdirs = []
+            try:
+                entries = list(os.scandir(root))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif self.is_log_file(entry.name):
+                        stat = entry.stat()
+                        found[entry.path] = (stat.st_mtime, stat.st_size)
+                        dir_files.append(entry.path)
+                except OSError:
+                    continue
+            pending.extend(subdirs)
+            if now - dir_mtime > self.DIR_MTIME_SLACK:
+                dirs[root] = (dir_mtime, dir_files, subdirs)
+        self._dirs = dirs
+
+        removed = [path for path in known if path not in found]
+        changed = [path for path, stat in found.items() if known.get(path) != stat]
+        if not removed and not changed:
+            return
+
+        rows = []
+        for file_path in changed:
+            mtime, size = found[file_path]
+            folder = os.path.dirname(file_path)
+            file_date = folder_date_parser(os.path.basename(folder))
+            # Files without a dated folder need their contents to be placed in time;
+            # for all others the time bounds are filled in by time_bounds() when needed
+            checked = file_date is None
+            bounds = bounds_probe(file_path, size) if checked else None
+            if checked:
+                file_date = bounds[0] if bounds else None
+            rows.append(self._make_row(file_path, folder, mtime, size, file_date, bounds, checked))
+
+        with self._lock:
+            self._conn.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in removed])
+            self._conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def _make_row(self, file_path, folder, mtime, size, file_date, bounds, checked):
+        return (
+            file_path,
+            os.path.relpath(folder, self.base_dir),
+            mtime,
+            size,
+            self._to_text(file_date),
+            self._to_text(bounds[0]) if bounds else None,
+            self._to_text(bounds[1]) if bounds else None,
+            int(checked),
+        )
+
+    def time_bounds(self, files, bounds_probe):
+        """Get the first and last timestamp of files, probing those the catalog has none for.
+
+        Bounds are stored with the mtime and size the file had when it was
+        probed, so a file that changed since (e.g. the log being written) is
+        probed again. Files that are not in the catalog are probed every time.
+
+        Args:
+            files: (path, mtime, size) of each file.
+            bounds_probe: Callable(file_path, size) returning (first, last), or None
+                if the file has no readable data.
+
+        Returns:
+            Dict mapping each path to (first, last) datetimes, or None.
+        """
+        files = list(files)
+        stored = {}
+        paths = [path for path, _, _ in files]
+        with self._lock:
+            # Stay below SQLite's limit on the number of query parameters
+            for i in range(0, len(paths), 500):
+                chunk = paths[i:i + 500]
+                stored.update(
+                    (path, row) for path, *row in self._conn.execute(
+                        "SELECT path, mtime, size, first_time, last_time, bounds_checked FROM files "
+                        f"WHERE path IN ({', '.join('?' * len(chunk))})", chunk
+                    )
+                )
+
+        result = {}
+        updates = []
+        for path, mtime, size in files:
+            row = stored.get(path)
+            if row is not None and row[4] and (row[0], row[1]) == (mtime, size):
+                result[path] = (self._from_text(row[2]), self._from_text(row[3])) if row[2] else None
+                continue
+            bounds = bounds_probe(path, size)
+            result[path] = bounds
+            if row is not None:
+                # Empty or unreadable files are remembered as well, so they are not probed again
+                updates.append((mtime, size, self._to_text(bounds[0]) if bounds else None,
+                                self._to_text(bounds[1]) if bounds else None, path))
+
+        if updates:
+            with self._lock:
+                self._conn.executemany(
+                    "UPDATE files SET mtime = ?, size = ?, first_time = ?, last_time = ?, bounds_checked = 1 "
+                    "WHERE path = ?", updates
+                )
+                self._conn.commit()
+        return result
+
+    def query(self, start_date=None, end_date=None):
+        """Return catalog entries whose representative date lies within the date range.
+
+        The representative date is the folder date, or the first timestamp in
+        the file when the folder name carries no date. Entries are sorted by date.
+        """
+        sql = "SELECT path, folder, file_date FROM files WHERE file_date IS NOT NULL"
+        params = []
+        if start_date:
+            sql += " AND file_date >= ?"
+            params.append(start_date.strftime('%Y-%m-%d'))
+        if end_date:
+            sql += " AND file_date < ?"
+            params.append((end_date + timedelta(days=1)).strftime('%Y-%m-%d'))
+        sql += " ORDER BY file_date, path"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._to_entry(row) for row in rows]
+
+    def _to_entry(self, row):
+        path, folder, file_date = row
+        return {
+            'path': path,
+            'folder': folder,
+            'date': self._from_text(file_date),
+        }
+
+    @staticmethod
+    def _to_text(value):
+        # ISO text sorts chronologically, which keeps the range queries on the index
+        return value.strftime('%Y-%m-%d %H:%M:%S.%f') if value is not None else None
+
+    @staticmethod
+    def _from_text(value):
+        return datetime.fromisoformat(value) if value is not None else None
@@ -0,0 +1,95 @@
+import threading
+from collections import OrderedDict
+
+
+class FrameCache:
+    """Memory-bounded LRU cache of parsed log file DataFrames.
+
+    Entries are keyed on the file path and tagged with the (mtime, size) the
+    file had when it was parsed, so a file that changes on disk is re-read
+    instead of being served stale. A frame parsed with only some of the
+    columns is tagged with those columns and serves requests for them only.
+    Cached frames are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # path -> (signature, frame, nbytes, columns or None for all)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def get(self, file_path, mtime, size, columns=None):
+        """Return the cached frame for a file if it is still current and has the columns (None: all), else None"""
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is None or entry[0] != (mtime, size) or not self._covers(entry[3], columns):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(file_path)
+            self.hits += 1
+            return entry[1]
+
+    def contains(self, file_path, mtime, size, columns=None):
+        """Check whether a current frame for a file is cached, without counting a hit or miss"""
+        with self._lock:
+            entry = self._entries.get(file_path)
+            return entry is not None and entry[0] == (mtime, size) and self._covers(entry[3], columns)
+
+    def cached_columns(self, file_path, mtime, size):
+        """Get the columns of a current cached frame that holds only some columns, else None"""
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is None or entry[0] != (mtime, size):
+                return None
+            return entry[3]
+
+    @staticmethod
+    def _covers(cached_columns, columns):
+        if cached_columns is None:
+            return True
+        return columns is not None and set(columns) <= set(cached_columns)
+
+    def put(self, file_path, mtime, size, frame, columns=None):
+        """Store a parsed frame, evicting the least recently used entries if needed.
+
+        Args:
+            columns: The columns the frame was parsed with, or None if it has all of them.
+        """
+        nbytes = int(frame.memory_usage(index=True).sum())
+        with self._lock:
+            self._discard(file_path)
+            if nbytes > self.max_bytes:
+                # Frames larger than the whole budget are never cached
+                return
+            self._entries[file_path] = ((mtime, size), frame, nbytes, tuple(columns) if columns is not None else None)
+            self._total_bytes += nbytes
+            while self._total_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+
+    def invalidate(self, file_path=None):
+        """Drop one file from the cache, or everything if no path is given"""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                self._total_bytes = 0
+            else:
+                self._discard(file_path)
+
+    def set_max_bytes(self, max_bytes):
+        """Change the memory budget, evicting entries that no longer fit"""
+        with self._lock:
+            self.max_bytes = max_bytes
+            while self._entries and self._total_bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+
+    def _discard(self, file_path):
+        entry = self._entries.pop(file_path, None)
+        if entry is not None:
+            self._total_bytes -= entry[2]
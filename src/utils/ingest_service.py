@@ -0,0 +1,157 @@
+import threading
+
+from .perf import perf
+
+
+class IngestUpdate:
+    """The rows a poll read from the newest log file"""
+
+    def __init__(self, file_path, new_rows, reader):
+        self.file_path = file_path
+        self.new_rows = new_rows  # Rows added by this poll, possibly none
+        self._reader = reader
+        self._frame = None
+
+    @property
+    def frame(self):
+        """All rows of the file read so far, combined on first use"""
+        if self._frame is None:
+            self._frame = self._reader.frame(self.file_path)
+        return self._frame
+
+    @property
+    def has_new_rows(self):
+        return self.new_rows is not None and not self.new_rows.empty
+
+    @property
+    def latest(self):
+        """The most recent sample as a Series, or None if the file has no rows yet"""
+        if self.has_new_rows:
+            return self.new_rows.iloc[-1]
+        if self.frame is None or self.frame.empty:
+            return None
+        return self.frame.iloc[-1]
+
+
+class LogIngestService:
+    """Single reader of the log file that is currently being written.
+
+    poll() finds the newest log file and reads only the bytes appended since
+    the previous poll, so every sample is read from disk once no matter how
+    many consumers use it. When a new log file is started, the rows written
+    to the previous one since the last poll are read first, so none are
+    missed. publish() hands the results to all subscribers
+    (e.g. live plotting, trigger evaluation, status displays). Polling can run
+    on a worker thread; publishing happens on whichever thread the consumers
+    expect to be called on.
+    """
+
+    def __init__(self, processor):
+        self.processor = processor
+        self.latest_update = None
+        self._followed = None  # The newest log file as of the previous poll
+        # path -> tail reader position of the rows published so far. Plot loads read the
+        # same files through the tail reader, so its own progress is not what was published.
+        self._positions = {}
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback):
+        """Call callback(update) for every published update"""
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def poll(self, progress=None):
+        """Read the rows appended to the newest log file.
+
+        Returns:
+            List of IngestUpdates, oldest file first: one for the newest log
+            file, preceded by one for the previously newest file if a new file
+            was started since the last poll. Empty if there is no readable log file.
+        """
+        with perf.span('ingest poll'):
+            files = self.processor.get_log_files()
+            if not files:
+                return []
+
+            file_path = files[-1]['path']
+            previous = self._followed
+            updates = []
+            if previous is not None and previous != file_path and previous in self._positions:
+                # Read the previous file up to its end before following the new one, which
+                # can make the tail reader drop it
+                updates.append(self._read(previous))
+            self.processor.follow_file(file_path)
+            updates.append(self._read(file_path))
+            self._followed = file_path
+            self._positions = {path: position for path, position in self._positions.items() if path == file_path}
+        return [update for update in updates if update is not None]
+
+    def _read(self, file_path):
+        """Read a file and get an IngestUpdate with the rows not published before, or None"""
+        tail_reader = self.processor.tail_reader
+        new_rows, position = tail_reader.read_after(file_path, self._positions.get(file_path))
+        if new_rows is None:
+            return None
+        self._positions[file_path] = position
+        return IngestUpdate(file_path, new_rows, tail_reader)
+
+    def read_since(self, since):
+        """Read the rows written after a point in time, e.g. while nobody was polling.
+
+        Every log file with rows after `since` is read from there on, so rows
+        written to older files during a restart are not skipped. The newest
+        file is read through the tail reader, so the next poll() continues
+        where this left off. The files' rows are merged in time order, as the
+        trigger evaluator skips rows older than the newest one it has seen.
+
+        Returns:
+            List with one time-indexed DataFrame, or an empty list.
+        """
+        with perf.span('ingest read_since'):
+            files = self.processor.get_log_files()
+            if not files:
+                return []
+
+            self._followed = files[-1]['path']
+            self.processor.follow_file(self._followed)
+            paths = [f['path'] for f in files[:-1]]
+            bounds = self.processor.get_time_bounds_many(paths)
+            frames = []
+            for path in paths:
+                if bounds[path] is None or bounds[path][1] <= since:
+                    continue
+                df = self.processor.read_log_window(path, since)
+                if df is not None and not df.empty:
+                    frames.append(df)
+
+            # The newest file is read like a poll, so the next poll() continues after these rows
+            self._positions = {}
+            new_rows, position = self.processor.tail_reader.read_after(self._followed)
+            if new_rows is not None:
+                self._positions[self._followed] = position
+                new_rows = self.processor.slice_time_window(new_rows, since)
+                if not new_rows.empty:
+                    frames.append(new_rows)
+            merged = self.processor.merge_frames(frames)
+        return [] if merged is None else [merged]
+
+    def publish(self, updates):
+        """Hand the updates from poll() to all subscribers, in order"""
+        for update in updates:
+            with self._lock:
+                self.latest_update = update
+                subscribers = list(self._subscribers)
+
+            for callback in subscribers:
+                try:
+                    callback(update)
+                except Exception as e:
+                    # One failing consumer must not keep the others from their data
+                    print(f"Error handling new log data: {str(e)}")
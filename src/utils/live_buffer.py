@@ -0,0 +1,197 @@
+import os
+import tempfile
+from datetime import timedelta
+
+import numpy as np
+
+from .compact_data import CompactLogData, recovering_decimals
+from .timestamps import to_epoch_ns
+
+
+class LiveRingBuffer:
+    """Fixed-capacity store of the newest live samples in a memory-mapped file.
+
+    Samples older than the retention window before the newest one, and the
+    oldest beyond `capacity` rows, are dropped as new rows arrive, so a live
+    plot keeps a bounded amount of data however long it runs. The rows are
+    laid out like CompactLogData: an int64 time array and a (columns x rows)
+    float32 block, widened to float64 if a column cannot be stored exactly.
+    Being file-backed, pages that are not being plotted can be written out by
+    the operating system instead of staying in RAM.
+
+    The file holds twice the capacity. Rows are written after the newest one,
+    and once the end is reached the retained rows are moved back to the start
+    in one copy, so views stay contiguous and each row is moved at most once
+    per `capacity` rows written. The move overwrites the memory behind views
+    handed out earlier; `generation` counts the moves so users can tell.
+    """
+
+    DEFAULT_DIR = os.path.join(os.path.expanduser('~'), '.synergyed_log_plotter')
+
+    def __init__(self, columns, capacity, retention, directory=DEFAULT_DIR):
+        if not columns:
+            raise ValueError("A live buffer needs at least one column")
+        self.columns = list(columns)
+        self.capacity = capacity
+        self.retention = retention
+        self.directory = directory
+        self.generation = 0
+        self.times = self.values = self.decimals = None
+        self._retention_ns = retention // timedelta(microseconds=1) * 1000
+        self._start = self._end = 0
+        self._files = []  # [file_path, position of its first row], oldest first
+        self._file = None
+        self._allocate(np.float32)
+
+    def _allocate(self, dtype):
+        """Create the memory-mapped storage, copying over the retained rows"""
+        rows = 2 * self.capacity
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            f = tempfile.TemporaryFile(prefix='live_buffer_', dir=self.directory)
+        except OSError as e:
+            print(f"Warning: could not create the live buffer in {self.directory}: {str(e)}")
+            f = tempfile.TemporaryFile(prefix='live_buffer_')
+        f.truncate(rows * (8 + len(self.columns) * np.dtype(dtype).itemsize))
+        times = np.memmap(f, dtype=np.int64, mode='r+', shape=(rows,))
+        values = np.memmap(f, dtype=dtype, mode='r+', offset=rows * 8, shape=(len(self.columns), rows))
+
+        count = len(self)
+        if count:
+            times[:count] = self.times[self._start:self._end]
+            for i, d in enumerate(self.decimals or [None] * len(self.columns)):
+                column = self.values[i, self._start:self._end]
+                # Widened float32 values are rounded back to the values they were parsed as
+                values[i, :count] = column if d is None else np.round(column.astype(np.float64), d)
+            self._move_files(-self._start)
+        if self._file is not None:
+            # Views handed out earlier keep the old mapping alive until they are gone
+            self._file.close()
+        self._file = f
+        self.times, self.values = times, values
+        self._start, self._end = 0, count
+        if values.dtype != np.float32:
+            self.decimals = None
+        elif self.decimals is None:
+            self.decimals = [None] * len(self.columns)
+
+    def close(self):
+        """Release the storage; views handed out earlier stay readable"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.times = self.values = None
+        self._start = self._end = 0
+        self._files = []
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def nbytes(self):
+        """Size of the storage file"""
+        return 0 if self.times is None else self.times.nbytes + self.values.nbytes
+
+    @property
+    def file_paths(self):
+        """Log files with retained rows, oldest first"""
+        return [path for path, _ in self._files]
+
+    @property
+    def last_time(self):
+        """int64 nanoseconds of the newest row, or None if the buffer is empty"""
+        return int(self.times[self._end - 1]) if len(self) else None
+
+    def reset(self):
+        """Drop all rows. New rows are written after the old ones, so earlier views stay valid."""
+        self._start = self._end
+        self._files = []
+
+    def append(self, frame, file_path):
+        """Add the rows of a time-indexed frame read from a log file, newest last"""
+        if frame is None or frame.empty:
+            return
+        if len(frame) > self.capacity:
+            frame = frame.iloc[-self.capacity:]
+        n = len(frame)
+        parsed = [frame[col].to_numpy(dtype=np.float64) if col in frame.columns else None
+                  for col in self.columns]
+        if self.decimals is not None:
+            decimals = [d if column is None else recovering_decimals(column.astype(np.float32), column, d)
+                        for column, d in zip(parsed, self.decimals)]
+            if any(d is None for column, d in zip(parsed, decimals) if column is not None):
+                # Not representable in float32 at its precision; keep everything exact
+                self._allocate(np.float64)
+            else:
+                self.decimals = decimals
+
+        self._drop_oldest(len(self) + n - self.capacity)
+        if self._end + n > len(self.times):
+            self._compact()
+        start, end = self._end, self._end + n
+        self.times[start:end] = to_epoch_ns(frame.index)
+        for i, column in enumerate(parsed):
+            self.values[i, start:end] = np.nan if column is None else column
+        if not self._files or self._files[-1][0] != file_path:
+            self._files.append([file_path, start])
+        self._end = end
+        self.trim_before(self.times[end - 1] - self._retention_ns)
+
+    def append_newer(self, frame, file_path):
+        """Add the rows of a frame that are newer than the newest row already buffered.
+
+        Rows handed over twice, e.g. new rows published while the buffer was
+        being refilled from the whole followed file, are only added once.
+        """
+        if frame is None or frame.empty or not len(self):
+            self.append(frame, file_path)
+            return
+        newer = to_epoch_ns(frame.index) > self.last_time
+        if newer.any():
+            self.append(frame[newer], file_path)
+
+    def trim_before(self, time_ns):
+        """Drop the oldest rows up to the first one at or after time_ns (int64 nanoseconds)"""
+        if not len(self) or self.times[self._start] >= time_ns:
+            return
+        kept = self.times[self._start:self._end] >= time_ns
+        # Rows are dropped in the order they were added, also if overlapping files are not sorted
+        self._drop_oldest(int(kept.argmax()) if kept.any() else len(self))
+
+    def _drop_oldest(self, count):
+        if count <= 0:
+            return
+        self._start = min(self._start + count, self._end)
+        if self._start == self._end:
+            self._files = []
+            return
+        while len(self._files) > 1 and self._files[1][1] <= self._start:
+            self._files.pop(0)
+        self._files[0][1] = max(self._files[0][1], self._start)
+
+    def _compact(self):
+        """Move the retained rows to the start of the storage"""
+        count = len(self)
+        self.times[:count] = self.times[self._start:self._end]
+        self.values[:, :count] = self.values[:, self._start:self._end]
+        self._move_files(-self._start)
+        self._start, self._end = 0, count
+        self.generation += 1
+
+    def _move_files(self, shift):
+        for entry in self._files:
+            entry[1] += shift
+
+    def _view(self, start, end):
+        decimals = None if self.decimals is None else list(self.decimals)
+        return CompactLogData(np.asarray(self.times[start:end]), self.columns,
+                              np.asarray(self.values[:, start:end]), decimals)
+
+    def data(self):
+        """All retained rows as CompactLogData (a view on the buffer)"""
+        return self._view(self._start, self._end)
+
+    def segments(self):
+        """The retained rows of each log file, oldest first, as CompactLogData views"""
+        ends = [position for _, position in self._files[1:]] + [self._end]
+        return [self._view(position, end) for (_, position), end in zip(self._files, ends)]
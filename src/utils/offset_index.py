@@ -0,0 +1,67 @@
+import bisect
+
+
+class TimeOffsetIndex:
+    """Sparse map from timestamps to byte offsets in one log file.
+
+    The index samples one line every `stride` bytes by seeking, so building it
+    reads a few hundred bytes per sample rather than the whole file. A time
+    window then maps to a byte range that holds all of its rows plus at most
+    one stride of extra rows on either side.
+    """
+
+    DEFAULT_STRIDE = 256 * 1024
+
+    def __init__(self, columns, data_start, size, times, offsets):
+        self.columns = columns
+        self.data_start = data_start  # Offset of the first data line
+        self.size = size
+        self.times = times  # Sorted timestamps of the sampled lines
+        self.offsets = offsets  # Byte offsets at which the sampled lines start
+
+    @classmethod
+    def build(cls, file_path, size, parse_header_line, parse_line_time, stride=DEFAULT_STRIDE):
+        """Sample a log file. Returns None if it has no data or is not sorted by time."""
+        times = []
+        offsets = []
+        with open(file_path, 'rb') as f:
+            # Skip the [Jeol_MicroED 2] line and the column header line
+            f.readline()
+            columns = parse_header_line(f.readline().decode())
+            data_start = f.tell()
+
+            for position in range(data_start, size, stride):
+                f.seek(position)
+                if position > data_start:
+                    f.readline()  # Skip to the start of the next line
+                offset = f.tell()
+                line = f.readline()
+                if not line.endswith(b'\n') or offset >= size:
+                    break
+                if not line.strip():
+                    continue
+                time = parse_line_time(line)
+                if times and time < times[-1]:
+                    return None
+                if not offsets or offset > offsets[-1]:
+                    times.append(time)
+                    offsets.append(offset)
+
+        if not times:
+            return None
+        return cls(columns, data_start, size, times, offsets)
+
+    def byte_range(self, start_datetime=None, end_datetime=None):
+        """Get the (start, end) byte offsets of a range of lines covering the time window"""
+        start = self.data_start
+        if start_datetime is not None:
+            # The last sample before the window starts at or before its first row
+            i = bisect.bisect_left(self.times, start_datetime) - 1
+            if i >= 0:
+                start = self.offsets[i]
+        end = self.size
+        if end_datetime is not None:
+            i = bisect.bisect_right(self.times, end_datetime)
+            if i < len(self.offsets):
+                end = self.offsets[i]
+        return start, max(start, end)
@@ -0,0 +1,141 @@
+import logging
+import logging.handlers
+import os
+import threading
+import time
+
+
+class _NullSpan:
+    """Span used while recording is off; entering and leaving it does nothing"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('recorder', 'name', 'start')
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.recorder.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class PerfStat:
+    """Call count and durations of one span"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class PerfRecorder:
+    """Collects the durations of named spans and the values of named counters.
+
+    Usage:
+        with perf.span('get_log_files'):
+            ...
+        perf.add('rows parsed', len(df))
+
+    Recording is off by default; a span is then a shared no-op object, so the
+    instrumentation costs one attribute check per call. When a log file is
+    set, every finished span is also written to it (rotated at max_bytes).
+    """
+
+    LOG_MAX_BYTES = 1024 * 1024
+    LOG_BACKUP_COUNT = 3
+
+    def __init__(self):
+        self.enabled = False
+        self._stats = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger('synergyed.perf')
+        self._logger.propagate = False
+        self._log_handler = None
+
+    def span(self, name):
+        """Context manager that records how long its block took"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name, seconds):
+        """Record a duration measured elsewhere (e.g. from a request to its asynchronous result)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            stat = self._stats.get(name)
+            if stat is None:
+                stat = self._stats[name] = PerfStat()
+            stat.count += 1
+            stat.total += seconds
+            stat.last = seconds
+            stat.max = max(stat.max, seconds)
+        if self._log_handler is not None:
+            self._logger.info(f"{name}\t{seconds * 1000:.2f} ms")
+
+    def add(self, name, amount=1):
+        """Add to a counter, e.g. the number of rows parsed"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def snapshot(self):
+        """Get copies of the span statistics and counters, both sorted by name"""
+        with self._lock:
+            stats = [(name, stat.count, stat.total, stat.mean, stat.max, stat.last)
+                     for name, stat in sorted(self._stats.items())]
+            counters = sorted(self._counters.items())
+        return stats, counters
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self._counters.clear()
+
+    def set_log_file(self, path):
+        """Write finished spans to a rotating log file, or stop logging if path is None"""
+        if self._log_handler is not None:
+            self._logger.removeHandler(self._log_handler)
+            self._log_handler.close()
+            self._log_handler = None
+        if path is None:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(
+                path, maxBytes=self.LOG_MAX_BYTES, backupCount=self.LOG_BACKUP_COUNT, encoding='utf-8'
+            )
+        except OSError as e:
+            print(f"Warning: could not open performance log {path}: {str(e)}")
+            return
+        handler.setFormatter(logging.Formatter('%(asctime)s\t%(threadName)s\t%(message)s'))
+        self._logger.addHandler(handler)
+        self._logger.setLevel(logging.INFO)
+        self._log_handler = handler
+
+
+# Shared by all modules, so one switch turns the instrumentation on everywhere
+perf = PerfRecorder()
@@ -0,0 +1,186 @@
+import io
+import json
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+from .timestamps import to_epoch_ns
+
+
+class RollupStore:
+    """Persistent multi-resolution min/mean/max aggregates of log data.
+
+    Every log file is aggregated into fixed time buckets at several tiers
+    (1 min, 10 min, 1 h, 1 day). The aggregates of each file and tier are
+    kept as one compact blob in a SQLite database next to the log folders, so
+    a file that changes only has its own aggregates replaced and queries over
+    months of history only read a few small blobs per file.
+    """
+
+    STORE_NAME = '.synergyed_log_rollups.sqlite'
+    SCHEMA_VERSION = 1
+    # Bucket widths in seconds, finest first
+    TIERS = (60, 600, 3600, 86400)
+    STATS = ('min', 'sum', 'count', 'max')
+
+    def __init__(self, base_dir, store_path=None):
+        self.base_dir = base_dir
+        self.store_path = store_path or os.path.join(base_dir, self.STORE_NAME)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    def _connect(self):
+        """Open the rollup database, falling back to memory if the directory is read-only"""
+        try:
+            conn = sqlite3.connect(self.store_path, check_same_thread=False)
+            self._create_schema(conn)
+        except sqlite3.Error as e:
+            print(f"Warning: could not open rollup store {self.store_path}: {str(e)}")
+            self.store_path = ':memory:'
+            conn = sqlite3.connect(self.store_path, check_same_thread=False)
+            self._create_schema(conn)
+        return conn
+
+    def _create_schema(self, conn):
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            # Rollups can always be rebuilt from the log files
+            conn.execute("DROP TABLE IF EXISTS rollup_files")
+            conn.execute("DROP TABLE IF EXISTS rollups")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rollup_files (
+                path TEXT PRIMARY KEY,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rollups (
+                path TEXT NOT NULL,
+                tier INTEGER NOT NULL,
+                first_bucket INTEGER NOT NULL,
+                last_bucket INTEGER NOT NULL,
+                columns TEXT NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (path, tier)
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS rollups_range ON rollups (tier, first_bucket, last_bucket)")
+        conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @classmethod
+    def choose_tier(cls, start_datetime, end_datetime, pixels):
+        """Pick the coarsest tier that still gives about one bucket per pixel"""
+        span = (end_datetime - start_datetime).total_seconds()
+        for tier in reversed(cls.TIERS):
+            if span / tier >= pixels:
+                return tier
+        return cls.TIERS[0]
+
+    def is_current(self, file_path, mtime, size):
+        """Check whether the stored aggregates of a file match its current version"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime, size FROM rollup_files WHERE path = ?", (file_path,)
+            ).fetchone()
+        return row is not None and tuple(row) == (mtime, size)
+
+    def add_file(self, file_path, mtime, size, df):
+        """Aggregate a parsed log file at every tier, replacing its previous aggregates"""
+        columns = [col for col in df.columns if np.issubdtype(df[col].dtype, np.number)]
+        seconds = to_epoch_ns(df.index) // 1_000_000_000
+        values = df[columns]
+
+        rows = []
+        if len(df):
+            for tier in self.TIERS:
+                buckets = seconds // tier * tier
+                grouped = values.groupby(buckets)
+                minimum = grouped.min()
+                blob = self._pack(
+                    minimum.index.to_numpy(dtype=np.int64),
+                    [minimum, grouped.sum(min_count=1), grouped.count(), grouped.max()]
+                )
+                rows.append((file_path, tier, int(buckets.min()), int(buckets.max()),
+                             json.dumps(columns), blob))
+
+        with self._lock:
+            self._conn.execute("DELETE FROM rollups WHERE path = ?", (file_path,))
+            self._conn.executemany("INSERT INTO rollups VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._conn.execute("INSERT OR REPLACE INTO rollup_files VALUES (?, ?, ?)", (file_path, mtime, size))
+            self._conn.commit()
+
+    def remove_missing(self, existing_paths):
+        """Drop the aggregates of files that no longer exist"""
+        existing = set(existing_paths)
+        with self._lock:
+            stale = [(row[0],) for row in self._conn.execute("SELECT path FROM rollup_files")
+                     if row[0] not in existing]
+            self._conn.executemany("DELETE FROM rollups WHERE path = ?", stale)
+            self._conn.executemany("DELETE FROM rollup_files WHERE path = ?", stale)
+            self._conn.commit()
+
+    def query(self, params, start_datetime, end_datetime, tier):
+        """Get min/mean/max per bucket of a tier for the given parameters.
+
+        Returns:
+            Dict mapping each parameter to a DataFrame with 'min', 'mean' and 'max'
+            columns, indexed by bucket start time. Buckets without data inside
+            the covered span are NaN so that gaps stay visible when plotted.
+        """
+        import pandas as pd
+        start = int(pd.Timestamp(start_datetime).timestamp()) // tier * tier
+        end = int(pd.Timestamp(end_datetime).timestamp())
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT columns, data FROM rollups WHERE tier = ? AND last_bucket >= ? AND first_bucket <= ?",
+                (tier, start, end)
+            ).fetchall()
+
+        parts = {param: [] for param in params}
+        for columns_json, blob in rows:
+            columns = json.loads(columns_json)
+            buckets, stats = self._unpack(blob)
+            for param in params:
+                if param in columns:
+                    i = columns.index(param)
+                    parts[param].append(pd.DataFrame(
+                        {name: stat[:, i] for name, stat in zip(self.STATS, stats)}, index=buckets
+                    ))
+
+        result = {}
+        for param, frames in parts.items():
+            if not frames:
+                continue
+            combined = pd.concat(frames)
+            # Buckets shared by several files are merged
+            merged = combined.groupby(level=0).agg({'min': 'min', 'sum': 'sum', 'count': 'sum', 'max': 'max'})
+            merged = merged[(merged.index >= start) & (merged.index <= end)]
+            if merged.empty:
+                continue
+            grid = np.arange(merged.index[0], merged.index[-1] + tier, tier)
+            merged = merged.reindex(grid)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = merged['sum'] / merged['count']
+            frame = pd.DataFrame({'min': merged['min'], 'mean': mean, 'max': merged['max']})
+            frame.index = pd.to_datetime(grid, unit='s')
+            frame.index.name = 'time'
+            result[param] = frame
+        return result
+
+    def _pack(self, buckets, stats):
+        buffer = io.BytesIO()
+        np.savez(buffer, buckets=buckets, **{name: stat.to_numpy(dtype=np.float64)
+                                            for name, stat in zip(self.STATS, stats)})
+        return buffer.getvalue()
+
+    def _unpack(self, blob):
+        with np.load(io.BytesIO(blob), allow_pickle=False) as archive:
+            return archive['buckets'], [archive[name] for name in self.STATS]
@@ -0,0 +1,89 @@
+import os
+import time
+import zipfile
+
+import numpy as np
+
+
+class SidecarStore:
+    """Typed columnar copies of parsed log files stored next to the source file.
+
+    A sidecar is an uncompressed .npz archive with one member per column, so
+    loading it skips the text parsing entirely and only touches the columns
+    that are asked for. A sidecar is used only while it is newer than its
+    source file and was written from a source of the same size.
+    """
+
+    SUFFIX = '.npz'
+    FORMAT_VERSION = 1
+    # Files modified more recently than this are probably still being written
+    MIN_SOURCE_AGE_S = 300
+
+    @classmethod
+    def sidecar_path(cls, file_path):
+        return file_path + cls.SUFFIX
+
+    def is_fresh(self, file_path, source_stat=None):
+        """Check whether a file has a sidecar that is newer than the source"""
+        try:
+            source_stat = source_stat or os.stat(file_path)
+            sidecar_stat = os.stat(self.sidecar_path(file_path))
+        except OSError:
+            return False
+        return sidecar_stat.st_mtime >= source_stat.st_mtime
+
+    def read(self, file_path, source_stat=None, columns=None):
+        """Load the sidecar of a log file, or return None if it is missing or stale.
+
+        Only the given columns are loaded if columns is not None.
+        """
+        import pandas as pd
+        try:
+            source_stat = source_stat or os.stat(file_path)
+            if not self.is_fresh(file_path, source_stat):
+                return None
+
+            with np.load(self.sidecar_path(file_path), allow_pickle=False) as archive:
+                version, source_size = archive['meta']
+                if version != self.FORMAT_VERSION or source_size != source_stat.st_size:
+                    return None
+                stored = [str(col) for col in archive['columns']]
+                wanted = set(stored if columns is None else columns)
+                index = pd.DatetimeIndex(archive['time'], name='time')
+                data = {col: archive[f'c{i}'] for i, col in enumerate(stored) if col in wanted}
+
+            return pd.DataFrame(data, index=index, columns=list(data))
+
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            print(f"Error reading sidecar for {file_path}: {str(e)}")
+            return None
+
+    def write(self, file_path, df, source_stat=None):
+        """Write the sidecar for a parsed log file. Returns True if one was written."""
+        try:
+            source_stat = source_stat or os.stat(file_path)
+            if time.time() - source_stat.st_mtime < self.MIN_SOURCE_AGE_S:
+                return False
+            # Only plain numeric columns can be stored without pickling
+            if not all(np.issubdtype(dtype, np.number) for dtype in df.dtypes):
+                return False
+
+            arrays = {
+                'meta': np.array([self.FORMAT_VERSION, source_stat.st_size], dtype=np.int64),
+                'columns': np.array(list(df.columns), dtype=str),
+                'time': df.index.values,
+            }
+            for i, col in enumerate(df.columns):
+                arrays[f'c{i}'] = df[col].to_numpy()
+
+            # Write to a temporary file first so readers never see a half-written sidecar
+            target = self.sidecar_path(file_path)
+            temp_path = target + '.tmp'
+            with open(temp_path, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(temp_path, target)
+            return True
+
+        except OSError as e:
+            print(f"Error writing sidecar for {file_path}: {str(e)}")
+            return False
@@ -0,0 +1,176 @@
+import itertools
+import os
+import threading
+from collections import OrderedDict
+
+from .timestamps import to_epoch_ns
+
+_serials = itertools.count()
+
+
+class _TailState:
+    """Read position and parsed rows of one followed file"""
+
+    def __init__(self, columns, offset):
+        self.columns = columns
+        self.offset = offset  # Byte offset just past the last consumed byte
+        self.partial = b''  # Trailing bytes of an unfinished last line
+        self.chunks = []  # Parsed row blocks, concatenated when the whole frame is asked for
+        self.rows = 0  # Number of rows in the chunks
+        self.empty = None  # Frame without rows, returned when nothing was appended
+        self.serial = next(_serials)  # Tells a re-opened file from the earlier read of it
+
+    def append(self, rows):
+        self.chunks.append(rows)
+        self.rows += len(rows)
+
+    def rows_after(self, count):
+        """The rows after the first `count` ones, concatenating only the blocks that hold them"""
+        import pandas as pd
+        needed = self.rows - count
+        parts = []
+        for chunk in reversed(self.chunks):
+            if needed <= 0:
+                break
+            parts.append(chunk.iloc[-needed:] if len(chunk) > needed else chunk)
+            needed -= len(chunk)
+        if not parts:
+            return self.empty
+        return parts[0] if len(parts) == 1 else pd.concat(parts[::-1])
+
+    def get_frame(self):
+        import pandas as pd
+        if len(self.chunks) > 1:
+            # Keep a single block, so the next request only concatenates the rows added since
+            self.chunks = [pd.concat(self.chunks)]
+        return self.chunks[0] if self.chunks else self.empty
+
+
+class LogTailReader:
+    """Incrementally reads the rows appended to growing log files.
+
+    For every followed file the reader remembers the byte offset it has read
+    up to and any unfinished last line, so each update only parses the bytes
+    written since the previous one. The new rows are kept as separate blocks
+    and only combined when frame() asks for all rows of the file, so an update
+    costs time in proportion to the new rows rather than to the whole file.
+    """
+
+    def __init__(self, processor, max_files=4):
+        self.processor = processor
+        self.max_files = max_files
+        self._states = OrderedDict()  # path -> _TailState, or None until first read
+        self._lock = threading.RLock()
+
+    def follow(self, file_path):
+        """Start following a file; the least recently followed file is dropped when full"""
+        with self._lock:
+            if file_path in self._states:
+                self._states.move_to_end(file_path)
+                return
+            self._states[file_path] = None
+            while len(self._states) > self.max_files:
+                self._states.popitem(last=False)
+
+    def unfollow(self, file_path):
+        with self._lock:
+            self._states.pop(file_path, None)
+
+    def clear(self):
+        """Stop following all files"""
+        with self._lock:
+            self._states.clear()
+
+    def is_following(self, file_path):
+        with self._lock:
+            return file_path in self._states
+
+    def read(self, file_path):
+        """Bring a followed file up to date.
+
+        Returns:
+            The rows added by this call (a frame without rows if there are
+            none), or None if the file could not be read.
+        """
+        with self._lock:
+            try:
+                size = os.path.getsize(file_path)
+                state = self._states.get(file_path)
+                if state is None or size < state.offset:
+                    # First read, or the file was truncated/replaced: start over
+                    state = self._open(file_path)
+                    if state is None:
+                        return None
+                    self._states[file_path] = state
+
+                new_rows = self._read_appended(file_path, state, size)
+                if new_rows is None:
+                    return state.empty
+                state.append(new_rows)
+                return new_rows
+
+            except Exception as e:
+                print(f"Error tailing file {file_path}: {str(e)}")
+                self._states[file_path] = None
+                return None
+
+    def read_after(self, file_path, position=None):
+        """Bring a followed file up to date and get the rows after a position.
+
+        Other readers of the file (e.g. plot loads) also move the reader on,
+        so a consumer that must see every row once keeps its own position:
+        the one returned by its previous call, or None to start with all rows.
+
+        Returns:
+            (rows, position), or (None, position) if the file could not be read.
+        """
+        with self._lock:
+            if self.read(file_path) is None:
+                return None, position
+            state = self._states[file_path]
+            if position is not None and position[0] == state.serial:
+                rows = state.rows_after(position[1])
+            else:
+                rows = state.get_frame()
+                if position is not None and position[2] is not None and not rows.empty:
+                    # The file was read from its start again; skip the rows handed out before
+                    rows = rows[to_epoch_ns(rows.index) > position[2]]
+            last_time = position[2] if position is not None else None
+            if not rows.empty:
+                last_time = int(to_epoch_ns(rows.index[-1:])[0])
+            return rows, (state.serial, state.rows, last_time)
+
+    def frame(self, file_path):
+        """All rows of a followed file read so far, or None if it has not been read"""
+        with self._lock:
+            state = self._states.get(file_path)
+            return state.get_frame() if state is not None else None
+
+    def _open(self, file_path):
+        with open(file_path, 'rb') as f:
+            # Skip the first line with [Jeol_MicroED 2]
+            f.readline()
+            header_line = f.readline()
+            if not header_line.endswith(b'\n'):
+                # The header has not been written completely yet
+                return None
+            state = _TailState(self.processor.parse_header_line(header_line.decode()), f.tell())
+        state.empty = self.processor.parse_rows(b'', state.columns)
+        return state
+
+    def _read_appended(self, file_path, state, size):
+        """Parse the complete lines written since the last read"""
+        if size == state.offset:
+            return None
+
+        with open(file_path, 'rb') as f:
+            f.seek(state.offset)
+            data = f.read(size - state.offset)
+        state.offset += len(data)
+
+        data = state.partial + data
+        end = data.rfind(b'\n') + 1
+        state.partial = data[end:]
+        if end == 0 or not data[:end].strip():
+            return None
+        return self.processor.parse_rows(data[:end], state.columns)
@@ -0,0 +1,139 @@
+import re
+
+import numpy as np
+
+# Digit fields of a timestamp layout, in order: year, month, day, hour, minute, second
+_FIELD_WIDTHS = (4, 2, 2, 2, 2, 2)
+_DATE_SEPARATORS = ('-', '-')
+_TIME_SEPARATORS = ((' ', 'T'), ':', ':')
+_NS_PER_S = 1_000_000_000
+
+
+class TimestampLayout:
+    """Fixed-width timestamp layout, e.g. 2025-07-01 08:23:56.000000
+
+    Timestamps in this layout are parsed by slicing the digit columns of a
+    fixed-width byte array, which is several times faster than letting pandas
+    infer the format of every file.
+    """
+
+    def __init__(self, signature):
+        self.signature = signature
+        self.width = len(signature)
+        # (start, end) positions of the digit runs
+        self.fields = [m.span() for m in re.finditer('d+', signature)]
+        # Byte template of the layout, plus a zero byte for the padding column: each
+        # byte of a valid timestamp is in [low, low + span]
+        template = signature.encode('ascii') + b'\0'
+        self._low = np.array([ord('0') if c == ord('d') else c for c in template], dtype=np.uint8)
+        self._span = np.array([9 if c == ord('d') else 0 for c in template], dtype=np.uint8)
+
+    @staticmethod
+    def signature_of(text):
+        """Layout signature of a timestamp: its text with every digit replaced by 'd'"""
+        return re.sub(r'\d', 'd', text)
+
+    @classmethod
+    def detect(cls, text):
+        """Get the layout of a timestamp, or None if it is not a supported fixed-width layout"""
+        signature = cls.signature_of(text)
+        runs = re.findall('d+', signature)
+        seps = re.findall('[^d]+', signature)
+        if [len(r) for r in runs[:6]] != list(_FIELD_WIDTHS) or len(runs) > 7:
+            return None
+        if seps[:2] != list(_DATE_SEPARATORS) or seps[2] not in _TIME_SEPARATORS[0]:
+            return None
+        if seps[3:5] != list(_TIME_SEPARATORS[1:]):
+            return None
+        # Optional fractional seconds: .f to .fffffffff
+        if len(runs) == 7 and (seps[5:] != ['.'] or len(runs[6]) > 9):
+            return None
+        if len(runs) == 6 and len(seps) != 5:
+            return None
+        return cls(signature)
+
+    def parse(self, values):
+        """Parse an array of timestamp strings to int64 nanoseconds since the epoch.
+
+        Returns None if any value does not follow the layout or is not a valid
+        date and time.
+        """
+        # One byte more than the layout, so longer strings show up as a non-zero last column
+        try:
+            raw = np.asarray(values).astype(f'S{self.width + 1}')
+        except (UnicodeEncodeError, ValueError, TypeError):
+            return None
+        n = len(raw)
+        digits = raw.view(np.uint8).reshape(n, self.width + 1)
+        # Subtracting wraps around for bytes below the template, so one comparison checks both bounds
+        if not ((digits - self._low) <= self._span).all():
+            return None
+
+        def field(index):
+            start, end = self.fields[index]
+            result = np.zeros(n, dtype=np.int64)
+            for col in range(start, end):
+                result = result * 10 + (digits[:, col] - ord('0'))
+            return result
+
+        year, month, day, hour, minute, second = (field(i) for i in range(6))
+        if not (((month >= 1) & (month <= 12) & (day >= 1) & (day <= _days_in_month(year, month))
+                 & (hour < 24) & (minute < 60) & (second < 60)).all()):
+            return None
+
+        ns = (_days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60 + second) * _NS_PER_S
+        if len(self.fields) == 7:
+            start, end = self.fields[6]
+            ns += field(6) * 10 ** (9 - (end - start))
+        return ns
+
+
+def _days_from_civil(year, month, day):
+    """Days since 1970-01-01 of proleptic Gregorian dates (vectorized)"""
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _days_in_month(year, month):
+    leap = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+    days = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[month.clip(0, 12)]
+    return days + (leap & (month == 2))
+
+
+class TimestampParser:
+    """Parses the time column of log files to int64 nanoseconds since the epoch.
+
+    The layout of each file is detected from its first timestamp and cached,
+    so files in a known layout are parsed with the fixed-width fast path.
+    Layouts it does not recognise fall back to pandas' format inference.
+    """
+
+    def __init__(self):
+        self._layouts = {}  # signature -> TimestampLayout, or None for inferred layouts
+
+    def layout_for(self, text):
+        signature = TimestampLayout.signature_of(text)
+        if signature not in self._layouts:
+            self._layouts[signature] = TimestampLayout.detect(text)
+        return self._layouts[signature]
+
+    def parse(self, values):
+        """Parse timestamp strings to an int64 array of nanoseconds since the epoch"""
+        import pandas as pd
+        values = np.asarray(values, dtype=object)
+        if len(values) and isinstance(values[0], str):
+            layout = self.layout_for(values[0])
+            if layout is not None:
+                result = layout.parse(values)
+                if result is not None:
+                    return result
+        return to_epoch_ns(pd.to_datetime(values))
+
+
+def to_epoch_ns(times):
+    """Get the int64 nanoseconds since the epoch of a DatetimeIndex or datetime64 array"""
+    return np.asarray(times, dtype='datetime64[ns]').view(np.int64)
@@ -0,0 +1,152 @@
+import numpy as np
+
+from .email_notifier import TriggerCondition
+from .timestamps import to_epoch_ns
+
+
+class TriggerEvent:
+    """A trigger firing at a particular sample"""
+
+    def __init__(self, trigger, time, value):
+        self.trigger = trigger
+        self.time = time
+        self.value = value
+
+
+class TriggerEvaluator:
+    """Evaluates trigger conditions over every sample that arrived since the last check.
+
+    This implements the same semantics as TriggerCondition.check_condition,
+    but for whole blocks of samples at once and with durations measured in
+    sample time, so an excursion between two checks is not missed. The state
+    of each trigger (trigger_start_time, monitoring_start_time, is_active,
+    last_triggered) is kept on the TriggerCondition objects as before.
+    """
+
+    def __init__(self):
+        self.last_sample_time = None
+
+    def reset(self):
+        """Forget the evaluated samples; the next evaluation starts at the newest sample"""
+        self.last_sample_time = None
+
+    def new_samples(self, df):
+        """Get the rows of a time-indexed frame that have not been evaluated yet"""
+        if df is None or df.empty:
+            return df
+        if self.last_sample_time is None:
+            # Only the current state counts when monitoring starts, not the history
+            return df.iloc[-1:]
+        start = df.index.searchsorted(self.last_sample_time, side='right')
+        return df.iloc[start:]
+
+    def evaluate(self, triggers, df):
+        """Run all triggers over the new samples of a frame.
+
+        Args:
+            triggers: List of TriggerCondition.
+            df: Time-indexed DataFrame that ends with the newest samples. Rows
+                that were evaluated before are skipped.
+
+        Returns:
+            List of TriggerEvent, in trigger order.
+        """
+        import pandas as pd
+        samples = self.new_samples(df)
+        if samples is None or samples.empty:
+            return []
+
+        times = to_epoch_ns(samples.index)
+        self.last_sample_time = samples.index[-1]
+
+        events = []
+        columns = {}  # Parameters shared by several triggers are converted once
+        for trigger in triggers:
+            if trigger.parameter_name not in samples.columns:
+                print(f"Warning: Parameter '{trigger.parameter_name}' not found in current data. "
+                      f"Available parameters: {list(samples.columns)}")
+                continue
+            values = columns.get(trigger.parameter_name)
+            if values is None:
+                values = columns[trigger.parameter_name] = samples[trigger.parameter_name].to_numpy(dtype=np.float64)
+            for i in self._evaluate_trigger(trigger, times, self._condition_mask(trigger, values)):
+                events.append(TriggerEvent(trigger, pd.Timestamp(times[i]).to_pydatetime(), values[i]))
+        return events
+
+    @staticmethod
+    def _condition_mask(trigger, values):
+        with np.errstate(invalid='ignore'):
+            if trigger.condition_type == 'greater_than':
+                return values > trigger.threshold_value
+            if trigger.condition_type == 'less_than':
+                return values < trigger.threshold_value
+            if trigger.condition_type == 'equals':
+                return np.abs(values - trigger.threshold_value) < 0.001  # Small tolerance for floats
+        return np.zeros(len(values), dtype=bool)
+
+    def _evaluate_trigger(self, trigger, times, mask):
+        """Update the trigger's state for a block of samples and return the indices where it fires"""
+        import pandas as pd
+        duration = int(trigger.duration_minutes * 60 * 1e9)
+
+        if trigger.monitoring_type in (TriggerCondition.TIME_BOUNDED, TriggerCondition.DELAYED_ACTIVATION):
+            if trigger.monitoring_start_time is None:
+                trigger.monitoring_start_time = pd.Timestamp(times[0]).to_pydatetime()
+            elapsed = times - pd.Timestamp(trigger.monitoring_start_time).value
+            if trigger.monitoring_type == TriggerCondition.TIME_BOUNDED:
+                considered = np.flatnonzero(elapsed <= duration)  # Monitor for the next X minutes
+            else:
+                considered = np.flatnonzero(elapsed >= duration)  # Wait X minutes, then monitor
+            if len(considered) == 0:
+                return []
+
+            fired = considered[self._rising_edges(mask[considered], trigger.is_active)]
+            trigger.is_active = bool(mask[considered[-1]])
+
+        elif duration > 0:  # CONTINUOUS_DURATION
+            fired = self._sustained(trigger, times, mask, duration)
+
+        else:  # Immediate trigger
+            fired = self._rising_edges(mask, trigger.is_active)
+            trigger.is_active = bool(mask[-1])
+
+        if len(fired):
+            trigger.last_triggered = pd.Timestamp(times[fired[-1]]).to_pydatetime()
+        return fired
+
+    @staticmethod
+    def _rising_edges(mask, was_active):
+        """Indices where the condition becomes true, skipping a run that was already active"""
+        edges = mask & ~np.concatenate(([was_active], mask[:-1]))
+        return np.flatnonzero(edges)
+
+    @staticmethod
+    def _sustained(trigger, times, mask, duration):
+        """Fire once per run of true samples, as soon as the run has lasted the duration"""
+        import pandas as pd
+        n = len(mask)
+        starts = mask & ~np.concatenate(([False], mask[:-1]))
+        run_first = np.maximum.accumulate(np.where(starts, np.arange(n), 0))
+        run_start = times[run_first]
+
+        # A run that was already going at the previous check keeps its start time
+        carried = mask[0] and trigger.trigger_start_time is not None
+        if carried:
+            in_first_run = run_first == 0
+            run_start = np.where(in_first_run, pd.Timestamp(trigger.trigger_start_time).value, run_start)
+
+        eligible = np.flatnonzero(mask & (times - run_start >= duration))
+        _, first = np.unique(run_first[eligible], return_index=True)
+        fired = eligible[first]
+        if carried and trigger.is_active:
+            fired = fired[run_first[fired] != 0]
+
+        if mask[-1]:
+            last_run = run_first[-1]
+            trigger.trigger_start_time = pd.Timestamp(run_start[-1]).to_pydatetime()
+            trigger.is_active = bool(np.any(run_first[fired] == last_run)) or (
+                carried and trigger.is_active and last_run == 0)
+        else:
+            trigger.trigger_start_time = None
+            trigger.is_active = False
+        return fired
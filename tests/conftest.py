@@ -0,0 +1,36 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from utils.data_processor import LogDataProcessor  # noqa: E402
+
+HEADER = "[Jeol_MicroED 2]\ntime\tHT [kV]\tGun PiG2\t\n"
+
+
+def format_rows(start, values, interval=timedelta(seconds=1)):
+    """Log lines for (HT, Gun) value pairs, one per interval from start"""
+    return ''.join(f"{start + i * interval:%Y-%m-%d %H:%M:%S.%f}\t {ht:.3f}\t {gun:.3f}\t\n"
+                   for i, (ht, gun) in enumerate(values))
+
+
+@pytest.fixture
+def processor(tmp_path):
+    processor = LogDataProcessor(load_workers=1)
+    processor.base_dir = str(tmp_path)
+    return processor
+
+
+@pytest.fixture
+def make_log(tmp_path):
+    """Write a log file with a row per second from 2025-03-01 08:00 and return its path"""
+    def make_log(values, name='2025-03-01_08-00-00_EDAutoLog', start=datetime(2025, 3, 1, 8)):
+        folder = tmp_path / name
+        folder.mkdir()
+        path = folder / 'EDAutoLog.dat'
+        path.write_text(HEADER + format_rows(start, values))
+        return str(path)
+    return make_log
@@ -0,0 +1,36 @@
+import os
+from datetime import datetime
+
+from conftest import HEADER, format_rows
+
+START = datetime(2025, 3, 1, 8)
+
+
+def age(*paths):
+    # Directories modified within the last seconds are never skipped
+    for path in paths:
+        os.utime(path, (1e9, 1e9))
+
+
+def test_undated_file_is_listed_once_it_has_rows(processor, tmp_path):
+    folder = tmp_path / 'manual run'
+    folder.mkdir()
+    path = folder / 'sample_Jeol_MicroED.dat'
+    path.write_text(HEADER)
+    age(folder, tmp_path)
+    assert processor.get_log_files() == []
+
+    with open(path, 'a') as f:
+        f.write(format_rows(START, [(1, 10)]))
+    age(folder, tmp_path)
+
+    assert [(entry['path'], entry['date']) for entry in processor.get_log_files()] == [(str(path), START)]
+
+
+def test_unchanged_tree_is_not_probed_again(processor, tmp_path, make_log, monkeypatch):
+    make_log([(1, 10)])
+    age(*[root for root, _, _ in os.walk(tmp_path)])
+    first = processor.get_log_files()
+
+    monkeypatch.setattr(processor, '_probe_time_bounds', None)
+    assert processor.get_log_files() == first
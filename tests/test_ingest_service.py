@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import format_rows
+from utils.ingest_service import LogIngestService
+
+START = datetime(2025, 3, 1, 8)
+
+
+def append(path, first_second, values):
+    with open(path, 'a') as f:
+        f.write(format_rows(START + timedelta(seconds=first_second), values))
+
+
+def published(updates):
+    return [(update.file_path, update.new_rows['HT [kV]'].tolist()) for update in updates]
+
+
+@pytest.fixture
+def service(processor):
+    return LogIngestService(processor)
+
+
+def test_rows_read_by_a_plot_between_two_polls_are_published(service, processor, make_log):
+    path = make_log([(1, 10)])
+    service.poll()
+    append(path, 1, [(2, 20), (3, 30), (4, 40)])
+
+    # A plot load reads the followed file through the same tail reader
+    assert processor.read_log_file(path)['HT [kV]'].tolist() == [1, 2, 3, 4]
+
+    assert published(service.poll()) == [(path, [2, 3, 4])]
+    assert published(service.poll()) == [(path, [])]
+
+
+def test_previous_file_is_read_to_its_end_when_a_new_one_starts(service, make_log):
+    first = make_log([(1, 10)])
+    service.poll()
+    append(first, 1, [(2, 20), (3, 30)])
+    second = make_log([(4, 40)], name='2025-03-01_09-00-00_EDAutoLog', start=START + timedelta(hours=1))
+
+    assert published(service.poll()) == [(first, [2, 3]), (second, [4])]
+    assert published(service.poll()) == [(second, [])]
+
+
+@pytest.mark.parametrize('max_files', [1, 4])
+def test_rollover_does_not_publish_the_previous_file_again(service, processor, make_log, max_files):
+    processor.tail_reader.max_files = max_files
+    first = make_log([(i, i) for i in range(1000)])
+    service.poll()
+    append(first, 1000, [(1000, 0), (1001, 0), (1002, 0)])
+    second = make_log([(5, 5)], name='2025-03-01_09-00-00_EDAutoLog', start=START + timedelta(hours=1))
+
+    assert published(service.poll()) == [(first, [1000, 1001, 1002]), (second, [5])]
+
+
+def test_previous_file_is_drained_after_its_tail_state_was_dropped(service, processor, make_log):
+    first = make_log([(1, 10)])
+    service.poll()
+    append(first, 1, [(2, 20)])
+    processor.unfollow_all()
+    second = make_log([(3, 30)], name='2025-03-01_09-00-00_EDAutoLog', start=START + timedelta(hours=1))
+
+    assert published(service.poll()) == [(first, [2]), (second, [3])]
+
+
+def test_read_since_covers_older_files(service, make_log):
+    make_log([(i, i) for i in range(10)])
+    second = make_log([(20, 20), (21, 21)], name='2025-03-01_09-00-00_EDAutoLog', start=START + timedelta(hours=1))
+
+    frames = service.read_since(START + timedelta(seconds=7))
+
+    assert [df['HT [kV]'].tolist() for df in frames] == [[7, 8, 9, 20, 21]]
+    append(second, 3602, [(22, 22)])
+    assert published(service.poll()) == [(second, [22])]
+
+
+def test_read_since_merges_overlapping_files_in_time_order(service, make_log):
+    make_log([(0, 0), (2, 2), (4, 4)])
+    make_log([(1, 1), (3, 3)], name='2025-03-01_08-00-01_EDAutoLog', start=START + timedelta(milliseconds=500))
+
+    frames = service.read_since(START - timedelta(seconds=1))
+
+    assert [df['HT [kV]'].tolist() for df in frames] == [[0, 1, 2, 3, 4]]
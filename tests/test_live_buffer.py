@@ -0,0 +1,106 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.live_buffer import LiveRingBuffer
+
+COLUMNS = ['HT [kV]', 'Gun PiG2']
+
+
+def make_frame(start, n, first_value=0):
+    index = pd.date_range('2025-03-01 08:00', periods=start + n, freq='s', name='time')[start:]
+    values = np.arange(first_value, first_value + n) / 8  # Exact in float32
+    return pd.DataFrame({'HT [kV]': values, 'Gun PiG2': -values}, index=index)
+
+
+@pytest.fixture
+def make_buffer(tmp_path):
+    buffers = []
+
+    def make_buffer(capacity=10, retention=timedelta(days=1)):
+        buffers.append(LiveRingBuffer(COLUMNS, capacity, retention, directory=str(tmp_path)))
+        return buffers[-1]
+    yield make_buffer
+    for buffer in buffers:
+        buffer.close()
+
+
+def test_keeps_the_newest_rows_across_wraparound(make_buffer):
+    buffer = make_buffer(capacity=10)
+    for start in range(0, 57, 3):
+        buffer.append(make_frame(start, 3, start), 'a.dat')
+
+    data = buffer.data()
+    assert len(buffer) == 10
+    assert buffer.generation > 0  # The rows were moved back to the start of the storage
+    assert data['HT [kV]'].tolist() == (np.arange(47, 57) / 8).tolist()
+    assert list(data.index) == list(make_frame(47, 10).index)
+
+
+def test_frame_larger_than_capacity_keeps_its_newest_rows(make_buffer):
+    buffer = make_buffer(capacity=10)
+    buffer.append(make_frame(0, 25), 'a.dat')
+    assert buffer.data()['HT [kV]'].tolist() == (np.arange(15, 25) / 8).tolist()
+
+
+def test_retention_drops_old_rows(make_buffer):
+    buffer = make_buffer(capacity=100, retention=timedelta(seconds=5))
+    buffer.append(make_frame(0, 20), 'a.dat')
+    assert buffer.data().index[0] == make_frame(14, 1).index[0]
+
+
+def test_segments_follow_files_as_rows_drop_out(make_buffer):
+    buffer = make_buffer(capacity=10)
+    buffer.append(make_frame(0, 6), 'a.dat')
+    buffer.append(make_frame(6, 6), 'b.dat')
+    assert buffer.file_paths == ['a.dat', 'b.dat']
+    assert [len(segment.times) for segment in buffer.segments()] == [4, 6]
+
+    buffer.append(make_frame(12, 5), 'c.dat')
+    assert buffer.file_paths == ['b.dat', 'c.dat']
+    assert [len(segment.times) for segment in buffer.segments()] == [5, 5]
+
+
+def test_append_newer_skips_rows_already_buffered(make_buffer):
+    buffer = make_buffer(capacity=100)
+    buffer.append(make_frame(0, 5), 'a.dat')
+    buffer.append_newer(make_frame(0, 8), 'a.dat')
+    buffer.append_newer(make_frame(3, 5), 'a.dat')
+    assert buffer.data()['HT [kV]'].tolist() == (np.arange(8) / 8).tolist()
+
+
+def test_reset_keeps_earlier_views(make_buffer):
+    buffer = make_buffer(capacity=10)
+    buffer.append(make_frame(0, 4), 'a.dat')
+    view = buffer.data()
+    buffer.reset()
+    buffer.append(make_frame(4, 4, 100), 'a.dat')
+    assert view['HT [kV]'].tolist() == (np.arange(4) / 8).tolist()
+    assert len(buffer) == 4
+
+
+def test_values_are_recovered_from_float32(make_buffer):
+    buffer = make_buffer()
+    frame = make_frame(0, 3)
+    frame['HT [kV]'] = [0.1, 0.123, 199.999]
+    buffer.append(frame, 'a.dat')
+    data = buffer.data()
+    assert data.values.dtype == np.float32
+    assert data.exact_values('HT [kV]').tolist() == [0.1, 0.123, 199.999]
+
+
+def test_widening_rounds_the_stored_rows(make_buffer):
+    buffer = make_buffer()
+    frame = make_frame(0, 2)
+    frame['HT [kV]'] = [0.1, 0.123]
+    buffer.append(frame, 'a.dat')
+
+    precise = make_frame(2, 1)
+    precise['HT [kV]'] = [0.1234567891]
+    buffer.append(precise, 'a.dat')
+
+    data = buffer.data()
+    assert data.values.dtype == np.float64
+    assert data['HT [kV]'].tolist() == [0.1, 0.123, 0.1234567891]
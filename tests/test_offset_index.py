@@ -0,0 +1,78 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import HEADER, format_rows
+from utils.offset_index import TimeOffsetIndex
+
+START = datetime(2025, 3, 1, 8)
+ROWS = 2000
+STRIDE = 1000
+
+
+@pytest.fixture
+def log_path(make_log):
+    return make_log([(i / 8, -i / 8) for i in range(ROWS)])
+
+
+def build(processor, path):
+    return TimeOffsetIndex.build(path, os.path.getsize(path), processor.parse_header_line,
+                                 processor._parse_line_time, STRIDE)
+
+
+def parse_range(processor, index, path, start, end):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return processor.parse_rows(data, index.columns)
+
+
+@pytest.mark.parametrize('window', [
+    (100, 200), (0, 10), (1990, 1999), (-50, 5), (1995, 2100), (700, 700), (None, 30), (1900, None),
+])
+def test_byte_range_covers_the_window(processor, log_path, window):
+    index = build(processor, log_path)
+    assert len(index.offsets) > 10
+    start = None if window[0] is None else START + timedelta(seconds=window[0])
+    end = None if window[1] is None else START + timedelta(seconds=window[1])
+
+    byte_start, byte_end = index.byte_range(start, end)
+    df = parse_range(processor, index, log_path, byte_start, byte_end)
+
+    expected = processor.slice_time_window(processor.read_log_file(log_path), start, end)
+    assert processor.slice_time_window(df, start, end).index.equals(expected.index)
+    # At most about one stride of extra rows is read on either side
+    row_bytes = len(format_rows(START, [(0, 0)]))
+    assert len(df) <= len(expected) + 2 * (STRIDE // row_bytes + 1)
+
+
+def test_window_outside_the_file_is_empty(processor, log_path):
+    index = build(processor, log_path)
+    start, end = index.byte_range(START - timedelta(hours=2), START - timedelta(hours=1))
+    assert parse_range(processor, index, log_path, start, end).empty
+
+
+def test_unsorted_file_has_no_index(processor, tmp_path):
+    path = tmp_path / 'EDAutoLog.dat'
+    rows = [(i, i) for i in range(500)]
+    path.write_text(HEADER + format_rows(START + timedelta(hours=1), rows) + format_rows(START, rows))
+    assert build(processor, str(path)) is None
+
+
+def test_read_log_window_matches_a_full_read(processor, log_path, monkeypatch):
+    monkeypatch.setattr(processor, 'WINDOW_READ_MIN_BYTES', 0)
+    # Sample the small test file as densely as a large log is with the default stride
+    build_file = TimeOffsetIndex.build.__func__
+    monkeypatch.setattr(TimeOffsetIndex, 'build',
+                        classmethod(lambda cls, *args: build_file(cls, *args, stride=STRIDE)))
+    start, end = START + timedelta(seconds=500), START + timedelta(seconds=520)
+
+    window = processor.read_log_window(log_path, start, end)
+
+    assert len(processor.get_offset_index(log_path).offsets) > 10
+    stat = os.stat(log_path)
+    assert not processor.frame_cache.contains(log_path, stat.st_mtime, stat.st_size)
+    full = processor.slice_time_window(processor.read_log_file(log_path), start, end)
+    assert window.index.equals(full.index)
+    assert window['HT [kV]'].tolist() == full['HT [kV]'].tolist()
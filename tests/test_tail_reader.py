@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+
+from conftest import HEADER, format_rows
+
+START = datetime(2025, 3, 1, 8)
+
+
+def test_reads_only_appended_rows(processor, make_log):
+    path = make_log([(1, 10), (2, 20)])
+    reader = processor.tail_reader
+    reader.follow(path)
+
+    assert reader.read(path)['HT [kV]'].tolist() == [1, 2]
+    assert reader.read(path).empty
+    with open(path, 'a') as f:
+        f.write(format_rows(START + timedelta(seconds=2), [(3, 30)]))
+    assert reader.read(path)['HT [kV]'].tolist() == [3]
+    assert reader.frame(path)['HT [kV]'].tolist() == [1, 2, 3]
+
+
+def test_partial_line_is_kept_until_complete(processor, make_log):
+    path = make_log([(1, 10)])
+    reader = processor.tail_reader
+    reader.follow(path)
+    reader.read(path)
+
+    line = format_rows(START + timedelta(seconds=1), [(2.5, 20)])
+    with open(path, 'a') as f:
+        f.write(line[:15])
+    assert reader.read(path).empty
+    with open(path, 'a') as f:
+        f.write(line[15:-5])
+    assert reader.read(path).empty
+    with open(path, 'a') as f:
+        f.write(line[-5:] + format_rows(START + timedelta(seconds=2), [(3, 30)]))
+
+    new_rows = reader.read(path)
+    assert new_rows['HT [kV]'].tolist() == [2.5, 3]
+    assert new_rows.index[0] == START + timedelta(seconds=1)
+    assert reader.frame(path)['Gun PiG2'].tolist() == [10, 20, 30]
+
+
+def test_incomplete_header_is_read_again(processor, tmp_path):
+    path = tmp_path / 'EDAutoLog.dat'
+    path.write_text(HEADER[:25])
+    reader = processor.tail_reader
+    reader.follow(str(path))
+    assert reader.read(str(path)) is None
+
+    with open(path, 'a') as f:
+        f.write(HEADER[25:] + format_rows(START, [(1, 10)]))
+    assert reader.read(str(path))['HT [kV]'].tolist() == [1]
+
+
+def test_replaced_file_is_read_from_the_start(processor, make_log):
+    path = make_log([(1, 10), (2, 20), (3, 30)])
+    reader = processor.tail_reader
+    reader.follow(path)
+    reader.read(path)
+
+    with open(path, 'w') as f:
+        f.write(HEADER + format_rows(START, [(7, 70)]))
+    assert reader.read(path)['HT [kV]'].tolist() == [7]
+    assert reader.frame(path)['HT [kV]'].tolist() == [7]
+
+
+def test_read_log_file_of_followed_file_includes_new_rows(processor, make_log):
+    path = make_log([(1, 10)])
+    processor.follow_file(path)
+    assert len(processor.read_log_file(path)) == 1
+
+    with open(path, 'a') as f:
+        f.write(format_rows(START + timedelta(seconds=1), [(2, 20)]))
+    assert processor.read_log_file(path, columns=['HT [kV]']).columns.tolist() == ['HT [kV]']
+    assert processor.read_log_file(path)['HT [kV]'].tolist() == [1, 2]
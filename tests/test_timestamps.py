@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.timestamps import TimestampLayout, TimestampParser, to_epoch_ns
+
+
+@pytest.mark.parametrize('text', [
+    '2025-07-01 08:23:56.000000',
+    '2025-07-01T08:23:56.123',
+    '2025-07-01 08:23:56',
+    '2025-07-01 08:23:56.123456789',
+])
+def test_fast_path_matches_pandas(text):
+    layout = TimestampLayout.detect(text)
+    assert layout is not None
+    assert layout.parse([text]).tolist() == to_epoch_ns(pd.to_datetime([text])).tolist()
+
+
+@pytest.mark.parametrize('text', [
+    '01/07/2025 08:23:56',
+    '2025-7-1 08:23:56',
+    '2025-07-01 08:23',
+    '2025-07-01 08:23:56,000',
+    '2025-07-01 08:23:56.1234567890',
+])
+def test_other_layouts_are_not_detected(text):
+    assert TimestampLayout.detect(text) is None
+
+
+@pytest.mark.parametrize('bad', [
+    '2025-02-29 00:00:00.000000',  # Not a leap year
+    '2025-13-01 00:00:00.000000',
+    '2025-07-01 24:00:00.000000',
+    '2025-07-01 08:23:5x.000000',
+    '2025-07-01 08:23:56.0000000',  # Longer than the layout
+])
+def test_invalid_values_leave_the_fast_path(bad):
+    layout = TimestampLayout.detect('2025-07-01 08:23:56.000000')
+    assert layout.parse(['2025-07-01 08:23:56.000000', bad]) is None
+
+
+def test_leap_days_and_centuries():
+    texts = ['2024-02-29 23:59:59.999999', '2000-02-29 00:00:00.000001', '1999-12-31 12:00:00.500000',
+             '2100-03-01 00:00:00.000000']
+    layout = TimestampLayout.detect(texts[0])
+    assert layout.parse(texts).tolist() == to_epoch_ns(pd.to_datetime(texts)).tolist()
+
+
+def test_parser_falls_back_to_pandas():
+    parser = TimestampParser()
+    texts = np.array(['2025-07-01 08:23:56.5', '2025-07-01 08:23:57.25'], dtype=object)
+    assert parser.parse(texts).tolist() == to_epoch_ns(pd.to_datetime(texts)).tolist()
+
+    # An invalid date in a known layout falls back as well, and pandas reports it
+    with pytest.raises(ValueError):
+        parser.parse(np.array(['2025-07-01 08:23:56.000000', '2025-02-30 08:23:57.000000'], dtype=object))
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.email_notifier import TriggerCondition
+from utils.trigger_engine import TriggerEvaluator
+
+MONITORING_TYPES = [TriggerCondition.CONTINUOUS_DURATION, TriggerCondition.TIME_BOUNDED,
+                    TriggerCondition.DELAYED_ACTIVATION]
+
+
+def make_samples(seed, n=400):
+    """A random walk sampled every 10 s, with some NaN values"""
+    rng = np.random.default_rng(seed)
+    values = np.round(np.cumsum(rng.normal(size=n)), 3)
+    values[rng.random(n) < 0.05] = np.nan
+    index = pd.date_range('2025-03-01 08:00', periods=n, freq='10s', name='time')
+    return pd.DataFrame({'HT [kV]': values}, index=index)
+
+
+def reference_fires(trigger, df):
+    """Fire times of the old per-sample check, called once for every sample"""
+    fired = []
+    for time, value in zip(df.index, df['HT [kV]']):
+        if trigger.check_condition(value, time.to_pydatetime()):
+            fired.append(time.to_pydatetime())
+    return fired
+
+
+def evaluated_fires(trigger, df, cuts):
+    """Fire times of the evaluator, given the frame growing to each cut in turn"""
+    evaluator = TriggerEvaluator()
+    # Evaluate from the first sample on, like the reference
+    evaluator.last_sample_time = df.index[0] - pd.Timedelta(seconds=1)
+    fired = []
+    for cut in cuts:
+        fired += [event.time for event in evaluator.evaluate([trigger], df.iloc[:cut])]
+    return fired
+
+
+def state(trigger):
+    return trigger.is_active, trigger.trigger_start_time, trigger.monitoring_start_time, trigger.last_triggered
+
+
+@pytest.mark.parametrize('monitoring_type', MONITORING_TYPES)
+@pytest.mark.parametrize('condition_type', ['greater_than', 'less_than', 'equals'])
+@pytest.mark.parametrize('duration_minutes', [0, 0.5, 3, 20])
+@pytest.mark.parametrize('chunking', ['whole', 'random', 'single'])
+def test_matches_per_sample_check(monitoring_type, condition_type, duration_minutes, chunking):
+    for seed in range(3):
+        # Re-evaluating the growing frame per sample is quadratic, so that case gets fewer samples
+        df = make_samples(seed, 150 if chunking == 'single' else 400)
+        values = df['HT [kV]']
+        threshold = float(values.iloc[5]) if condition_type == 'equals' else float(values.median())
+        args = ('HT [kV]', condition_type, threshold, duration_minutes, monitoring_type)
+        reference, trigger = TriggerCondition(*args), TriggerCondition(*args)
+
+        if chunking == 'whole':
+            cuts = [len(df)]
+        elif chunking == 'single':
+            cuts = range(1, len(df) + 1)
+        else:
+            rng = np.random.default_rng(seed)
+            cuts = sorted(rng.choice(np.arange(1, len(df)), 12, replace=False)) + [len(df)]
+
+        assert evaluated_fires(trigger, df, cuts) == reference_fires(reference, df)
+        assert state(trigger) == state(reference)
+
+
+def test_nan_breaks_a_sustained_run():
+    index = pd.date_range('2025-03-01 08:00', periods=8, freq='30s', name='time')
+    df = pd.DataFrame({'HT [kV]': [5, 5, 5, np.nan, 5, 5, 5, 5]}, index=index, dtype=float)
+    trigger = TriggerCondition('HT [kV]', 'greater_than', 1, 1)
+    evaluator = TriggerEvaluator()
+    evaluator.last_sample_time = index[0] - pd.Timedelta(seconds=1)
+
+    events = evaluator.evaluate([trigger], df)
+
+    # The run restarts after the NaN and lasts a minute again at its third sample
+    assert [event.time for event in events] == [index[2].to_pydatetime(), index[6].to_pydatetime()]
+
+
+def test_first_evaluation_only_checks_the_newest_sample():
+    index = pd.date_range('2025-03-01 08:00', periods=3, freq='10s', name='time')
+    df = pd.DataFrame({'HT [kV]': [5.0, 0.0, 0.0]}, index=index)
+    trigger = TriggerCondition('HT [kV]', 'greater_than', 1)
+
+    assert TriggerEvaluator().evaluate([trigger], df) == []
+